@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .classification import rmr_scores
+from .cost import tunnel_costs
+from .groundwater import inflows_per_length
+from .lining import lining_thicknesses
+from .settlement import settlement_troughs
+from .support import natm_support_takeoff
+from .tbm import tbm_recommendations
+
+_RMR_COLUMNS = (
+    "rqd",
+    "spacing_rating",
+    "condition_rating",
+    "groundwater_rating",
+    "orientation_rating",
+    "strength_rating",
+)
+
+@dataclass(frozen=True, eq=False)
+class Alignment:
+    """
+    Columnar description of an alignment split into segments. Every column holds one
+    value per segment; optional column groups enable the matching screens.
+    """
+    chainage_m: NDArray[np.float64]           # segment start
+    length_m: NDArray[np.float64]
+    cover_to_axis_m: NDArray[np.float64]
+    diameter_m: NDArray[np.float64]
+    # RMR ratings (all six or none)
+    rqd: NDArray[np.float64] | None = None
+    spacing_rating: NDArray[np.float64] | None = None
+    condition_rating: NDArray[np.float64] | None = None
+    groundwater_rating: NDArray[np.float64] | None = None
+    orientation_rating: NDArray[np.float64] | None = None
+    strength_rating: NDArray[np.float64] | None = None
+    # groundwater inflow
+    k_m_per_s: NDArray[np.float64] | None = None
+    head_above_axis_m: NDArray[np.float64] | None = None
+    influence_radius_m: NDArray[np.float64] | None = None
+    drainage_factor: NDArray[np.float64] | None = None
+    # settlement
+    volume_loss_frac: NDArray[np.float64] | None = None
+    K: NDArray[np.float64] | None = None
+    # lining
+    ground_pressure_kPa: NDArray[np.float64] | None = None
+    # TBM selection
+    ground: NDArray[np.str_] | None = None
+    groundwater: NDArray[np.str_] | None = None
+    boulders: NDArray[np.bool_] | None = None
+
+    def __post_init__(self) -> None:
+        if np.ndim(self.chainage_m) != 1:
+            raise ValueError("chainage_m must be a 1-D array")
+        n = len(self.chainage_m)
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is None:
+                continue
+            dtype: Any = np.float64
+            if f.name in ("ground", "groundwater"):
+                dtype = str
+            elif f.name == "boulders":
+                dtype = bool
+            arr = np.asarray(value, dtype=dtype)
+            if arr.shape != (n,):
+                raise ValueError(f"Column '{f.name}' has shape {arr.shape}, expected ({n},)")
+            object.__setattr__(self, f.name, arr)
+        present = [c for c in _RMR_COLUMNS if getattr(self, c) is not None]
+        if present and len(present) != len(_RMR_COLUMNS):
+            raise ValueError(f"RMR screening needs all of: {', '.join(_RMR_COLUMNS)}")
+
+    def __len__(self) -> int:
+        return int(self.chainage_m.shape[0])
+
+    @property
+    def radius_m(self) -> NDArray[np.float64]:
+        return self.diameter_m / 2.0
+
+    @classmethod
+    def from_frame(cls, frame: Mapping[str, ArrayLike]) -> Alignment:
+        """Build from a DataFrame or dict of columns named like the fields; others are ignored."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: np.asarray(frame[k]) for k in frame.keys() if k in names})  # type: ignore[arg-type]
+
+def screen_alignment(
+    al: Alignment,
+    phi_resistance: float = 0.7,
+    fc_allow_kPa: float = 15_000.0,
+    t_min_m: float = 0.2,
+    complexity: float = 1.0,
+    round_length_m: float = 1.0,
+) -> dict[str, NDArray[Any]]:
+    """
+    Run every applicable screen over all segments in one vectorized pass.
+
+    Returns a columnar table (dict of equal-length arrays, ready for pandas.DataFrame).
+    Screens whose input columns are missing are skipped. Segment cost excludes shafts.
+    """
+    out: dict[str, NDArray[Any]] = {"chainage_m": al.chainage_m, "length_m": al.length_m}
+    if al.rqd is not None:
+        rmr = rmr_scores(*(getattr(al, c) for c in _RMR_COLUMNS))
+        out["rmr"] = rmr.rmr
+        out["rmr_class_code"] = rmr.class_code
+        sup = natm_support_takeoff(rmr.rmr, al.diameter_m, al.length_m, round_length_m)
+        out["support_class"] = sup.support_class
+        out["shotcrete_m3"] = sup.shotcrete_m3
+        out["bolt_count"] = sup.bolt_count
+        out["bolt_m"] = sup.bolt_m
+        out["girder_count"] = sup.girder_count
+    if (
+        al.k_m_per_s is not None
+        and al.head_above_axis_m is not None
+        and al.influence_radius_m is not None
+    ):
+        df = al.drainage_factor if al.drainage_factor is not None else 1.0
+        q = inflows_per_length(
+            al.k_m_per_s, al.head_above_axis_m, al.radius_m, al.influence_radius_m, df
+        )
+        out["q_per_m3_s"] = q.q_per_m3_s
+        out["inflow_m3_s"] = q.q_per_m3_s * al.length_m
+        out["inflow_valid"] = q.valid
+    if al.volume_loss_frac is not None:
+        tr = settlement_troughs(
+            al.volume_loss_frac, al.radius_m, al.cover_to_axis_m, al.K if al.K is not None else 0.5
+        )
+        out["Smax_m"] = tr.Smax_m
+        out["i_m"] = tr.i_m
+    if al.ground_pressure_kPa is not None:
+        lin = lining_thicknesses(
+            al.ground_pressure_kPa, al.radius_m, phi_resistance, fc_allow_kPa, t_min_m
+        )
+        out["t_req_m"] = lin.t_req_m
+        out["lining_valid"] = lin.valid
+    if al.ground is not None and al.groundwater is not None:
+        out["tbm_recommended"] = tbm_recommendations(
+            al.ground, al.groundwater, al.boulders if al.boulders is not None else False
+        )
+    out["tunnel_usd"] = tunnel_costs(al.length_m, al.diameter_m, complexity, 0, 0.0).tunnel_usd
+    return out
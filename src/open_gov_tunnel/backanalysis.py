@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+@dataclass(frozen=True, eq=False)
+class TroughFit:
+    volume_loss_frac: NDArray[np.float64]   # per section
+    K: NDArray[np.float64]
+    rmse_m: NDArray[np.float64]             # NaN for sections without readings
+    n_readings: NDArray[np.int64]
+    iterations: NDArray[np.int64]
+    converged: NDArray[np.bool_]            # False with under two readings or a stalled damping
+
+def _trough(
+    vl: NDArray[np.float64],
+    K: NDArray[np.float64],
+    r: NDArray[np.float64],
+    z: NDArray[np.float64],
+    x: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    # settlement_at_x(settlement_trough(...)) and its analytic derivatives w.r.t. volume loss and K
+    kz = K * z
+    i = np.where(kz > 0.1, kz, 0.1)
+    shape = np.exp(-(x ** 2) / (2.0 * i ** 2))
+    dS_dvl = math.pi * r ** 2 / (_SQRT_2PI * i) * shape
+    S = vl * dS_dvl
+    dS_dK = np.where(kz > 0.1, S / K * (x ** 2 / i ** 2 - 1.0), 0.0)
+    return S, dS_dvl, dS_dK
+
+def fit_troughs(
+    section: ArrayLike,
+    x_m: ArrayLike,
+    settlement_m: ArrayLike,
+    radius_m: ArrayLike,
+    cover_to_axis_m: ArrayLike,
+    volume_loss_frac0: ArrayLike = 0.01,
+    K0: ArrayLike = 0.5,
+    max_iter: int = 100,
+    tol: float = 1e-8,
+    vl_bounds: tuple[float, float] = (1e-6, 0.2),
+    K_bounds: tuple[float, float] = (0.1, 1.5),
+) -> TroughFit:
+    """
+    Levenberg-Marquardt fit of volume loss and K per section to settlement readings.
+
+    Readings are (section index, offset from the axis, settlement, positive down); radius_m and
+    cover_to_axis_m hold one value per section. All sections iterate together: the 2x2 normal
+    equations are assembled with bincount and solved in closed form, and each section keeps its own
+    damping factor and stops once its relative step falls below tol; a section whose damping reaches
+    the cap without an improving step is stopped and reported as not converged. Start values
+    broadcast to sections, so a previous fit can be passed to warm-start.
+    """
+    sec = np.asarray(section, dtype=np.int64)
+    x = np.asarray(x_m, dtype=np.float64)
+    s = np.asarray(settlement_m, dtype=np.float64)
+    r = np.asarray(radius_m, dtype=np.float64)
+    z = np.asarray(cover_to_axis_m, dtype=np.float64)
+    n_sec = r.size
+    if z.shape != r.shape or r.ndim != 1:
+        raise ValueError("radius_m and cover_to_axis_m must be 1-D arrays, one value per section")
+    if not (sec.shape == x.shape == s.shape) or sec.ndim != 1:
+        raise ValueError("section, x_m and settlement_m must be 1-D arrays of equal length")
+    if sec.size and (sec.min() < 0 or sec.max() >= n_sec):
+        raise ValueError("section indices out of range")
+    keep = np.isfinite(x) & np.isfinite(s)
+    sec, x, s = sec[keep], x[keep], s[keep]
+    vl0 = np.broadcast_to(np.asarray(volume_loss_frac0, dtype=np.float64), (n_sec,))
+    vl = np.clip(vl0, *vl_bounds).copy()
+    K = np.clip(np.broadcast_to(np.asarray(K0, dtype=np.float64), (n_sec,)), *K_bounds).copy()
+    count = np.bincount(sec, minlength=n_sec)
+    active = count >= 2
+    converged = np.zeros(n_sec, dtype=bool)
+    iterations = np.zeros(n_sec, dtype=np.int64)
+    lam = np.full(n_sec, 1e-3)
+
+    def sse(
+        sec_: NDArray[np.int64],
+        x_: NDArray[np.float64],
+        s_: NDArray[np.float64],
+        vl_: NDArray[np.float64],
+        K_: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        S = _trough(vl_[sec_], K_[sec_], r[sec_], z[sec_], x_)[0]
+        sq = np.bincount(sec_, weights=(s_ - S) ** 2, minlength=n_sec)
+        return sq.astype(np.float64, copy=False)
+
+    # Readings of converged sections are dropped once they make up half the working set.
+    w_sec, w_x, w_s = sec, x, s
+    n_working = int(active.sum())
+    cost = sse(w_sec, w_x, w_s, vl, K)
+    for _ in range(max_iter):
+        n_active = int(active.sum())
+        if n_active == 0:
+            break
+        if 2 * n_active < n_working:
+            rows = active[w_sec]
+            w_sec, w_x, w_s = w_sec[rows], w_x[rows], w_s[rows]
+            n_working = n_active
+        S, Jv, Jk = _trough(vl[w_sec], K[w_sec], r[w_sec], z[w_sec], w_x)
+        res = w_s - S
+        a = np.bincount(w_sec, weights=Jv * Jv, minlength=n_sec)
+        b = np.bincount(w_sec, weights=Jv * Jk, minlength=n_sec)
+        d = np.bincount(w_sec, weights=Jk * Jk, minlength=n_sec)
+        gv = np.bincount(w_sec, weights=Jv * res, minlength=n_sec)
+        gk = np.bincount(w_sec, weights=Jk * res, minlength=n_sec)
+        a_d, d_d = a * (1.0 + lam), d * (1.0 + lam)
+        det = a_d * d_d - b * b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dv = np.where(det > 0, (d_d * gv - b * gk) / det, 0.0)
+            dk = np.where(det > 0, (a_d * gk - b * gv) / det, 0.0)
+        dv, dk = np.where(active, dv, 0.0), np.where(active, dk, 0.0)
+        vl_new = np.clip(vl + dv, *vl_bounds)
+        K_new = np.clip(K + dk, *K_bounds)
+        cost_new = sse(w_sec, w_x, w_s, vl_new, K_new)
+        better = active & (cost_new <= cost)
+        step = np.maximum(np.abs(vl_new - vl) / vl, np.abs(K_new - K) / K)
+        vl = np.where(better, vl_new, vl)
+        K = np.where(better, K_new, K)
+        cost = np.where(better, cost_new, cost)
+        lam = np.where(better, np.maximum(lam / 10.0, 1e-12), np.minimum(lam * 10.0, 1e12))
+        iterations += active
+        done = active & better & (step < tol)
+        converged |= done
+        # a section whose damping hits the cap without improving has stalled: stop it, unconverged
+        active &= ~done & (lam < 1e12)
+    cost = sse(sec, x, s, vl, K)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rmse = np.sqrt(cost / count)
+    return TroughFit(
+        volume_loss_frac=vl,
+        K=K,
+        rmse_m=np.where(count > 0, rmse, np.nan),
+        n_readings=count.astype(np.int64),
+        iterations=iterations,
+        converged=converged & (count >= 2),
+    )
+
+class TroughCalibrator:
+    """
+    Keeps the latest reading of every settlement marker and refits only the sections whose markers
+    changed since the last refit, warm-started from the previous volume loss and K.
+    """
+
+    def __init__(
+        self,
+        radius_m: ArrayLike,
+        cover_to_axis_m: ArrayLike,
+        marker_section: ArrayLike,
+        marker_x_m: ArrayLike,
+        volume_loss_frac0: float = 0.01,
+        K0: float = 0.5,
+        **fit_kwargs: float,
+    ) -> None:
+        self.radius_m = np.asarray(radius_m, dtype=np.float64)
+        self.cover_to_axis_m = np.asarray(cover_to_axis_m, dtype=np.float64)
+        self.marker_section = np.asarray(marker_section, dtype=np.int64)
+        self.marker_x_m = np.asarray(marker_x_m, dtype=np.float64)
+        if self.marker_section.shape != self.marker_x_m.shape:
+            raise ValueError("marker_section and marker_x_m must have equal length")
+        n_sec = self.radius_m.size
+        self.readings_m = np.full(self.marker_section.size, np.nan)
+        self.fit = TroughFit(
+            volume_loss_frac=np.full(n_sec, volume_loss_frac0),
+            K=np.full(n_sec, K0),
+            rmse_m=np.full(n_sec, np.nan),
+            n_readings=np.zeros(n_sec, dtype=np.int64),
+            iterations=np.zeros(n_sec, dtype=np.int64),
+            converged=np.zeros(n_sec, dtype=bool),
+        )
+        self.fit_kwargs = fit_kwargs
+        self._dirty = np.zeros(n_sec, dtype=bool)
+
+    def update(self, marker: ArrayLike, settlement_m: ArrayLike) -> None:
+        """Record new readings; a later reading of the same marker replaces the earlier one."""
+        m = np.asarray(marker, dtype=np.int64)
+        self.readings_m[m] = settlement_m
+        self._dirty[self.marker_section[m]] = True
+
+    def refit(self) -> NDArray[np.int64]:
+        """Refit changed sections in place and return their indices."""
+        changed = np.flatnonzero(self._dirty)
+        if changed.size == 0:
+            return changed
+        local = np.full(self._dirty.size, -1, dtype=np.int64)
+        local[changed] = np.arange(changed.size)
+        rows = self._dirty[self.marker_section]
+        prev = self.fit
+        sub = fit_troughs(
+            local[self.marker_section[rows]], self.marker_x_m[rows], self.readings_m[rows],
+            self.radius_m[changed], self.cover_to_axis_m[changed],
+            prev.volume_loss_frac[changed], prev.K[changed], **self.fit_kwargs,  # type: ignore[arg-type]
+        )
+        merged = {}
+        for name in ("volume_loss_frac", "K", "rmse_m", "n_readings", "iterations", "converged"):
+            col = getattr(prev, name).copy()
+            col[changed] = getattr(sub, name)
+            merged[name] = col
+        self.fit = TroughFit(**merged)
+        self._dirty[:] = False
+        return changed
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from dataclasses import MISSING, dataclass, fields
+from pathlib import Path
+import statistics
+import time
+from typing import Callable, Literal
+
+import numpy as np
+import pandas as pd
+
+from .classification import RMR_CLASS_LABELS, RMRInputs, rmr_scores_frame
+from .cost import CostInputs, tunnel_costs
+from .groundwater import InflowInputs, inflows_per_length
+from .settlement import SettlementInputs, settlement_troughs
+
+BatchKind = Literal["rmr", "inflow", "settlement", "cost"]
+
+@dataclass(frozen=True)
+class ChunkStat:
+    index: int
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+@dataclass(frozen=True)
+class BatchReport:
+    kind: str
+    rows: int
+    rejected: int
+    seconds: float
+    chunks: list[ChunkStat]
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+    def summary(self) -> str:
+        lines = [
+            f"Rows: {self.rows:,} in {len(self.chunks)} chunk(s), rejected: {self.rejected:,}",
+            f"Elapsed: {self.seconds:.2f} s ({self.rows_per_s:,.0f} rows/s)",
+        ]
+        rates = [c.rows_per_s for c in self.chunks if c.rows]
+        if rates:
+            lo, mid, hi = min(rates), statistics.median(rates), max(rates)
+            lines.append(f"Per-chunk rows/s: min {lo:,.0f}, median {mid:,.0f}, max {hi:,.0f}")
+        return "\n".join(lines)
+
+def _fill_defaults(chunk: pd.DataFrame, model: type) -> pd.DataFrame:
+    # Template columns for fields with dataclass defaults may be absent or blank.
+    missing = []
+    for f in fields(model):
+        if f.name not in chunk.columns:
+            if f.default is MISSING:
+                missing.append(f.name)
+            else:
+                chunk[f.name] = f.default
+        elif f.default is not MISSING:
+            chunk[f.name] = chunk[f.name].fillna(f.default)
+    if missing:
+        raise ValueError(f"Missing required columns for {model.__name__}: {', '.join(missing)}")
+    return chunk
+
+def _rmr(chunk: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    res = rmr_scores_frame(_fill_defaults(chunk, RMRInputs))
+    chunk["rmr"] = res.rmr
+    chunk["class_label"] = np.asarray(RMR_CLASS_LABELS)[res.class_code]
+    return chunk, 0
+
+def _inflow(chunk: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    chunk = _fill_defaults(chunk, InflowInputs)
+    res = inflows_per_length(
+        chunk["k_m_per_s"],
+        chunk["head_above_axis_m"],
+        chunk["radius_m"],
+        chunk["influence_radius_m"],
+        chunk["drainage_factor"],
+    )
+    chunk["q_per_m3_s"] = res.q_per_m3_s
+    chunk["valid"] = res.valid
+    return chunk, res.rejected
+
+def _settlement(chunk: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    chunk = _fill_defaults(chunk, SettlementInputs)
+    res = settlement_troughs(
+        chunk["volume_loss_frac"], chunk["radius_m"], chunk["cover_to_axis_m"], chunk["K"]
+    )
+    chunk["Smax_m"] = res.Smax_m
+    chunk["i_m"] = res.i_m
+    return chunk, 0
+
+def _cost(chunk: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    chunk = _fill_defaults(chunk, CostInputs)
+    res = tunnel_costs(*(chunk[f.name] for f in fields(CostInputs)))
+    chunk["tunnel_usd"] = res.tunnel_usd
+    chunk["shafts_usd"] = res.shafts_usd
+    chunk["total_usd"] = res.total_usd
+    return chunk, 0
+
+_RUNNERS: dict[str, Callable[[pd.DataFrame], tuple[pd.DataFrame, int]]] = {
+    "rmr": _rmr,
+    "inflow": _inflow,
+    "settlement": _settlement,
+    "cost": _cost,
+}
+
+def run_batch(
+    kind: BatchKind, input_path: Path, output_path: Path, chunk_rows: int = 100_000
+) -> BatchReport:
+    """
+    Stream a filled-in CSV template through the matching vectorized screen.
+
+    The input is read `chunk_rows` rows at a time and each result chunk is appended to
+    `output_path` (input columns followed by result columns), so peak memory depends on
+    the chunk size only, not on the file length.
+    """
+    if kind not in _RUNNERS:
+        raise ValueError(f"Unknown batch kind '{kind}'. Supported: {', '.join(_RUNNERS)}")
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be > 0")
+    runner = _RUNNERS[kind]
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    stats: list[ChunkStat] = []
+    rows = rejected = 0
+    t_start = time.perf_counter()
+    with (
+        pd.read_csv(input_path, chunksize=chunk_rows) as reader,
+        open(output_path, "w", newline="") as out,
+    ):
+        for idx, chunk in enumerate(reader):
+            t0 = time.perf_counter()
+            result, bad = runner(chunk)
+            result.to_csv(out, header=(idx == 0), index=False)
+            stats.append(ChunkStat(index=idx, rows=len(result), seconds=time.perf_counter() - t0))
+            rows += len(result)
+            rejected += bad
+    return BatchReport(
+        kind=kind, rows=rows, rejected=rejected, seconds=time.perf_counter() - t_start, chunks=stats
+    )
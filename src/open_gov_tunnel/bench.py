@@ -0,0 +1,353 @@
+"""
+Performance benchmarks for the package. Run with `python -m open_gov_tunnel.bench --help`.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import numpy as np
+import typer
+
+from . import __version__
+
+# Representative arguments per CLI subcommand ("{tmp}" is replaced by a scratch folder).
+STARTUP_CASES: dict[str, list[str]] = {
+    "list-states": ["list-states"],
+    "rmr": [
+        "rmr", "--rqd", "60", "--spacing", "10", "--cond", "10",
+        "--gw", "8", "--orient", "4", "--strength", "10",
+    ],
+    "qsystem": [
+        "qsystem", "--rqd", "60", "--Jn", "9", "--Jr", "2", "--Ja", "1", "--Jw", "1", "--SRF", "2",
+    ],
+    "support": ["support", "--rmr", "65", "--D", "6"],
+    "lining": ["lining", "--p", "300", "--r", "3", "--phi", "0.7", "--fc", "15000"],
+    "inflow": ["inflow", "--k", "1e-6", "--head", "10", "--r", "3", "--R", "100"],
+    "settlement": ["settlement", "--VL", "0.015", "--r", "3", "--cover", "15"],
+    "vent": ["vent", "--kW", "500", "--persons", "20"],
+    "fire-egress": ["fire-egress", "--length", "1000"],
+    "tbm-select": ["tbm-select", "--ground", "soft", "--gw", "high"],
+    "cost": ["cost", "--length", "1000", "--D", "6"],
+    "permits": ["permits"],
+    "templates": ["templates", "--folder", "{tmp}/templates"],
+    "batch": [
+        "batch", "rmr", "--input", "{tmp}/templates/rmr_template.csv", "--out", "{tmp}/out.csv",
+    ],
+}
+
+# Runs one CLI invocation in a fresh interpreter; reports in-process time and heavy modules loaded.
+_PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+from open_gov_tunnel.cli import app
+t1 = time.perf_counter()
+try:
+    app(sys.argv[1:], standalone_mode=False)
+finally:
+    t2 = time.perf_counter()
+    probe = {"import_s": t1 - t0, "total_s": t2 - t0,
+             "pandas": "pandas" in sys.modules, "rich": "rich.console" in sys.modules}
+    sys.stderr.write(json.dumps(probe) + "\\n")
+"""
+
+@dataclass(frozen=True)
+class StartupTiming:
+    subcommand: str
+    wall_s: float          # median wall time of the whole process, interpreter start-up included
+    in_process_s: float    # median time from the first package import to command completion
+    loads_pandas: bool
+    loads_rich: bool
+
+def startup_benchmark(subcommands: list[str] | None = None, repeat: int = 5) -> list[StartupTiming]:
+    """Time cold CLI invocations, each in a fresh interpreter, per subcommand."""
+    names = subcommands or list(STARTUP_CASES)
+    unknown = [n for n in names if n not in STARTUP_CASES]
+    if unknown:
+        raise ValueError(f"Unknown subcommand(s): {', '.join(unknown)}")
+    out: list[StartupTiming] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # batch needs a template to read.
+        templates = [a.format(tmp=tmp) for a in STARTUP_CASES["templates"]]
+        subprocess.run([sys.executable, "-c", _PROBE, *templates], check=True, capture_output=True)
+        for name in names:
+            args = [a.format(tmp=tmp) for a in STARTUP_CASES[name]]
+            walls, inproc = [], []
+            probe: dict[str, object] = {}
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                proc = subprocess.run(
+                    [sys.executable, "-c", _PROBE, *args], capture_output=True, text=True
+                )
+                walls.append(time.perf_counter() - t0)
+                if proc.returncode != 0:
+                    raise RuntimeError(f"'{name}' failed: {proc.stderr.strip()}")
+                probe = json.loads(proc.stderr.strip().splitlines()[-1])
+                inproc.append(float(probe["total_s"]))  # type: ignore[arg-type]
+            out.append(
+                StartupTiming(
+                    subcommand=name,
+                    wall_s=statistics.median(walls),
+                    in_process_s=statistics.median(inproc),
+                    loads_pandas=bool(probe["pandas"]),
+                    loads_rich=bool(probe["rich"]),
+                )
+            )
+    return out
+
+Runner = Callable[[], Any]
+
+def _case_rmr(n: int, rng: np.random.Generator) -> tuple[Runner, Runner]:
+    from .classification import RMRInputs, rmr_score, rmr_scores
+    cols = rng.uniform(0.0, 20.0, size=(6, n))
+    rows = [RMRInputs(*map(float, c)) for c in cols.T]
+    return (lambda: [rmr_score(r) for r in rows]), (lambda: rmr_scores(*cols))
+
+def _case_q(n: int, rng: np.random.Generator) -> tuple[Runner, Runner]:
+    from .classification import QInputs, q_system, q_values
+    cols = 10.0 ** rng.uniform(-2.0, 2.0, size=(6, n))
+    rows = [QInputs(*map(float, c)) for c in cols.T]
+    return (lambda: [q_system(r) for r in rows]), (lambda: q_values(*cols))
+
+def _case_inflow(n: int, rng: np.random.Generator) -> tuple[Runner, Runner]:
+    from .groundwater import InflowInputs, inflow_per_length, inflows_per_length
+    k = 10.0 ** rng.uniform(-8.0, -4.0, n)
+    h = rng.uniform(0.0, 50.0, n)
+    R = rng.uniform(50.0, 500.0, n)
+    rows = [InflowInputs(float(a), float(b), 3.0, float(c)) for a, b, c in zip(k, h, R)]
+    return (
+        (lambda: [inflow_per_length(r) for r in rows]),
+        (lambda: inflows_per_length(k, h, 3.0, R)),
+    )
+
+def _case_settlement(n: int, rng: np.random.Generator) -> tuple[Runner, Runner]:
+    from .settlement import SettlementInputs, settlement_trough, settlement_troughs
+    vl = rng.uniform(0.002, 0.02, n)
+    z = rng.uniform(8.0, 40.0, n)
+    rows = [SettlementInputs(float(a), 3.0, float(b)) for a, b in zip(vl, z)]
+    return (lambda: [settlement_trough(r) for r in rows]), (lambda: settlement_troughs(vl, 3.0, z))
+
+def _case_lining(n: int, rng: np.random.Generator) -> tuple[Runner, Runner]:
+    from .lining import LiningInputs, lining_thickness, lining_thicknesses
+    p = rng.uniform(50.0, 1000.0, n)
+    r = rng.uniform(1.5, 7.0, n)
+    rows = [LiningInputs(float(a), float(b), 0.7, 15_000.0) for a, b in zip(p, r)]
+    return (
+        (lambda: [lining_thickness(x) for x in rows]),
+        (lambda: lining_thicknesses(p, r, 0.7, 15_000.0)),
+    )
+
+def _case_cost(n: int, rng: np.random.Generator) -> tuple[Runner, Runner]:
+    from .cost import CostInputs, tunnel_cost, tunnel_costs
+    L = rng.uniform(100.0, 20_000.0, n)
+    D = rng.uniform(3.0, 12.0, n)
+    rows = [CostInputs(float(a), float(b)) for a, b in zip(L, D)]
+    return (lambda: [tunnel_cost(x) for x in rows]), (lambda: tunnel_costs(L, D))
+
+def _case_egress(n: int, rng: np.random.Generator) -> tuple[Runner, Runner]:
+    from .fire_safety import EgressInputs, egress_screen, egress_screens
+    L = rng.uniform(100.0, 20_000.0, n)
+    rows = [EgressInputs(float(a)) for a in L]
+    return (lambda: [egress_screen(x) for x in rows]), (lambda: egress_screens(L))
+
+def _case_tbm(n: int, rng: np.random.Generator) -> tuple[Runner, Runner]:
+    from .tbm import TBMInputs, tbm_recommendations, tbm_select
+    g = rng.choice(np.array(["rock", "mixed", "soft"]), n)
+    w = rng.choice(np.array(["dry", "wet", "high"]), n)
+    b = rng.random(n) < 0.2
+    rows = [TBMInputs(str(a), str(c), bool(d)) for a, c, d in zip(g, w, b)]
+    return (lambda: [tbm_select(x) for x in rows]), (lambda: tbm_recommendations(g, w, b))
+
+SUITE_CASES: dict[str, Callable[[int, np.random.Generator], tuple[Runner, Runner]]] = {
+    "rmr_score": _case_rmr,
+    "q_system": _case_q,
+    "inflow_per_length": _case_inflow,
+    "settlement_trough": _case_settlement,
+    "lining_thickness": _case_lining,
+    "tunnel_cost": _case_cost,
+    "egress_screen": _case_egress,
+    "tbm_select": _case_tbm,
+}
+DEFAULT_SIZES: tuple[int, ...] = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+@dataclass(frozen=True)
+class BenchResult:
+    name: str
+    mode: str              # "scalar" (one call per row) or "batch" (one array call)
+    size: int
+    seconds: float         # best of `repeat` runs
+    peak_bytes: int        # tracemalloc peak during one extra run
+
+    @property
+    def per_call_s(self) -> float:
+        return self.seconds if self.mode == "batch" else self.seconds / self.size
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.size / self.seconds if self.seconds > 0 else float("inf")
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    mode: str
+    size: int
+    baseline_rows_per_s: float
+    current_rows_per_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_rows_per_s / self.baseline_rows_per_s
+
+def _time(fn: Runner, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def run_suite(
+    names: list[str] | None = None,
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    scalar_max_size: int = 100_000,
+    repeat: int = 3,
+    seed: int = 0,
+) -> list[BenchResult]:
+    """
+    Time every screening function in scalar and batch form at each input size.
+
+    Inputs are generated locally from `seed` (no files or network). Scalar timings loop
+    over prebuilt input dataclasses and stop at `scalar_max_size` rows.
+    """
+    chosen = names or list(SUITE_CASES)
+    unknown = [n for n in chosen if n not in SUITE_CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    results: list[BenchResult] = []
+    for name in chosen:
+        for size in sizes:
+            scalar, batch = SUITE_CASES[name](size, np.random.default_rng(seed))
+            runs = [("batch", batch)] + ([("scalar", scalar)] if size <= scalar_max_size else [])
+            for mode, fn in runs:
+                seconds, peak = _time(fn, repeat)
+                results.append(
+                    BenchResult(name=name, mode=mode, size=size, seconds=seconds, peak_bytes=peak)
+                )
+    return results
+
+def results_to_json(results: list[BenchResult]) -> dict[str, Any]:
+    return {
+        "package_version": __version__,
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "results": [
+            asdict(r) | {"per_call_s": r.per_call_s, "rows_per_s": r.rows_per_s} for r in results
+        ],
+    }
+
+def compare_to_baseline(
+    results: list[BenchResult],
+    baseline: dict[str, Any],
+    tolerance: float = 0.25,
+    min_size: int = 1_000,
+) -> list[Regression]:
+    """
+    Flag cases whose rows/s dropped by more than `tolerance` against a baseline produced
+    by results_to_json. Sizes below `min_size` are too noisy to compare and are skipped.
+    """
+    base = {
+        (r["name"], r["mode"], r["size"]): float(r["rows_per_s"])
+        for r in baseline.get("results", [])
+    }
+    out: list[Regression] = []
+    for r in results:
+        ref = base.get((r.name, r.mode, r.size))
+        if ref is None or r.size < min_size:
+            continue
+        if r.rows_per_s < ref * (1.0 - tolerance):
+            out.append(
+                Regression(
+                    name=r.name,
+                    mode=r.mode,
+                    size=r.size,
+                    baseline_rows_per_s=ref,
+                    current_rows_per_s=r.rows_per_s,
+                )
+            )
+    return out
+
+app = typer.Typer(help="Performance benchmarks for OpenGov-TunnelEngineering.")
+
+@app.callback()
+def _group() -> None:
+    """Performance benchmarks for OpenGov-TunnelEngineering."""
+
+@app.command("startup")
+def cmd_startup(
+    subcommand: list[str] = typer.Option(
+        None, "--subcommand", "-s", help="Subcommand(s) to time (default: all)"
+    ),
+    repeat: int = typer.Option(5, "--repeat"),
+    json_path: Path = typer.Option(None, "--json", help="Write results as JSON"),
+) -> None:
+    rows = startup_benchmark(subcommand or None, repeat=repeat)
+    for r in rows:
+        pandas = "yes" if r.loads_pandas else "no"
+        typer.echo(
+            f"{r.subcommand:<12} wall {r.wall_s * 1000:7.1f} ms   "
+            f"in-process {r.in_process_s * 1000:7.1f} ms   pandas={pandas}"
+        )
+    if json_path:
+        json_path.write_text(json.dumps([asdict(r) for r in rows], indent=2))
+
+@app.command("suite")
+def cmd_suite(
+    name: list[str] = typer.Option(None, "--name", "-n", help="Benchmark(s) to run (default: all)"),
+    max_size: int = typer.Option(10_000_000, "--max-size", help="Largest batch input size"),
+    scalar_max_size: int = typer.Option(
+        100_000, "--scalar-max-size", help="Largest scalar-loop input size"
+    ),
+    repeat: int = typer.Option(3, "--repeat"),
+    json_path: Path = typer.Option(None, "--json", help="Write results as JSON"),
+    baseline: Path = typer.Option(
+        None, "--baseline", help="Baseline JSON to compare against, e.g. benchmarks/baseline.json"
+    ),
+    tolerance: float = typer.Option(0.25, "--tolerance", help="Allowed fractional rows/s drop"),
+) -> None:
+    sizes = tuple(s for s in DEFAULT_SIZES if s <= max_size)
+    results = run_suite(name or None, sizes=sizes, scalar_max_size=scalar_max_size, repeat=repeat)
+    for r in results:
+        typer.echo(
+            f"{r.name:<18} {r.mode:<6} n={r.size:>10,}  {r.per_call_s * 1e6:12.3f} us/call  "
+            f"{r.rows_per_s:14,.0f} rows/s  peak {r.peak_bytes / 1e6:9.2f} MB"
+        )
+    if json_path:
+        json_path.write_text(json.dumps(results_to_json(results), indent=2))
+    if baseline:
+        regressions = compare_to_baseline(
+            results, json.loads(baseline.read_text()), tolerance=tolerance
+        )
+        for g in regressions:
+            typer.echo(
+                f"REGRESSION {g.name} {g.mode} n={g.size:,}: {g.current_rows_per_s:,.0f} rows/s "
+                f"vs baseline {g.baseline_rows_per_s:,.0f} ({g.ratio:.2f}x)"
+            )
+        if regressions:
+            raise typer.Exit(code=1)
+
+if __name__ == "__main__":  # pragma: no cover
+    app()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, is_dataclass
+import functools
+import hashlib
+import json
+import numbers
+from pathlib import Path
+import pickle
+import sqlite3
+import threading
+from typing import Any, Callable, TypeVar
+
+from . import __version__
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+def _qualname(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+def _normalized(value: Any) -> Any:
+    # 60, 60.0 and np.float64(60) compute the same result, so they must hash the same
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _normalized(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalized(v) for v in value]
+    return value
+
+def stable_key(fn: Callable[..., Any], inp: Any) -> str:
+    """
+    Content hash of a screening call: function name, input type, input field values
+    (numbers normalised to float) and the package version (so results are recomputed
+    after an upgrade).
+    """
+    if not (is_dataclass(inp) and not isinstance(inp, type)):
+        raise TypeError("cached inputs must be dataclass instances")
+    payload = {
+        "fn": _qualname(fn),
+        "type": _qualname(type(inp)),
+        "fields": _normalized(asdict(inp)),
+        "version": __version__,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=repr).encode()).hexdigest()
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    disk_hits: int
+    misses: int
+    size: int
+
+class ResultCache:
+    """
+    Opt-in memoization for screening calls on frozen input dataclasses.
+
+    An in-process LRU bounded to `maxsize` entries sits in front of an optional SQLite
+    store at `path`, keyed by stable_key, so results survive process restarts. Calls
+    that raise are not cached.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: Path | None = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = self.disk_hits = self.misses = 0
+        self._lru: OrderedDict[tuple[Any, Any], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    def call(self, fn: Callable[[T], R], inp: T) -> R:
+        mem_key = (fn, inp)
+        with self._lock:
+            if mem_key in self._lru:
+                self._lru.move_to_end(mem_key)
+                self.hits += 1
+                return self._lru[mem_key]  # type: ignore[no-any-return]
+        key = stable_key(fn, inp) if self._db is not None else ""
+        if self._db is not None:
+            with self._lock:
+                row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                result = pickle.loads(row[0])
+                self._remember(mem_key, result)
+                with self._lock:
+                    self.disk_hits += 1
+                return result  # type: ignore[no-any-return]
+        result = fn(inp)
+        self._remember(mem_key, result)
+        with self._lock:
+            self.misses += 1
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                    (key, pickle.dumps(result)),
+                )
+                self._db.commit()
+        return result
+
+    def _remember(self, mem_key: tuple[Any, Any], result: Any) -> None:
+        with self._lock:
+            self._lru[mem_key] = result
+            self._lru.move_to_end(mem_key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits, disk_hits=self.disk_hits, misses=self.misses, size=len(self._lru)
+            )
+
+    def clear(self, disk: bool = False) -> None:
+        with self._lock:
+            self._lru.clear()
+            if disk and self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self) -> ResultCache:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+def memoize(cache: ResultCache) -> Callable[[Callable[[T], R]], Callable[[T], R]]:
+    """Decorator form: `rmr = memoize(cache)(rmr_score)`."""
+    def wrap(fn: Callable[[T], R]) -> Callable[[T], R]:
+        @functools.wraps(fn)
+        def inner(inp: T) -> R:
+            return cache.call(fn, inp)
+        return inner
+    return wrap
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+
+# numpy is imported inside the batch functions so that the scalar API (and `rmr`/`qsystem`
+# on the command line) does not pay for it at import time.
 
 @dataclass(frozen=True)
 class RMRInputs:
@@ -57,3 +65,97 @@ def q_system(inp: QInputs) -> QResult:
     else:
         cat = "Very Poor/Extremely Poor"
     return QResult(Q=float(Q), category=cat)
+
+# Batch (array) API. Class codes index into the label tables below; code 0 is the best class.
+RMR_CLASS_LABELS: tuple[str, ...] = (
+    "I (Very Good)",
+    "II (Good)",
+    "III (Fair)",
+    "IV (Poor)",
+    "V (Very Poor)",
+)
+RMR_CLASS_THRESHOLDS: tuple[float, ...] = (80.0, 60.0, 40.0, 20.0)
+Q_CATEGORY_LABELS: tuple[str, ...] = (
+    "Excellent/Very Good",
+    "Good",
+    "Fair",
+    "Poor",
+    "Very Poor/Extremely Poor",
+)
+Q_CATEGORY_THRESHOLDS: tuple[float, ...] = (10.0, 4.0, 1.0, 0.1)
+
+@dataclass(frozen=True, eq=False)
+class RMRBatchResult:
+    rmr: NDArray[np.float64]
+    class_code: NDArray[np.int8]
+
+    def class_labels(self) -> NDArray[np.str_]:
+        import numpy as np
+
+        return np.asarray(RMR_CLASS_LABELS)[self.class_code]
+
+@dataclass(frozen=True, eq=False)
+class QBatchResult:
+    Q: NDArray[np.float64]
+    category_code: NDArray[np.int8]
+
+    def category_labels(self) -> NDArray[np.str_]:
+        import numpy as np
+
+        return np.asarray(Q_CATEGORY_LABELS)[self.category_code]
+
+def rmr_scores(
+    rqd: ArrayLike,
+    spacing_rating: ArrayLike,
+    condition_rating: ArrayLike,
+    groundwater_rating: ArrayLike,
+    orientation_rating: ArrayLike,
+    strength_rating: ArrayLike,
+) -> RMRBatchResult:
+    """
+    Vectorized rmr_score: same summation order, clamping and class thresholds.
+    """
+    import numpy as np
+
+    from .utils import cap_at, floor_at, threshold_codes
+
+    total = np.asarray(rqd, dtype=np.float64) + np.asarray(spacing_rating, dtype=np.float64)
+    for part in (condition_rating, groundwater_rating, orientation_rating, strength_rating):
+        total = total + np.asarray(part, dtype=np.float64)
+    rmr = floor_at(cap_at(total, 100.0), 0.0)
+    return RMRBatchResult(rmr=rmr, class_code=threshold_codes(rmr, RMR_CLASS_THRESHOLDS))
+
+def q_values(
+    rqd: ArrayLike, Jn: ArrayLike, Jr: ArrayLike, Ja: ArrayLike, Jw: ArrayLike, SRF: ArrayLike
+) -> QBatchResult:
+    """
+    Vectorized q_system: same floors on each term and same category thresholds.
+    """
+    import numpy as np
+
+    from .utils import floor_at, threshold_codes
+
+    def f(x: ArrayLike, lo: float) -> NDArray[np.float64]:
+        return floor_at(np.asarray(x, dtype=np.float64), lo)
+
+    Q = (f(rqd, 0.0) / f(Jn, 1e-6)) * (f(Jr, 1e-6) / f(Ja, 1e-6)) * (f(Jw, 1e-6) / f(SRF, 1e-6))
+    return QBatchResult(Q=Q, category_code=threshold_codes(Q, Q_CATEGORY_THRESHOLDS))
+
+def rmr_scores_frame(frame: Mapping[str, ArrayLike]) -> RMRBatchResult:
+    """
+    rmr_scores over a DataFrame (or dict of arrays) with the rmr_template.csv column names.
+    """
+    return rmr_scores(
+        frame["rqd"],
+        frame["spacing_rating"],
+        frame["condition_rating"],
+        frame["groundwater_rating"],
+        frame["orientation_rating"],
+        frame["strength_rating"],
+    )
+
+def q_values_frame(frame: Mapping[str, ArrayLike]) -> QBatchResult:
+    """
+    q_values over a DataFrame (or dict of arrays) with QInputs field names as columns.
+    """
+    return q_values(frame["rqd"], frame["Jn"], frame["Jr"], frame["Ja"], frame["Jw"], frame["SRF"])
@@ -1,33 +1,72 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.theme import Theme
-
-from .states import list_states
-from .classification import RMRInputs, rmr_score, QInputs, q_system
-from .support import natm_support_from_rmr
-from .lining import LiningInputs, lining_thickness
-from .groundwater import InflowInputs, inflow_per_length
-from .settlement import SettlementInputs, settlement_trough, settlement_at_x
-from .ventilation import VentInputs, construction_vent_airflow
-from .fire_safety import EgressInputs, egress_screen
-from .tbm import TBMInputs, tbm_select
-from .cost import CostInputs, tunnel_cost
-from .permits import PermitsInputs, permits_check
-from .reports import write_templates
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Subcommands import their calculator modules (and pandas/rich) on first use so that
+# shell pipelines calling one cheap subcommand do not pay for the whole package.
 
 app = typer.Typer(help="OpenGov-TunnelEngineering: Tunnel planning/engineering screening (CA/IN/OH).")
-console = Console(theme=Theme({"info": "cyan", "error": "red", "success": "green"}))
+
+
+@lru_cache(maxsize=None)
+def _console() -> Console:
+    from rich.console import Console
+    from rich.theme import Theme
+
+    return Console(theme=Theme({"info": "cyan", "error": "red", "success": "green"}))
+
+
+def __getattr__(name: str) -> object:
+    # `cli.console` was a module-level Console; keep it available, built on first access.
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _show(body: str, title: str, style: str | None = None) -> None:
+    from rich.panel import Panel
+
+    _console().print(Panel(body, title=title), style=style)
+
+
+@app.callback()
+def _options(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False, "--profile", help="Print a hot-path summary of screening calls on exit."
+    ),
+    profile_trace: Path | None = typer.Option(
+        None, "--profile-trace", help="Also write a Chrome-trace JSON file (implies --profile)."
+    ),
+) -> None:
+    if not (profile or profile_trace):
+        return
+    from .profiling import Profiler
+
+    profiler = Profiler(trace_events=profile_trace is not None).enable()
+
+    def report() -> None:
+        profiler.disable()
+        _console().print(profiler.summary(), style="info", soft_wrap=True, highlight=False)
+        if profile_trace is not None:
+            profiler.write_chrome_trace(profile_trace)
+
+    ctx.call_on_close(report)
 
 
 @app.command("list-states")
 def cmd_list_states() -> None:
+    from .states import list_states
+
     lines = [f"{p.code}: {p.name} — Agencies: {', '.join(p.agencies)}. {p.notes}" for p in list_states()]
-    console.print(Panel("\n".join(lines), title="Supported States"))
+    _show("\n".join(lines), "Supported States")
 
 
 @app.command("rmr")
@@ -39,8 +78,10 @@ def cmd_rmr(
     orient: float = typer.Option(..., "--orient"),
     strength: float = typer.Option(..., "--strength"),
 ) -> None:
+    from .classification import RMRInputs, rmr_score
+
     res = rmr_score(RMRInputs(rqd=rqd, spacing_rating=spacing, condition_rating=condition, groundwater_rating=gw, orientation_rating=orient, strength_rating=strength))
-    console.print(Panel(f"RMR = {res.rmr:.1f} ({res.class_label})", title="RMR"))
+    _show(f"RMR = {res.rmr:.1f} ({res.class_label})", "RMR")
 
 
 @app.command("qsystem")
@@ -52,8 +93,10 @@ def cmd_qsystem(
     Jw: float = typer.Option(..., "--Jw"),
     SRF: float = typer.Option(..., "--SRF"),
 ) -> None:
+    from .classification import QInputs, q_system
+
     res = q_system(QInputs(rqd=rqd, Jn=Jn, Jr=Jr, Ja=Ja, Jw=Jw, SRF=SRF))
-    console.print(Panel(f"Q = {res.Q:.2f} ({res.category})", title="Q-system"))
+    _show(f"Q = {res.Q:.2f} ({res.category})", "Q-system")
 
 
 @app.command("support")
@@ -61,8 +104,15 @@ def cmd_support(
     rmr: float = typer.Option(..., "--rmr"),
     D: float = typer.Option(..., "--D", help="Tunnel diameter (m)"),
 ) -> None:
+    from .support import natm_support_from_rmr
+
     s = natm_support_from_rmr(rmr, D)
-    console.print(Panel(f"Shotcrete: {s.shotcrete_mm} mm\nBolts: {s.bolt_length_m:.1f} m @ {s.bolt_spacing_m:.1f} m\nLattice girders: {s.lattice_girders}", title="NATM Support (Screening)"))
+    _show(
+        f"Shotcrete: {s.shotcrete_mm} mm\n"
+        f"Bolts: {s.bolt_length_m:.1f} m @ {s.bolt_spacing_m:.1f} m\n"
+        f"Lattice girders: {s.lattice_girders}",
+        "NATM Support (Screening)",
+    )
 
 
 @app.command("lining")
@@ -73,8 +123,10 @@ def cmd_lining(
     fc: float = typer.Option(..., "--fc", help="Allowable compressive stress (kPa)"),
     tmin: float = typer.Option(0.2, "--tmin"),
 ) -> None:
+    from .lining import LiningInputs, lining_thickness
+
     res = lining_thickness(LiningInputs(ground_pressure_kPa=p, radius_m=r, phi_resistance=phi, fc_allow_kPa=fc, t_min_m=tmin))
-    console.print(Panel(f"Required thickness ≈ {res.t_req_m:.2f} m\nOK(min): {res.OK}", title="Lining Hoop Thickness"))
+    _show(f"Required thickness ≈ {res.t_req_m:.2f} m\nOK(min): {res.OK}", "Lining Hoop Thickness")
 
 
 @app.command("inflow")
@@ -85,8 +137,10 @@ def cmd_inflow(
     R: float = typer.Option(..., "--R"),
     df: float = typer.Option(1.0, "--df"),
 ) -> None:
+    from .groundwater import InflowInputs, inflow_per_length
+
     q = inflow_per_length(InflowInputs(k_m_per_s=k, head_above_axis_m=head, radius_m=r, influence_radius_m=R, drainage_factor=df))
-    console.print(Panel(f"Inflow per meter ≈ {q.q_per_m3_s:.6f} m^3/s·m", title="Groundwater Inflow"))
+    _show(f"Inflow per meter ≈ {q.q_per_m3_s:.6f} m^3/s·m", "Groundwater Inflow")
 
 
 @app.command("settlement")
@@ -97,9 +151,14 @@ def cmd_settlement(
     K: float = typer.Option(0.5, "--K"),
     x: float = typer.Option(0.0, "--x"),
 ) -> None:
+    from .settlement import SettlementInputs, settlement_at_x, settlement_trough
+
     tr = settlement_trough(SettlementInputs(volume_loss_frac=VL, radius_m=r, cover_to_axis_m=cover, K=K))
     s = settlement_at_x(tr, x)
-    console.print(Panel(f"Smax ≈ {tr.Smax_m*1000:.1f} mm\ni ≈ {tr.i_m:.2f} m\nS(x={x} m) ≈ {s*1000:.1f} mm", title="Settlement Trough"))
+    _show(
+        f"Smax ≈ {tr.Smax_m * 1000:.1f} mm\ni ≈ {tr.i_m:.2f} m\nS(x={x} m) ≈ {s * 1000:.1f} mm",
+        "Settlement Trough",
+    )
 
 
 @app.command("vent")
@@ -107,8 +166,10 @@ def cmd_vent(
     diesel_kW: float = typer.Option(..., "--kW"),
     persons: int = typer.Option(..., "--persons"),
 ) -> None:
+    from .ventilation import VentInputs, construction_vent_airflow
+
     v = construction_vent_airflow(VentInputs(diesel_kW=diesel_kW, persons=persons))
-    console.print(Panel(f"Airflow ≈ {v.airflow_m3_s:.2f} m^3/s", title="Construction Ventilation"))
+    _show(f"Airflow ≈ {v.airflow_m3_s:.2f} m^3/s", "Construction Ventilation")
 
 
 @app.command("fire-egress")
@@ -117,8 +178,14 @@ def cmd_fire_egress(
     spacing: float = typer.Option(152.0, "--spacing"),
     speed: float = typer.Option(1.0, "--speed"),
 ) -> None:
+    from .fire_safety import EgressInputs, egress_screen
+
     e = egress_screen(EgressInputs(tunnel_length_m=length, max_spacing_m=spacing, walkway_speed_mps=speed))
-    console.print(Panel(f"Required cross-passages: {e.required_passages}\nMax egress time ≈ {e.max_egress_time_s:.0f} s", title="Fire/Life Safety Egress"))
+    _show(
+        f"Required cross-passages: {e.required_passages}\n"
+        f"Max egress time ≈ {e.max_egress_time_s:.0f} s",
+        "Fire/Life Safety Egress",
+    )
 
 
 @app.command("tbm-select")
@@ -127,8 +194,10 @@ def cmd_tbm_select(
     gw: str = typer.Option(..., "--gw"),
     boulders: bool = typer.Option(False, "--boulders"),
 ) -> None:
+    from .tbm import TBMInputs, tbm_select
+
     t = tbm_select(TBMInputs(ground=ground, groundwater=gw, boulders=boulders))
-    console.print(Panel(f"Recommended: {t.recommended}\nNotes: {t.notes}", title="TBM Selection (Screening)"))
+    _show(f"Recommended: {t.recommended}\nNotes: {t.notes}", "TBM Selection (Screening)")
 
 
 @app.command("cost")
@@ -139,8 +208,13 @@ def cmd_cost(
     shafts: int = typer.Option(2, "--shafts"),
     shaft_cost: float = typer.Option(5_000_000.0, "--shaftcost"),
 ) -> None:
+    from .cost import CostInputs, tunnel_cost
+
     c = tunnel_cost(CostInputs(length_m=length, diameter_m=D, complexity=complexity, shaft_count=shafts, shaft_cost_usd=shaft_cost))
-    console.print(Panel(f"Tunnel: ${c.tunnel_usd:,.0f}\nShafts: ${c.shafts_usd:,.0f}\nTotal: ${c.total_usd:,.0f}", title="Tunnel Cost"))
+    _show(
+        f"Tunnel: ${c.tunnel_usd:,.0f}\nShafts: ${c.shafts_usd:,.0f}\nTotal: ${c.total_usd:,.0f}",
+        "Tunnel Cost",
+    )
 
 
 @app.command("permits")
@@ -152,14 +226,61 @@ def cmd_permits(
     utilities: bool = typer.Option(True, "--utilities"),
     fire: bool = typer.Option(True, "--fire"),
 ) -> None:
+    from .permits import PermitsInputs, permits_check
+
     pr = permits_check(PermitsInputs(nepa_or_ceqa=envdoc, usace_404_401=usace, groundwater_discharge=gw_discharge, railroad_coord=rr, utility_relocations=utilities, fire_authority=fire))
-    console.print(Panel(("READY" if pr.ready else "MISSING: " + ", ".join(pr.missing)), title="Permits Checklist"))
+    _show(("READY" if pr.ready else "MISSING: " + ", ".join(pr.missing)), "Permits Checklist")
 
 
 @app.command("templates")
 def cmd_templates(folder: Path = typer.Option(Path("templates"), "--folder")) -> None:
+    from .reports import write_templates
+
     write_templates(folder)
-    console.print(Panel(f"Wrote templates to {folder}", title="Templates"))
+    _show(f"Wrote templates to {folder}", "Templates")
+
+
+@app.command("batch")
+def cmd_batch(
+    kind: str = typer.Argument(..., help="Template kind: rmr, inflow, settlement or cost"),
+    input_path: Path = typer.Option(..., "--input", help="Filled-in template CSV"),
+    output_path: Path = typer.Option(..., "--out", help="Result CSV"),
+    chunk_rows: int = typer.Option(100_000, "--chunk-rows", help="Rows per chunk"),
+) -> None:
+    from .batch import run_batch
+
+    try:
+        report = run_batch(kind, input_path, output_path, chunk_rows=chunk_rows)  # type: ignore[arg-type]
+    except ValueError as exc:
+        _show(str(exc), "Batch", style="error")
+        raise typer.Exit(code=1)
+    _show(f"{report.summary()}\nWrote {output_path}", f"Batch ({kind})")
+
+
+@app.command("serve")
+def cmd_serve(
+    socket_path: Path | None = typer.Option(
+        None, "--socket", help="Listen on this Unix socket instead of stdin/stdout"
+    ),
+    window_ms: float = typer.Option(2.0, "--window-ms", help="Micro-batching window per op"),
+    max_batch: int = typer.Option(
+        4096, "--max-batch", help="Evaluate early once this many requests of an op are pending"
+    ),
+) -> None:
+    """Keep one process warm and answer newline-delimited JSON requests: {"id", "op", "args"}."""
+    from .serve import run_server
+
+    if socket_path is not None:
+        typer.echo(f"Listening on {socket_path}", err=True)
+    try:
+        stats = run_server(socket_path, window_ms=window_ms, max_batch=max_batch)
+    except ValueError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=1)
+    typer.echo(
+        f"Served {stats.requests} request(s) in {stats.batches} batch(es), {stats.errors} error(s)",
+        err=True,
+    )
 
 
 def main() -> None:  # pragma: no cover
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .utils import floor_at
+
 @dataclass(frozen=True)
 class CostInputs:
     length_m: float
@@ -23,3 +28,33 @@ def tunnel_cost(inp: CostInputs) -> CostResult:
     tun = unit * inp.length_m * max(0.5, inp.complexity)
     shafts = inp.shaft_count * inp.shaft_cost_usd
     return CostResult(tunnel_usd=float(tun), shafts_usd=float(shafts), total_usd=float(tun + shafts))
+
+@dataclass(frozen=True, eq=False)
+class CostBatchResult:
+    tunnel_usd: NDArray[np.float64]
+    shafts_usd: NDArray[np.float64]
+    total_usd: NDArray[np.float64]
+
+def tunnel_costs(
+    length_m: ArrayLike,
+    diameter_m: ArrayLike,
+    complexity: ArrayLike = 1.0,
+    shaft_count: ArrayLike = 2,
+    shaft_cost_usd: ArrayLike = 5_000_000.0,
+    unit_cost_usd_per_m_small: ArrayLike = 20_000.0,
+    unit_cost_usd_per_m_large: ArrayLike = 40_000.0,
+) -> CostBatchResult:
+    """
+    Vectorized tunnel_cost with the same diameter unit-rate switch and complexity floor.
+    """
+    columns = (
+        length_m, diameter_m, complexity, shaft_count, shaft_cost_usd,
+        unit_cost_usd_per_m_small, unit_cost_usd_per_m_large,
+    )
+    L, D, cx, n, sc, us, ul = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in columns)
+    )
+    unit = np.where(D >= 5.0, ul, us)
+    tun = unit * L * floor_at(cx, 0.5)
+    shafts = n * sc
+    return CostBatchResult(tunnel_usd=tun, shafts_usd=shafts, total_usd=tun + shafts)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from dataclasses import MISSING, fields
+import math
+from typing import Any, Iterator, Literal, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .cost import CostInputs, tunnel_costs
+
+Sense = Literal["min", "max"]
+Columns = dict[str, NDArray[Any]]
+
+SWEEP_AXES: tuple[str, ...] = tuple(f.name for f in fields(CostInputs))
+RESULT_COLUMNS: tuple[str, ...] = ("tunnel_usd", "shafts_usd", "total_usd")
+
+def _axes(grid: Mapping[str, ArrayLike]) -> dict[str, NDArray[np.float64]]:
+    unknown = [k for k in grid if k not in SWEEP_AXES]
+    if unknown:
+        raise ValueError(
+            f"Unknown sweep axes: {', '.join(unknown)}. Supported: {', '.join(SWEEP_AXES)}"
+        )
+    axes: dict[str, NDArray[np.float64]] = {}
+    for f in fields(CostInputs):
+        if f.name in grid:
+            values = np.atleast_1d(np.asarray(grid[f.name], dtype=np.float64))
+            if values.ndim != 1 or values.size == 0:
+                raise ValueError(f"Sweep axis '{f.name}' must be a non-empty 1-D sequence")
+            axes[f.name] = values
+        elif f.default is MISSING:
+            raise ValueError(f"Sweep grid needs values for '{f.name}'")
+        else:
+            axes[f.name] = np.array([float(f.default)])  # type: ignore[arg-type]
+    return axes
+
+def grid_size(grid: Mapping[str, ArrayLike]) -> int:
+    return math.prod(a.size for a in _axes(grid).values())
+
+def iter_cost_grid(grid: Mapping[str, ArrayLike], chunk_size: int = 1_000_000) -> Iterator[Columns]:
+    """
+    Evaluate tunnel_cost over the Cartesian product of `grid` lazily, yielding
+    columnar chunks of at most `chunk_size` scenarios. Axes not given take the
+    CostInputs defaults. Each chunk carries the flat scenario index as "scenario".
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be > 0")
+    axes = _axes(grid)
+    shape = tuple(a.size for a in axes.values())
+    total = math.prod(shape)
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total), dtype=np.int64)
+        index = np.unravel_index(flat, shape)
+        cols: Columns = {name: values[i] for (name, values), i in zip(axes.items(), index)}
+        res = tunnel_costs(*(cols[name] for name in SWEEP_AXES))
+        cols["tunnel_usd"] = res.tunnel_usd
+        cols["shafts_usd"] = res.shafts_usd
+        cols["total_usd"] = res.total_usd
+        cols["scenario"] = flat
+        yield cols
+
+def _take(cols: Columns, idx: NDArray[np.intp]) -> Columns:
+    return {k: v[idx] for k, v in cols.items()}
+
+def _concat(a: Columns | None, b: Columns) -> Columns:
+    return b if a is None else {k: np.concatenate([a[k], b[k]]) for k in b}
+
+def top_k_costs(
+    grid: Mapping[str, ArrayLike],
+    k: int = 100,
+    by: str = "total_usd",
+    sense: Sense = "min",
+    chunk_size: int = 1_000_000,
+) -> Columns:
+    """The k best scenarios by one column, in bounded memory (ties broken by scenario index)."""
+    if k <= 0:
+        raise ValueError("k must be > 0")
+    best: Columns | None = None
+    for chunk in iter_cost_grid(grid, chunk_size):
+        cand = _concat(best, chunk)
+        key = cand[by] if sense == "min" else -cand[by]
+        if key.size > k:
+            keep = np.argpartition(key, k - 1)[:k]
+            cand = _take(cand, keep)
+        best = cand
+    assert best is not None
+    key = best[by] if sense == "min" else -best[by]
+    return _take(best, np.lexsort((best["scenario"], key)))
+
+def pareto_mask(objectives: NDArray[np.float64]) -> NDArray[np.bool_]:
+    """
+    Non-dominated rows of an (n, m) matrix of objectives to minimize. Exact duplicates
+    keep their first row only. Objectives must be finite.
+    """
+    if not np.all(np.isfinite(objectives)):
+        # a NaN row is neither dominated nor dominating, so the elimination loop would never end
+        raise ValueError("objectives must be finite")
+    n = objectives.shape[0]
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    span = np.ptp(objectives, axis=0)
+    scores = (objectives / np.where(span > 0, span, 1.0)).sum(axis=1)
+    alive = np.arange(n)
+    while alive.size:
+        # The minimum of a positive-weighted sum is always Pareto-optimal.
+        j = alive[np.argmin(scores[alive])]
+        keep[j] = True
+        dominated = np.all(objectives[alive] >= objectives[j], axis=1)
+        alive = alive[~dominated]
+    return keep
+
+def pareto_costs(
+    grid: Mapping[str, ArrayLike],
+    objectives: Sequence[tuple[str, Sense]] = (("total_usd", "min"), ("diameter_m", "max")),
+    chunk_size: int = 1_000_000,
+) -> Columns:
+    """
+    Pareto-optimal scenarios of the sweep for the given (column, "min"/"max") objectives.
+    Only the running front is kept between chunks. Rows are sorted by the first objective.
+    """
+    if not objectives:
+        raise ValueError("need at least one objective")
+    front: Columns | None = None
+    for chunk in iter_cost_grid(grid, chunk_size):
+        cand = _concat(front, chunk)
+        obj = np.column_stack([cand[c] if s == "min" else -cand[c] for c, s in objectives])
+        front = _take(cand, np.flatnonzero(pareto_mask(obj)))
+    assert front is not None
+    c0, s0 = objectives[0]
+    key = front[c0] if s0 == "min" else -front[c0]
+    return _take(front, np.lexsort((front["scenario"], key)))
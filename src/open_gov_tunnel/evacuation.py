@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import heapq
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .fire_safety import EgressInputs, egress_screen
+
+@dataclass(frozen=True)
+class EvacuationInputs:
+    egress: EgressInputs
+    occupants: int
+    speed_sd_mps: float = 0.3           # normal about egress.walkway_speed_mps, floored at 0.1 m/s
+    pre_movement_max_s: float = 60.0    # uniform 0..max delay before walking
+    door_flow_pps: float = 1.3          # persons per second through one cross-passage door
+    portal_flow_pps: float = math.inf   # portals are unconstrained by default
+
+@dataclass(frozen=True, eq=False)
+class EvacuationResult:
+    clear_times_s: NDArray[np.float64]      # per replicate: time the last occupant is out
+    egress_times_s: NDArray[np.float64]     # per occupant, all replicates pooled
+    max_queue: NDArray[np.int64]            # per replicate: longest queue at any door
+    exits_m: NDArray[np.float64]            # exit chainages (portals and cross-passages)
+
+    def clear_time_quantile(self, p: float) -> float:
+        return float(np.quantile(self.clear_times_s, p))
+
+def exit_positions(
+    inp: EgressInputs, exit_chainages_m: ArrayLike | None = None
+) -> tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """
+    Sorted exit chainages and a flag for the portals among them. Given chainages are used as
+    the full exit layout (those at 0 or tunnel_length_m are portals); otherwise the portals
+    plus the cross-passages required by egress_screen, evenly spaced.
+    """
+    if exit_chainages_m is not None:
+        pos = np.unique(np.asarray(exit_chainages_m, dtype=np.float64))
+        if pos.ndim != 1 or pos.size == 0:
+            raise ValueError("exit_chainages_m must be a non-empty 1-D array")
+        if not (np.all(np.isfinite(pos)) and pos[0] >= 0.0 and pos[-1] <= inp.tunnel_length_m):
+            raise ValueError("exit chainages must lie within the tunnel")
+        return pos, (pos == 0.0) | (pos == inp.tunnel_length_m)
+    n = egress_screen(inp).required_passages
+    pos = np.linspace(0.0, inp.tunnel_length_m, n + 2)
+    portal = np.zeros(n + 2, dtype=bool)
+    portal[[0, -1]] = True
+    return pos, portal
+
+_ARRIVE, _DEPART = 0, 1
+
+def _simulate_once(
+    inp: EvacuationInputs,
+    exits: NDArray[np.float64],
+    service_s: NDArray[np.float64],
+    rng: np.random.Generator,
+) -> tuple[NDArray[np.float64], int]:
+    n = inp.occupants
+    x = rng.uniform(0.0, inp.egress.tunnel_length_m, n)
+    speed = np.maximum(0.1, rng.normal(inp.egress.walkway_speed_mps, inp.speed_sd_mps, n))
+    start = rng.uniform(0.0, inp.pre_movement_max_s, n)
+    door = np.searchsorted(exits, x)
+    door = np.clip(door, 1, exits.size - 1)
+    door = np.where(x - exits[door - 1] <= exits[door] - x, door - 1, door)
+    arrive = start + np.abs(exits[door] - x) / speed
+
+    events: list[tuple[float, int, int]] = [(float(t), _ARRIVE, i) for i, t in enumerate(arrive)]
+    heapq.heapify(events)
+    busy = np.zeros(exits.size, dtype=bool)
+    queues: list[deque[int]] = [deque() for _ in range(exits.size)]
+    done = np.empty(n)
+    max_queue = 0
+    door_of = door.tolist()
+    while events:
+        t, kind, i = heapq.heappop(events)
+        d = door_of[i]
+        if kind == _ARRIVE:
+            if busy[d]:
+                queues[d].append(i)
+                max_queue = max(max_queue, len(queues[d]))
+            elif service_s[d] == 0.0:
+                done[i] = t
+            else:
+                busy[d] = True
+                heapq.heappush(events, (t + service_s[d], _DEPART, i))
+        else:
+            done[i] = t
+            if queues[d]:
+                heapq.heappush(events, (t + service_s[d], _DEPART, queues[d].popleft()))
+            else:
+                busy[d] = False
+    return done, max_queue
+
+def simulate_evacuation(
+    inp: EvacuationInputs,
+    replicates: int = 20,
+    seed: int = 0,
+    exit_chainages_m: ArrayLike | None = None,
+) -> EvacuationResult:
+    """
+    Discrete-event evacuation of a tunnel through the exits at exit_chainages_m (portals and
+    cross-passages), or the even egress_screen layout when they are omitted.
+
+    Occupants start uniformly along the tunnel, wait a pre-movement delay, walk at a
+    sampled speed to the nearest exit and queue FIFO at its door, which passes one
+    person every 1/door_flow_pps seconds. Events are processed from a heap.
+    """
+    if inp.occupants <= 0 or replicates <= 0:
+        raise ValueError("occupants and replicates must be > 0")
+    if inp.door_flow_pps <= 0 or inp.portal_flow_pps <= 0:
+        raise ValueError("door flows must be > 0")
+    exits, portal = exit_positions(inp.egress, exit_chainages_m)
+    service_s = np.where(portal, 1.0 / inp.portal_flow_pps, 1.0 / inp.door_flow_pps)
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(replicates)]
+    clear = np.empty(replicates)
+    queues = np.empty(replicates, dtype=np.int64)
+    times = []
+    for r, rng in enumerate(rngs):
+        done, queues[r] = _simulate_once(inp, exits, service_s, rng)
+        clear[r] = done.max()
+        times.append(done)
+    return EvacuationResult(
+        clear_times_s=clear, egress_times_s=np.concatenate(times), max_queue=queues, exits_m=exits
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .settlement import SettlementInputs, settlement_trough
+from .utils import norm_cdf, norm_tail_z
+
+@dataclass(frozen=True, eq=False)
+class FaceUpdate:
+    face_m: float
+    updated: NDArray[np.intp]     # receptor indices whose stored value changed
+    evaluated: int                # receptors re-evaluated inside the face window
+
+def longitudinal_settlement(
+    inp: SettlementInputs,
+    chainage_m: ArrayLike,
+    offset_m: ArrayLike,
+    face_m: float,
+    start_m: float = 0.0,
+) -> NDArray[np.float64]:
+    """
+    3D greenfield settlement for a face at `face_m` on a drive launched at `start_m`
+    (Attewell & Woodman): the transverse trough of settlement_trough multiplied by
+    Phi((y - start)/i) - Phi((y - face)/i), so S = Smax/2 directly above the face.
+    """
+    tr = settlement_trough(inp)
+    y = np.asarray(chainage_m, dtype=np.float64)
+    x = np.asarray(offset_m, dtype=np.float64)
+    transverse = tr.Smax_m * np.exp(-(x ** 2) / (2.0 * tr.i_m ** 2))
+    return transverse * (norm_cdf((y - start_m) / tr.i_m) - norm_cdf((y - face_m) / tr.i_m))
+
+class FaceAdvanceSettlement:
+    """
+    Incrementally maintained settlement field for an advancing face.
+
+    Receptors are kept sorted by chainage. On each advance only receptors inside the
+    window [previous face - z*i, new face + z*i] are re-evaluated, where z is chosen so
+    that the longitudinal tail outside it is below tol_m/2, and only those whose value
+    moved by more than tol_m/2 are written. Every stored value therefore stays within
+    tol_m of longitudinal_settlement for the current face.
+    """
+
+    def __init__(
+        self,
+        inp: SettlementInputs,
+        chainage_m: ArrayLike,
+        offset_m: ArrayLike,
+        start_m: float = 0.0,
+        tol_m: float = 1e-4,
+    ) -> None:
+        if tol_m <= 0:
+            raise ValueError("tol_m must be > 0")
+        y = np.asarray(chainage_m, dtype=np.float64)
+        x = np.asarray(offset_m, dtype=np.float64)
+        if y.shape != x.shape or y.ndim != 1:
+            raise ValueError("chainage_m and offset_m must be 1-D arrays of equal length")
+        tr = settlement_trough(inp)
+        self.inputs = inp
+        self.start_m = float(start_m)
+        self.tol_m = float(tol_m)
+        self.face_m = float(start_m)
+        self.i_m = tr.i_m
+        self._order = np.argsort(y, kind="stable")
+        self._y = y[self._order]
+        self._transverse = tr.Smax_m * np.exp(-(x[self._order] ** 2) / (2.0 * tr.i_m ** 2))
+        self._start_term = norm_cdf((self._y - self.start_m) / tr.i_m)
+        self._values = np.zeros_like(self._y)
+        self._reach_m = norm_tail_z(0.5 * self.tol_m / tr.Smax_m) * tr.i_m if tr.Smax_m > 0 else 0.0
+
+    @property
+    def settlement_m(self) -> NDArray[np.float64]:
+        """Current stored settlement in the caller's receptor order."""
+        out = np.empty_like(self._values)
+        out[self._order] = self._values
+        return out
+
+    def advance(self, face_m: float) -> FaceUpdate:
+        if face_m < self.face_m:
+            raise ValueError("face position must not move backwards")
+        lo = np.searchsorted(self._y, self.face_m - self._reach_m, side="left")
+        hi = np.searchsorted(self._y, face_m + self._reach_m, side="right")
+        self.face_m = float(face_m)
+        new = self._transverse[lo:hi] * (
+            self._start_term[lo:hi] - norm_cdf((self._y[lo:hi] - self.face_m) / self.i_m)
+        )
+        changed = np.flatnonzero(np.abs(new - self._values[lo:hi]) > 0.5 * self.tol_m)
+        self._values[lo + changed] = new[changed]
+        return FaceUpdate(
+            face_m=self.face_m, updated=self._order[lo + changed], evaluated=int(hi - lo)
+        )
+
+    def run(self, faces_m: Iterable[float]) -> Iterator[FaceUpdate]:
+        """Advance through successive face positions (e.g. one per day), yielding each update."""
+        for f in faces_m:
+            yield self.advance(f)
@@ -3,6 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .utils import floor_at
+
 @dataclass(frozen=True)
 class EgressInputs:
     tunnel_length_m: float
@@ -20,3 +25,21 @@ def egress_screen(inp: EgressInputs) -> EgressResult:
     # worst-case egress distance ~ spacing/2
     t = (inp.max_spacing_m / 2.0) / max(0.1, inp.walkway_speed_mps)
     return EgressResult(required_passages=int(n), max_egress_time_s=float(t), spacing_ok=(n >= 0))
+
+@dataclass(frozen=True, eq=False)
+class EgressBatchResult:
+    required_passages: NDArray[np.int64]
+    max_egress_time_s: NDArray[np.float64]
+    spacing_ok: NDArray[np.bool_]
+
+def egress_screens(
+    tunnel_length_m: ArrayLike, max_spacing_m: ArrayLike = 152.0, walkway_speed_mps: ArrayLike = 1.0
+) -> EgressBatchResult:
+    """
+    Vectorized egress_screen.
+    """
+    columns = (tunnel_length_m, max_spacing_m, walkway_speed_mps)
+    L, s, v = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in columns))
+    n = np.maximum(0, np.ceil(L / s) - 1).astype(np.int64)
+    t = (s / 2.0) / floor_at(v, 0.1)
+    return EgressBatchResult(required_passages=n, max_egress_time_s=t, spacing_ok=n >= 0)
@@ -3,6 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .utils import cap_at, floor_at
+
 @dataclass(frozen=True)
 class InflowInputs:
     k_m_per_s: float
@@ -21,3 +26,35 @@ def inflow_per_length(inp: InflowInputs) -> InflowResult:
     q = (2.0 * math.pi * inp.k_m_per_s * inp.head_above_axis_m) / math.log(inp.influence_radius_m / inp.radius_m)
     q *= max(0.0, min(1.0, inp.drainage_factor))
     return InflowResult(q_per_m3_s=float(q))
+
+@dataclass(frozen=True, eq=False)
+class InflowBatchResult:
+    q_per_m3_s: NDArray[np.float64]   # NaN where the row is invalid
+    valid: NDArray[np.bool_]
+
+    @property
+    def rejected(self) -> int:
+        return int(self.valid.size - np.count_nonzero(self.valid))
+
+def inflows_per_length(
+    k_m_per_s: ArrayLike,
+    head_above_axis_m: ArrayLike,
+    radius_m: ArrayLike,
+    influence_radius_m: ArrayLike,
+    drainage_factor: ArrayLike = 1.0,
+) -> InflowBatchResult:
+    """
+    Vectorized inflow_per_length. Rows that the scalar function would reject with
+    ValueError are flagged in `valid` and yield NaN instead of raising.
+    """
+    k, h, r, R, df = np.broadcast_arrays(
+        *(
+            np.asarray(a, dtype=np.float64)
+            for a in (k_m_per_s, head_above_axis_m, radius_m, influence_radius_m, drainage_factor)
+        )
+    )
+    valid = ~((k <= 0) | (r <= 0) | (R <= r) | (h < 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        q = (2.0 * math.pi * k * h) / np.log(R / r)
+    q = q * floor_at(cap_at(df, 1.0), 0.0)
+    return InflowBatchResult(q_per_m3_s=np.where(valid, q, np.nan), valid=valid)
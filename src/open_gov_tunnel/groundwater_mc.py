@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .groundwater import InflowInputs, inflows_per_length
+
+@dataclass(frozen=True)
+class InflowUncertainty:
+    """
+    Input distributions around an InflowInputs base case: k and the influence radius
+    are lognormal with the base values as medians, head is normal about the base head.
+    """
+    base: InflowInputs
+    k_sigma_ln: float = 1.0
+    head_sd_m: float = 0.0
+    influence_radius_sigma_ln: float = 0.0
+
+class LogHistogram:
+    """
+    Fixed log-spaced histogram used as a mergeable streaming quantile sketch.
+    Quantiles are resolved to within one bin (10**(1/bins_per_decade) relative).
+    Exact zeros are counted separately. Values outside [lo, hi) are clamped into the end
+    bins and counted in `underflow` / `overflow`, so quantiles there are bounds only.
+    """
+
+    def __init__(self, lo: float = 1e-12, hi: float = 1e2, bins_per_decade: int = 200) -> None:
+        if not (0 < lo < hi) or bins_per_decade <= 0:
+            raise ValueError("need 0 < lo < hi and bins_per_decade > 0")
+        self.lo, self.hi, self.bins_per_decade = lo, hi, bins_per_decade
+        self._log_lo = math.log10(lo)
+        self.n_bins = int(math.ceil((math.log10(hi) - self._log_lo) * bins_per_decade))
+        self.counts = np.zeros(self.n_bins, dtype=np.int64)
+        self.zeros = 0
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, values: NDArray[np.float64]) -> None:
+        pos = values[values > 0]
+        self.zeros += int(values.size - pos.size)
+        b = np.floor((np.log10(pos) - self._log_lo) * self.bins_per_decade).astype(np.int64)
+        self.underflow += int(np.count_nonzero(b < 0))
+        self.overflow += int(np.count_nonzero(b >= self.n_bins))
+        self.counts += np.bincount(np.clip(b, 0, self.n_bins - 1), minlength=self.n_bins)
+
+    def merge(self, other: LogHistogram) -> None:
+        if (other.lo, other.hi, other.bins_per_decade) != (self.lo, self.hi, self.bins_per_decade):
+            raise ValueError("histograms have different binning")
+        self.counts += other.counts
+        self.zeros += other.zeros
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum()) + self.zeros
+
+    def quantile(self, p: float) -> float:
+        if not 0.0 <= p <= 1.0:
+            raise ValueError("p must be in [0, 1]")
+        total = self.total
+        if total == 0:
+            return float("nan")
+        rank = p * total
+        if self.zeros and rank <= self.zeros:
+            return 0.0
+        cum = np.cumsum(self.counts)
+        # rank 0 (p = 0 without zeros) starts at the first occupied bin, not at bin 0
+        if rank > self.zeros:
+            b = int(np.searchsorted(cum, rank - self.zeros, side="left"))
+        else:
+            b = int(np.argmax(self.counts > 0))
+        before = cum[b - 1] if b > 0 else 0
+        frac = (rank - self.zeros - before) / self.counts[b]
+        return float(10.0 ** (self._log_lo + (b + frac) / self.bins_per_decade))
+
+@dataclass(frozen=True)
+class InflowMCResult:
+    samples: int
+    rejected: int
+    mean_q_per_m3_s: float
+    min_q_per_m3_s: float
+    max_q_per_m3_s: float
+    histogram: LogHistogram
+
+    @property
+    def out_of_range(self) -> int:
+        """Valid samples outside the histogram range; quantiles among them are clamped."""
+        return self.histogram.underflow + self.histogram.overflow
+
+    def quantile(self, p: float) -> float:
+        return self.histogram.quantile(p)
+
+    @property
+    def p50(self) -> float:
+        return self.quantile(0.50)
+
+    @property
+    def p90(self) -> float:
+        return self.quantile(0.90)
+
+    @property
+    def p99(self) -> float:
+        return self.quantile(0.99)
+
+def _run_block(
+    unc: InflowUncertainty, n: int, seed: np.random.SeedSequence, bins_per_decade: int
+) -> tuple[LogHistogram, int, float, float, float]:
+    hist = LogHistogram(bins_per_decade=bins_per_decade)
+    rng = np.random.default_rng(seed)
+    b = unc.base
+    k = b.k_m_per_s * np.exp(unc.k_sigma_ln * rng.standard_normal(n))
+    head = b.head_above_axis_m + unc.head_sd_m * rng.standard_normal(n)
+    R = b.influence_radius_m * np.exp(unc.influence_radius_sigma_ln * rng.standard_normal(n))
+    res = inflows_per_length(k, head, b.radius_m, R, b.drainage_factor)
+    q = res.q_per_m3_s[res.valid]
+    hist.add(q)
+    if q.size == 0:
+        return hist, res.rejected, 0.0, math.inf, -math.inf
+    return hist, res.rejected, float(q.sum()), float(q.min()), float(q.max())
+
+def inflow_monte_carlo(
+    unc: InflowUncertainty,
+    n_samples: int,
+    seed: int = 0,
+    block_size: int = 1_000_000,
+    workers: int = 1,
+    bins_per_decade: int = 200,
+) -> InflowMCResult:
+    """
+    Seeded Monte Carlo of inflow_per_length evaluated in vectorized blocks.
+
+    Each block draws from its own child of SeedSequence(seed), so results depend on
+    (seed, n_samples, block_size) only and are identical for any number of workers.
+    Only per-block histograms are kept, so memory is bounded by block_size. Samples the
+    scalar function would reject (e.g. negative head, influence radius inside the
+    tunnel) are counted in `rejected` and excluded from the statistics.
+    """
+    if n_samples <= 0 or block_size <= 0:
+        raise ValueError("n_samples and block_size must be > 0")
+    n_blocks = math.ceil(n_samples / block_size)
+    sizes = [block_size] * (n_blocks - 1) + [n_samples - block_size * (n_blocks - 1)]
+    seeds = np.random.SeedSequence(seed).spawn(n_blocks)
+    if workers <= 1:
+        parts = [_run_block(unc, n, sd, bins_per_decade) for n, sd in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(
+                pool.map(_run_block, [unc] * n_blocks, sizes, seeds, [bins_per_decade] * n_blocks)
+            )
+    total = LogHistogram(bins_per_decade=bins_per_decade)
+    rejected = 0
+    q_sum, q_min, q_max = 0.0, math.inf, -math.inf
+    for h, rej, s, lo, hi in parts:
+        total.merge(h)
+        rejected += rej
+        q_sum += s
+        q_min, q_max = min(q_min, lo), max(q_max, hi)
+    valid = n_samples - rejected
+    return InflowMCResult(
+        samples=n_samples,
+        rejected=rejected,
+        mean_q_per_m3_s=q_sum / valid if valid else float("nan"),
+        min_q_per_m3_s=q_min if valid else float("nan"),
+        max_q_per_m3_s=q_max if valid else float("nan"),
+        histogram=total,
+    )
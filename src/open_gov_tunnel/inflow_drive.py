@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .groundwater import inflows_per_length
+
+@dataclass(frozen=True)
+class DriveInflowParams:
+    peak_factor: float = 3.0         # inflow at exposure relative to steady inflow_per_length
+    decay_days: float = 30.0         # e-folding time of the excess inflow after exposure
+    grout_delay_days: float = 14.0   # drainage_factor applies from this long after exposure
+    rel_tol: float = 1e-3            # transient excess below which a segment counts as steady
+
+    def settle_days(self) -> float:
+        """Time after exposure from which a segment's inflow is steady within rel_tol."""
+        excess = max(0.0, self.peak_factor - 1.0)
+        decay = self.decay_days * math.log(excess / self.rel_tol) if excess > self.rel_tol else 0.0
+        return max(self.grout_delay_days, decay)
+
+@dataclass(frozen=True, eq=False)
+class DriveInflowResult:
+    day: NDArray[np.float64]
+    face_m: NDArray[np.float64]
+    inflow_m3_s: NDArray[np.float64]      # total inflow into the drive at the end of each step
+    volume_m3: NDArray[np.float64]        # cumulative pumped volume
+    active_segments: NDArray[np.int64]    # segments still decaying or awaiting grout
+
+class DriveInflowSimulator:
+    """
+    Time-dependent inflow along an advancing drive.
+
+    A segment is exposed when the face passes its end. Its inflow per metre then is
+    q_ss * (1 + (peak_factor - 1) * exp(-(t - t_exp) / decay_days)), multiplied by the
+    segment drainage_factor once grouting is installed grout_delay_days later. q_ss is
+    inflow_per_length without drainage. Exposure times increase along the drive, so the
+    segments still changing form one contiguous window; each step evaluates only that
+    window and folds segments leaving it into a running steady total.
+    """
+
+    def __init__(
+        self,
+        chainage_m: ArrayLike,
+        length_m: ArrayLike,
+        k_m_per_s: ArrayLike,
+        head_above_axis_m: ArrayLike,
+        radius_m: ArrayLike,
+        influence_radius_m: ArrayLike,
+        drainage_factor: ArrayLike = 1.0,
+        params: DriveInflowParams = DriveInflowParams(),
+    ) -> None:
+        start = np.asarray(chainage_m, dtype=np.float64)
+        length = np.broadcast_to(np.asarray(length_m, dtype=np.float64), start.shape)
+        if start.ndim != 1 or np.any(np.diff(start) < 0) or np.any(length <= 0):
+            raise ValueError("segments must be ordered along the drive with positive lengths")
+        if np.any(np.diff(start + length) < 0):
+            # step() finds exposed segments by binary search on the ends
+            raise ValueError("segment ends must be ordered along the drive (no nested segments)")
+        steady = inflows_per_length(k_m_per_s, head_above_axis_m, radius_m, influence_radius_m, 1.0)
+        df = np.broadcast_to(np.asarray(drainage_factor, dtype=np.float64), start.shape)
+        self.params = params
+        self.rejected = steady.rejected
+        self._end = start + length
+        # m3/s per segment at q_ss
+        self._q_len = np.where(steady.valid, steady.q_per_m3_s, 0.0) * length
+        self._df = np.clip(df, 0.0, 1.0)
+        self._t_exp = np.full(start.shape, np.nan)
+        self._settle = params.settle_days()
+        self._lo = 0          # first segment still in the transient window
+        self._hi = 0          # one past the last exposed segment
+        self._steady_m3_s = 0.0
+        self._day = -math.inf
+
+    @property
+    def active_segments(self) -> int:
+        return self._hi - self._lo
+
+    def step(self, day: float, face_m: float) -> float:
+        """Advance the face to face_m at time `day` and return the total inflow (m3/s)."""
+        if day < self._day:
+            raise ValueError("day must not go backwards")
+        hi = int(np.searchsorted(self._end, face_m, side="right"))
+        if hi < self._hi:
+            raise ValueError("face position must not move backwards")
+        self._day = day
+        self._t_exp[self._hi:hi] = day
+        self._hi = hi
+        lo = self._lo
+        while lo < hi and day - self._t_exp[lo] >= self._settle:
+            lo += 1
+        if lo > self._lo:
+            self._steady_m3_s += float(np.sum(self._q_len[self._lo:lo] * self._df[self._lo:lo]))
+            self._lo = lo
+        w = slice(self._lo, self._hi)
+        age = day - self._t_exp[w]
+        factor = 1.0 + (self.params.peak_factor - 1.0) * np.exp(-age / self.params.decay_days)
+        grout = np.where(age >= self.params.grout_delay_days, self._df[w], 1.0)
+        return self._steady_m3_s + float(np.sum(self._q_len[w] * factor * grout))
+
+def simulate_drive(
+    sim: DriveInflowSimulator, face_m: ArrayLike, dt_days: float = 1.0
+) -> DriveInflowResult:
+    """Run the simulator with face_m[j] reached at day (j + 1) * dt_days; volumes use end rates."""
+    faces = np.asarray(face_m, dtype=np.float64)
+    days = np.arange(1, faces.size + 1, dtype=np.float64) * dt_days
+    inflow = np.empty(faces.size)
+    active = np.empty(faces.size, dtype=np.int64)
+    for j, (d, f) in enumerate(zip(days, faces)):
+        inflow[j] = sim.step(float(d), float(f))
+        active[j] = sim.active_segments
+    volume = np.cumsum(inflow * dt_days * 86_400.0)
+    return DriveInflowResult(
+        day=days, face_m=faces, inflow_m3_s=inflow, volume_m3=volume, active_segments=active
+    )
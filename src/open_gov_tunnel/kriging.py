@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .classification import Q_CATEGORY_THRESHOLDS, RMR_CLASS_THRESHOLDS
+from .utils import threshold_codes
+
+VARIOGRAM_MODELS = ("spherical", "exponential", "gaussian")
+
+@dataclass(frozen=True)
+class Variogram:
+    model: str = "spherical"
+    nugget: float = 0.0
+    sill: float = 1.0          # partial sill, added to the nugget
+    range_m: float = 100.0     # practical range for the exponential and gaussian models
+
+    def __post_init__(self) -> None:
+        if self.model not in VARIOGRAM_MODELS:
+            raise ValueError(
+                f"Unknown variogram model '{self.model}'. Supported: {', '.join(VARIOGRAM_MODELS)}"
+            )
+        if self.nugget < 0 or self.sill < 0 or self.range_m <= 0:
+            raise ValueError("nugget and sill must be >= 0 and range_m > 0")
+
+    def shape(self, h: NDArray[np.float64]) -> NDArray[np.float64]:
+        r = np.abs(h) / self.range_m
+        if self.model == "spherical":
+            return np.where(r < 1.0, 1.5 * r - 0.5 * r ** 3, 1.0)
+        if self.model == "exponential":
+            return 1.0 - np.exp(-3.0 * r)
+        return 1.0 - np.exp(-3.0 * r ** 2)
+
+    def __call__(self, h: ArrayLike) -> NDArray[np.float64]:
+        h = np.asarray(h, dtype=np.float64)
+        return np.where(h == 0, 0.0, self.nugget + self.sill * self.shape(h))
+
+def _sorted(
+    chainage_m: ArrayLike, values: ArrayLike
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    x = np.asarray(chainage_m, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64)
+    if x.shape != v.shape or x.ndim != 1:
+        raise ValueError("chainage_m and values must be 1-D arrays of equal length")
+    keep = np.isfinite(x) & np.isfinite(v)
+    order = np.argsort(x[keep], kind="stable")
+    return x[keep][order], v[keep][order]
+
+def experimental_variogram(
+    chainage_m: ArrayLike,
+    values: ArrayLike,
+    max_lag_m: float | None = None,
+    n_lags: int = 20,
+    max_pairs_per_point: int = 200,
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.int64]]:
+    """
+    Binned semivariance (lag centre, gamma, pair count) from pairs up to max_lag_m apart. Pairs are
+    taken from neighbours in sorted order, at most max_pairs_per_point per sample, not from all n^2.
+    The default max_lag_m is a third of the sampled length, or the typical distance those
+    neighbours span if shorter.
+    """
+    x, v = _sorted(chainage_m, values)
+    if x.size < 2:
+        raise ValueError("need at least two samples")
+    if max_lag_m is None:
+        max_lag = (x[-1] - x[0]) / 3.0
+        if x.size > max_pairs_per_point:
+            spread = np.median(x[max_pairs_per_point:] - x[:-max_pairs_per_point])
+            max_lag = min(max_lag, float(spread))
+    else:
+        max_lag = max_lag_m
+    if max_lag <= 0:
+        raise ValueError("max_lag_m must be > 0")
+    edges = np.linspace(0.0, max_lag, n_lags + 1)
+    total = np.zeros(n_lags)
+    pairs = np.zeros(n_lags, dtype=np.int64)
+    for j in range(1, min(max_pairs_per_point, x.size - 1) + 1):
+        d = x[j:] - x[:-j]
+        near = (d > 0) & (d <= max_lag)
+        if not near.any():
+            break
+        b = np.minimum((d[near] / max_lag * n_lags).astype(np.int64), n_lags - 1)
+        total += np.bincount(b, weights=0.5 * (v[j:] - v[:-j])[near] ** 2, minlength=n_lags)
+        pairs += np.bincount(b, minlength=n_lags)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gamma = total / pairs
+    return 0.5 * (edges[:-1] + edges[1:]), gamma, pairs
+
+def fit_variogram(
+    chainage_m: ArrayLike,
+    values: ArrayLike,
+    model: str = "spherical",
+    max_lag_m: float | None = None,
+    n_lags: int = 20,
+) -> Variogram:
+    """
+    Pair-count weighted least-squares fit of nugget, sill and range to the experimental variogram:
+    a scan over candidate ranges, each with a closed-form non-negative fit of nugget and sill.
+    """
+    lag, gamma, pairs = experimental_variogram(chainage_m, values, max_lag_m, n_lags)
+    ok = pairs > 0
+    if ok.sum() < 2:
+        raise ValueError("too few sample pairs to fit a variogram; pass one explicitly")
+    lag, gamma, w = lag[ok], gamma[ok], np.sqrt(pairs[ok])
+    best: tuple[float, Variogram] | None = None
+    for range_m in np.linspace(lag[-1] / 20.0, 2.0 * lag[-1], 80):
+        f = Variogram(model, 0.0, 1.0, float(range_m)).shape(lag)
+        A = np.column_stack([np.ones_like(f), f]) * w[:, None]
+        nugget, sill = np.linalg.lstsq(A, gamma * w, rcond=None)[0]
+        if nugget < 0 or sill < 0:  # fall back to the better single-term fit
+            if nugget < 0:
+                nugget, sill = 0.0, max(0.0, float((A[:, 1] @ (gamma * w)) / (A[:, 1] @ A[:, 1])))
+            else:
+                nugget, sill = float(np.average(gamma, weights=w ** 2)), 0.0
+        vg = Variogram(model, float(nugget), float(sill), float(range_m))
+        sse = float(np.sum(w ** 2 * (vg(lag) - gamma) ** 2))
+        if best is None or sse < best[0]:
+            best = (sse, vg)
+    assert best is not None
+    return best[1]
+
+@dataclass(frozen=True, eq=False)
+class KrigingResult:
+    estimate: NDArray[np.float64]       # NaN where no sample lies within max_distance_m
+    variance: NDArray[np.float64]
+    n_neighbours: NDArray[np.int64]
+
+def ordinary_kriging(
+    chainage_m: ArrayLike,
+    values: ArrayLike,
+    query_m: ArrayLike,
+    variogram: Variogram,
+    n_neighbours: int = 16,
+    max_distance_m: float = math.inf,
+    chunk_size: int = 8192,
+) -> KrigingResult:
+    """
+    Ordinary kriging along chainage from each query's nearest samples.
+
+    Samples are sorted once; the n_neighbours nearest to a query always lie within n_neighbours
+    positions either side of its searchsorted position, so each query examines 2 * n_neighbours
+    candidates. The (k + 1) x (k + 1) systems of a chunk of queries are solved together with
+    np.linalg.solve. Neighbours beyond max_distance_m get zero weight.
+    """
+    x, v = _sorted(chainage_m, values)
+    q = np.asarray(query_m, dtype=np.float64)
+    shape = q.shape
+    q = q.ravel()
+    n = x.size
+    if n == 0:
+        raise ValueError("no finite samples")
+    k = max(1, min(n_neighbours, n))
+    width = min(2 * k, n)
+    est = np.full(q.size, np.nan)
+    var = np.full(q.size, np.nan)
+    used = np.zeros(q.size, dtype=np.int64)
+    jitter = 1e-10 * max(variogram.nugget + variogram.sill, 1e-300)
+    for lo in range(0, q.size, chunk_size):
+        qc = q[lo:lo + chunk_size]
+        start = np.clip(np.searchsorted(x, qc) - k, 0, n - width)
+        cand = start[:, None] + np.arange(width)
+        dist = np.abs(x[cand] - qc[:, None])
+        if width > k:
+            pick = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        else:
+            pick = np.broadcast_to(np.arange(k), (qc.size, k))
+        idx = np.take_along_axis(cand, pick, axis=1)
+        d0 = np.take_along_axis(dist, pick, axis=1)
+        inside = d0 <= max_distance_m
+        m = qc.size
+        A = np.zeros((m, k + 1, k + 1))
+        A[:, :k, :k] = variogram(x[idx][:, :, None] - x[idx][:, None, :])
+        A[:, :k, :k] *= inside[:, :, None] & inside[:, None, :]
+        diag = np.arange(k)
+        A[:, diag, diag] = np.where(inside, -jitter, 1.0)  # excluded neighbours: w_j = 0
+        A[:, :k, k] = inside
+        A[:, k, :k] = inside
+        b = np.zeros((m, k + 1))
+        b[:, :k] = np.where(inside, variogram(d0), 0.0)
+        b[:, k] = 1.0
+        any_inside = inside.any(axis=1)
+        A[~any_inside, k, k] = 1.0   # keep the system regular; the estimate is masked below
+        sol = np.linalg.solve(A, b[:, :, None])[:, :, 0]
+        w, mu = sol[:, :k], sol[:, k]
+        est[lo:lo + m] = np.where(any_inside, np.sum(w * v[idx], axis=1), np.nan)
+        var_m = np.maximum(np.sum(w * b[:, :k], axis=1) + mu, 0.0)
+        var[lo:lo + m] = np.where(any_inside, var_m, np.nan)
+        used[lo:lo + m] = inside.sum(axis=1)
+    return KrigingResult(
+        estimate=est.reshape(shape), variance=var.reshape(shape), n_neighbours=used.reshape(shape)
+    )
+
+@dataclass(frozen=True, eq=False)
+class RockMassEstimate:
+    chainage_m: NDArray[np.float64]
+    rmr: NDArray[np.float64]              # clipped to 0..100 like rmr_score
+    rmr_variance: NDArray[np.float64]
+    rmr_class_code: NDArray[np.int8]      # index into RMR_CLASS_LABELS
+    log10_Q: NDArray[np.float64]
+    log10_Q_variance: NDArray[np.float64]
+    Q: NDArray[np.float64]                # 10**log10_Q, the median estimate
+    Q_category_code: NDArray[np.int8]     # index into Q_CATEGORY_LABELS
+    rmr_variogram: Variogram
+    q_variogram: Variogram
+
+def krige_rock_mass(
+    borehole_chainage_m: ArrayLike,
+    rmr: ArrayLike,
+    Q: ArrayLike,
+    query_m: ArrayLike,
+    rmr_variogram: Variogram | None = None,
+    q_variogram: Variogram | None = None,
+    n_neighbours: int = 16,
+    max_distance_m: float = math.inf,
+) -> RockMassEstimate:
+    """
+    RMR and Q between boreholes: RMR is kriged directly and Q in log10 space; missing variograms
+    are fitted (spherical) to the logged values.
+    """
+    ch = np.asarray(borehole_chainage_m, dtype=np.float64)
+    log_q = np.log10(np.maximum(np.asarray(Q, dtype=np.float64), 1e-6))
+    rv = rmr_variogram or fit_variogram(ch, rmr)
+    qv = q_variogram or fit_variogram(ch, log_q)
+    r = ordinary_kriging(ch, rmr, query_m, rv, n_neighbours, max_distance_m)
+    lq = ordinary_kriging(ch, log_q, query_m, qv, n_neighbours, max_distance_m)
+    rmr_est = np.clip(r.estimate, 0.0, 100.0)
+    q_est = 10.0 ** lq.estimate
+    return RockMassEstimate(
+        chainage_m=np.asarray(query_m, dtype=np.float64), rmr=rmr_est, rmr_variance=r.variance,
+        rmr_class_code=threshold_codes(rmr_est, RMR_CLASS_THRESHOLDS),
+        log10_Q=lq.estimate, log10_Q_variance=lq.variance, Q=q_est,
+        Q_category_code=threshold_codes(q_est, Q_CATEGORY_THRESHOLDS),
+        rmr_variogram=rv, q_variogram=qv,
+    )
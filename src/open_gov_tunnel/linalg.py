@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+MatVec = Callable[[NDArray[np.float64]], NDArray[np.float64]]
+
+@dataclass(frozen=True, eq=False)
+class CGResult:
+    x: NDArray[np.float64]
+    iterations: int
+    residual: float       # final relative residual ||b - Ax|| / ||b||
+    converged: bool
+
+def pcg(
+    matvec: MatVec,
+    b: NDArray[np.float64],
+    x0: NDArray[np.float64] | None = None,
+    diag: NDArray[np.float64] | None = None,
+    tol: float = 1e-10,
+    maxiter: int | None = None,
+) -> CGResult:
+    """
+    Jacobi-preconditioned conjugate gradients for a symmetric positive definite operator
+    given as a matrix-free `matvec`. `x0` warm-starts the iteration; `diag` is the
+    operator diagonal used as preconditioner (identity if omitted).
+    """
+    n = b.shape[0]
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=np.float64)
+    inv_d = np.ones(n) if diag is None else 1.0 / diag
+    b_norm = float(np.linalg.norm(b))
+    if b_norm == 0.0:
+        return CGResult(x=np.zeros(n), iterations=0, residual=0.0, converged=True)
+    r = b - matvec(x)
+    z = inv_d * r
+    p = z.copy()
+    rz = float(r @ z)
+    limit = maxiter if maxiter is not None else 10 * n
+    res = float(np.linalg.norm(r)) / b_norm
+    it = 0
+    while res > tol and it < limit:
+        Ap = matvec(p)
+        alpha = rz / float(p @ Ap)
+        x += alpha * p
+        r -= alpha * Ap
+        res = float(np.linalg.norm(r)) / b_norm
+        it += 1
+        if res <= tol:
+            break
+        z = inv_d * r
+        rz_new = float(r @ z)
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+    return CGResult(x=x, iterations=it, residual=res, converged=res <= tol)
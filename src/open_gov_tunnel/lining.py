@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 @dataclass(frozen=True)
 class LiningInputs:
     ground_pressure_kPa: float
@@ -21,3 +24,91 @@ def lining_thickness(inp: LiningInputs) -> LiningResult:
     t_req = (inp.ground_pressure_kPa * inp.radius_m) / (inp.phi_resistance * inp.fc_allow_kPa)
     t_use = max(inp.t_min_m, t_req)
     return LiningResult(t_req_m=float(t_use), OK=(t_req <= t_use + 1e-9))
+
+@dataclass(frozen=True, eq=False)
+class LiningBatchResult:
+    t_req_m: NDArray[np.float64]     # NaN where the row is invalid
+    OK: NDArray[np.bool_]
+    valid: NDArray[np.bool_]
+
+def lining_thicknesses(
+    ground_pressure_kPa: ArrayLike,
+    radius_m: ArrayLike,
+    phi_resistance: ArrayLike,
+    fc_allow_kPa: ArrayLike,
+    t_min_m: ArrayLike = 0.2,
+) -> LiningBatchResult:
+    """
+    Vectorized lining_thickness. Rows the scalar function rejects with ValueError
+    are flagged in `valid` (t_req_m NaN, OK False) instead of raising.
+    """
+    columns = (ground_pressure_kPa, radius_m, phi_resistance, fc_allow_kPa, t_min_m)
+    p, r, phi, fc, tmin = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in columns)
+    )
+    valid = ~((r <= 0) | (fc <= 0) | (phi <= 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_req = (p * r) / (phi * fc)
+    t_use = np.where(t_req > tmin, t_req, tmin)  # builtin max(t_min, t_req)
+    return LiningBatchResult(
+        t_req_m=np.where(valid, t_use, np.nan), OK=valid & (t_req <= t_use + 1e-9), valid=valid
+    )
+
+@dataclass(frozen=True, eq=False)
+class LiningEnvelope:
+    t_req_m: NDArray[np.float64]           # per section, governing thickness; NaN where invalid
+    governing_case: NDArray[np.int64]      # per section, governing load case column; -1 if invalid
+    OK: NDArray[np.bool_]
+    valid: NDArray[np.bool_]
+
+def lining_load_cases(
+    case_pressure_kPa: ArrayLike,
+    radius_m: ArrayLike,
+    phi_resistance: ArrayLike,
+    fc_allow_kPa: ArrayLike,
+    t_min_m: ArrayLike = 0.2,
+    chunk_pairs: int = 1 << 20,
+) -> LiningEnvelope:
+    """
+    lining_thickness for every section against every load case. Section arrays are 1D (n_sec);
+    case_pressure_kPa is (n_cases,) shared by all sections or (n_sec, n_cases). Load cases with
+    a NaN pressure are skipped. Sections are processed in chunks of about chunk_pairs
+    section/case pairs. Sections rejected by the scalar check, or without any finite load
+    case, are flagged in `valid` instead of raising.
+    """
+    columns = (radius_m, phi_resistance, fc_allow_kPa, t_min_m)
+    r, phi, fc, tmin = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=np.float64)) for a in columns)
+    )
+    if r.ndim != 1:
+        raise ValueError("section arrays must be 1D")
+    n_sec = r.size
+    p = np.asarray(case_pressure_kPa, dtype=np.float64)
+    if p.ndim == 1:
+        p = p[np.newaxis, :]
+    if p.ndim != 2 or p.shape[0] not in (1, n_sec):
+        raise ValueError("case_pressure_kPa must be (n_cases,) or (n_sections, n_cases)")
+    n_cases = p.shape[1]
+    sec_ok = ~((r <= 0) | (fc <= 0) | (phi <= 0))
+    governing = np.full(n_sec, -1, dtype=np.int64)
+    p_gov = np.full(n_sec, np.nan)
+    rows = n_sec if p.shape[0] == 1 else max(1, int(chunk_pairs) // max(1, n_cases))
+    if n_cases:
+        for lo in range(0, p.shape[0], rows):
+            block = p[lo:lo + rows]
+            filled = np.where(np.isnan(block), -np.inf, block)
+            # r, phi and fc are constant along a row, so the governing case is the largest pressure.
+            idx = np.argmax(filled, axis=1)
+            best = np.take_along_axis(filled, idx[:, np.newaxis], axis=1)[:, 0]
+            governing[lo:lo + rows] = idx   # a shared (1, n_cases) row broadcasts to every section
+            p_gov[lo:lo + rows] = np.where(np.isneginf(best), np.nan, best)
+    valid = sec_ok & ~np.isnan(p_gov)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_req = (p_gov * r) / (phi * fc)
+    t_use = np.where(t_req > tmin, t_req, tmin)  # builtin max(t_min, t_req)
+    return LiningEnvelope(
+        t_req_m=np.where(valid, t_use, np.nan),
+        governing_case=np.where(valid, governing, -1),
+        OK=valid & (t_req <= t_use + 1e-9),
+        valid=valid,
+    )
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .groundwater import inflows_per_length
+from .settlement import settlements_at_x
+
+ALERT = 1
+ALARM = 2
+RATE = 4
+
+def predicted_settlement(Smax_m: ArrayLike, i_m: ArrayLike, x_m: ArrayLike) -> NDArray[np.float64]:
+    """Predicted settlement at each marker from its section trough (settlement_at_x)."""
+    return settlements_at_x(Smax_m, i_m, x_m)
+
+def predicted_inflow(
+    k_m_per_s: ArrayLike,
+    head_above_axis_m: ArrayLike,
+    radius_m: ArrayLike,
+    influence_radius_m: ArrayLike,
+    length_m: ArrayLike,
+    drainage_factor: ArrayLike = 1.0,
+) -> NDArray[np.float64]:
+    """Predicted inflow (m3/s) per flow meter over its contributing length; NaN if invalid."""
+    res = inflows_per_length(
+        k_m_per_s, head_above_axis_m, radius_m, influence_radius_m, drainage_factor
+    )
+    return res.q_per_m3_s * np.asarray(length_m, dtype=np.float64)
+
+def trigger_levels(
+    predicted: ArrayLike, alert_frac: float = 0.8, alarm_frac: float = 1.0
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Alert and alarm levels as fractions of the predicted value (green/amber/red convention)."""
+    p = np.asarray(predicted, dtype=np.float64)
+    return alert_frac * p, alarm_frac * p
+
+# One block of flag changes: instrument, t_days, value and the new flags.
+_Events = tuple[NDArray[np.int64], NDArray[np.float64], NDArray[np.float64], NDArray[np.int8]]
+
+class InstrumentMonitor:
+    """
+    Streaming checks for a fixed set of instruments (settlement points, piezometers, convergence
+    arrays, flow meters), indexed 0..n-1.
+
+    Each instrument keeps its last `window` readings in a row of a 2-D ring buffer. A reading is
+    flagged ALERT or ALARM when value >= the instrument's level (levels are magnitudes, so readings
+    use a positive-is-worse convention), and RATE when |value - value rate_lag readings earlier| per
+    day exceeds rate_limit_per_day. Every check is constant time per reading. A change of an
+    instrument's flags is recorded as an event.
+    """
+
+    def __init__(
+        self,
+        alert_level: ArrayLike,
+        alarm_level: ArrayLike,
+        rate_limit_per_day: ArrayLike = math.inf,
+        window: int = 64,
+        rate_lag: int = 1,
+    ) -> None:
+        self.alert = np.asarray(alert_level, dtype=np.float64).copy()
+        n = self.alert.size
+        self.alarm = np.broadcast_to(np.asarray(alarm_level, dtype=np.float64), (n,)).copy()
+        rate = np.asarray(rate_limit_per_day, dtype=np.float64)
+        self.rate_limit = np.broadcast_to(rate, (n,)).copy()
+        if self.alert.ndim != 1:
+            raise ValueError("trigger levels must be 1-D, one per instrument")
+        if not 1 <= rate_lag < window:
+            raise ValueError("need 1 <= rate_lag < window")
+        self.window, self.rate_lag = window, rate_lag
+        self.t_days = np.full((n, window), np.nan)
+        self.values = np.full((n, window), np.nan)
+        self.count = np.zeros(n, dtype=np.int64)      # readings received per instrument
+        self.status = np.zeros(n, dtype=np.int8)      # flags of the latest reading
+        self._events: list[_Events] = []
+
+    def __len__(self) -> int:
+        return int(self.alert.size)
+
+    def ingest(self, instrument: int, t_days: float, value: float) -> int:
+        """Record one reading and return its flags."""
+        c = int(self.count[instrument])
+        flags = ALERT if value >= self.alert[instrument] else 0
+        if value >= self.alarm[instrument]:
+            flags |= ALARM
+        if c >= self.rate_lag:
+            slot = (c - self.rate_lag) % self.window
+            dt = t_days - self.t_days[instrument, slot]
+            moved = abs(value - self.values[instrument, slot])
+            if dt > 0 and moved > self.rate_limit[instrument] * dt:
+                flags |= RATE
+        slot = c % self.window
+        self.t_days[instrument, slot] = t_days
+        self.values[instrument, slot] = value
+        self.count[instrument] = c + 1
+        if flags != self.status[instrument]:
+            self.status[instrument] = flags
+            ids, t, v = np.array([instrument]), np.array([t_days]), np.array([value])
+            self._events.append((ids, t, v, np.array([flags], dtype=np.int8)))
+        return flags
+
+    def ingest_many(
+        self, instrument: ArrayLike, t_days: ArrayLike, value: ArrayLike
+    ) -> NDArray[np.int8]:
+        """
+        Vectorized ingest of a batch, equivalent to calling ingest for each reading in order
+        (readings of one instrument must be in time order within the batch). Returns the flags.
+        """
+        ids = np.asarray(instrument, dtype=np.int64)
+        t = np.asarray(t_days, dtype=np.float64)
+        v = np.asarray(value, dtype=np.float64)
+        m = ids.size
+        if m == 0:
+            return np.zeros(0, dtype=np.int8)
+        order = np.argsort(ids, kind="stable")
+        ids_s, t_s, v_s = ids[order], t[order], v[order]
+        first = np.ones(m, dtype=bool)
+        first[1:] = ids_s[1:] != ids_s[:-1]
+        starts = np.flatnonzero(first)
+        group_start = np.repeat(starts, np.diff(np.append(starts, m)))
+        rank = np.arange(m) - group_start
+        base = self.count[ids_s]
+        level = np.where(v_s >= self.alert[ids_s], ALERT, 0)
+        level |= np.where(v_s >= self.alarm[ids_s], ALARM, 0)
+
+        # the reading rate_lag back: earlier in this batch, or still in the ring buffer
+        lag = self.rate_lag
+        g = base + rank - lag
+        has_lag = g >= 0
+        in_batch = rank >= lag
+        src = np.where(in_batch, np.arange(m) - lag, 0)
+        ring_slot = np.where(has_lag, g, 0) % self.window
+        t_lag = np.where(in_batch, t_s[src], self.t_days[ids_s, ring_slot])
+        v_lag = np.where(in_batch, v_s[src], self.values[ids_s, ring_slot])
+        dt = t_s - t_lag
+        with np.errstate(invalid="ignore"):
+            fast = has_lag & (dt > 0) & (np.abs(v_s - v_lag) > self.rate_limit[ids_s] * dt)
+        flags = (level | np.where(fast, RATE, 0)).astype(np.int8)
+
+        # write only the last `window` readings of each instrument so ring slots do not collide
+        group_len = np.diff(np.append(starts, m))[np.searchsorted(starts, group_start)]
+        keep = rank >= group_len - self.window
+        slot = (base + rank) % self.window
+        self.t_days[ids_s[keep], slot[keep]] = t_s[keep]
+        self.values[ids_s[keep], slot[keep]] = v_s[keep]
+        self.count[ids_s[starts]] += group_len[starts]
+
+        prev = np.where(first, self.status[ids_s], np.roll(flags, 1))
+        changed = flags != prev
+        if changed.any():
+            # back from instrument-sorted to input order, as sequential ingest would record them
+            at = np.flatnonzero(changed)[np.argsort(order[changed], kind="stable")]
+            self._events.append((ids_s[at], t_s[at], v_s[at], flags[at]))
+        last = np.append(starts[1:], m) - 1
+        self.status[ids_s[last]] = flags[last]
+        out = np.empty(m, dtype=np.int8)
+        out[order] = flags
+        return out
+
+    def history(self, instrument: int) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Buffered (t_days, value) of one instrument, oldest first."""
+        c = int(self.count[instrument])
+        n = min(c, self.window)
+        slots = np.arange(c - n, c) % self.window
+        return self.t_days[instrument, slots], self.values[instrument, slots]
+
+    def events(self) -> dict[str, NDArray[np.generic]]:
+        """Flag changes so far: instrument, t_days, value and the new flags, in ingestion order."""
+        if not self._events:
+            return {
+                "instrument": np.zeros(0, dtype=np.int64),
+                "t_days": np.zeros(0),
+                "value": np.zeros(0),
+                "flags": np.zeros(0, dtype=np.int8),
+            }
+        cols = list(zip(*self._events))
+        names = ("instrument", "t_days", "value", "flags")
+        return {k: np.concatenate(c) for k, c in zip(names, cols)}
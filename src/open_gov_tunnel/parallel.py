@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass, replace
+import os
+import traceback
+from typing import Any, Callable, Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .alignment import Alignment, screen_alignment
+
+# Set in each worker by the pool initializer: (fn, columns, shared); tasks carry only row bounds.
+_WORKER_STATE: tuple[Callable[..., Any], dict[str, NDArray[Any]], dict[str, Any]] | None = None
+
+@dataclass(frozen=True)
+class ShardError:
+    shard: int
+    start: int
+    stop: int
+    error: str
+    traceback: str
+
+@dataclass(frozen=True, eq=False)
+class ShardedResult:
+    bounds: list[tuple[int, int]]
+    results: list[Any]          # per shard in input order; None where the shard failed
+    errors: list[ShardError]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def concat(self) -> Any:
+        """Join shard results back into one result in row order; raises if any shard failed."""
+        if self.errors:
+            e = self.errors[0]
+            raise RuntimeError(
+                f"{len(self.errors)} shard(s) failed; "
+                f"first: shard {e.shard} rows {e.start}:{e.stop}: {e.error}"
+            )
+        return concat_results(self.results)
+
+def concat_results(parts: list[Any]) -> Any:
+    """
+    Concatenate arrays, dicts of arrays or dataclasses of arrays; non-array fields must agree
+    across parts.
+    """
+    first = parts[0]
+    if isinstance(first, np.ndarray):
+        return np.concatenate(parts)
+    if isinstance(first, Mapping):
+        return {k: concat_results([p[k] for p in parts]) for k in first}
+    if is_dataclass(first) and not isinstance(first, type):
+        names = [f.name for f in fields(first) if f.init]
+        return replace(first, **{k: concat_results([getattr(p, k) for p in parts]) for k in names})
+    if all(p == first for p in parts[1:]):
+        return first
+    raise ValueError(f"cannot concatenate shard results of type {type(first).__name__}")
+
+def shard_bounds(n_rows: int, shard_rows: int) -> list[tuple[int, int]]:
+    if shard_rows <= 0:
+        raise ValueError("shard_rows must be > 0")
+    return [(lo, min(n_rows, lo + shard_rows)) for lo in range(0, n_rows, shard_rows)]
+
+def _init_worker(
+    fn: Callable[..., Any], columns: dict[str, NDArray[Any]], shared: dict[str, Any]
+) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (fn, columns, shared)
+
+def _call_shard(
+    fn: Callable[..., Any],
+    columns: dict[str, NDArray[Any]],
+    shared: dict[str, Any],
+    start: int,
+    stop: int,
+) -> tuple[bool, Any]:
+    try:
+        return True, fn({k: v[start:stop] for k, v in columns.items()}, **shared)
+    except Exception as exc:  # reported per shard, the remaining shards still run
+        return False, (f"{type(exc).__name__}: {exc}", traceback.format_exc())
+
+def _run_shard(start: int, stop: int) -> tuple[bool, Any]:
+    assert _WORKER_STATE is not None
+    return _call_shard(*_WORKER_STATE, start, stop)
+
+def run_sharded(
+    fn: Callable[..., Any],
+    columns: Mapping[str, ArrayLike],
+    shared: Mapping[str, Any] | None = None,
+    shard_rows: int = 100_000,
+    workers: int | None = None,
+) -> ShardedResult:
+    """
+    Call fn(shard_columns, **shared) on consecutive row shards of equal-length columns in a
+    process pool.
+
+    fn must be a module-level function. Columns and shared inputs are handed to each worker once
+    through the pool initializer (inherited without copying under fork), and each task carries only
+    its row bounds. Results come back in input order. A shard that raises is recorded in `errors`
+    and leaves None in `results`. workers=1 runs in-process; None uses os.cpu_count().
+    """
+    cols = {k: np.asarray(v) for k, v in columns.items()}
+    lengths = {v.shape[0] if v.ndim else -1 for v in cols.values()}
+    if len(lengths) != 1 or -1 in lengths:
+        raise ValueError("columns must be non-empty arrays of equal length")
+    bounds = shard_bounds(lengths.pop(), shard_rows)
+    shared_kw = dict(shared or {})
+    n_workers = min(workers or os.cpu_count() or 1, len(bounds)) or 1
+    if n_workers == 1:
+        outcomes = [_call_shard(fn, cols, shared_kw, lo, hi) for lo, hi in bounds]
+    else:
+        init = (fn, cols, shared_kw)
+        with ProcessPoolExecutor(n_workers, initializer=_init_worker, initargs=init) as pool:
+            futures = [pool.submit(_run_shard, lo, hi) for lo, hi in bounds]
+            outcomes = []
+            for fut in futures:
+                try:
+                    outcomes.append(fut.result())
+                except Exception as exc:  # e.g. BrokenProcessPool when a worker dies
+                    outcomes.append((False, (f"{type(exc).__name__}: {exc}", "")))
+    results: list[Any] = []
+    errors: list[ShardError] = []
+    for i, ((lo, hi), (ok, value)) in enumerate(zip(bounds, outcomes)):
+        results.append(value if ok else None)
+        if not ok:
+            error, tb = value
+            errors.append(ShardError(shard=i, start=lo, stop=hi, error=error, traceback=tb))
+    return ShardedResult(bounds=bounds, results=results, errors=errors)
+
+def _screen_alignment_shard(
+    columns: dict[str, NDArray[Any]], **kwargs: Any
+) -> dict[str, NDArray[Any]]:
+    return screen_alignment(Alignment(**columns), **kwargs)
+
+def screen_alignment_parallel(
+    al: Alignment, shard_rows: int = 100_000, workers: int | None = None, **kwargs: Any
+) -> dict[str, NDArray[Any]]:
+    """screen_alignment over row shards of an Alignment in worker processes; raises on failure."""
+    columns = {f.name: getattr(al, f.name) for f in fields(al) if getattr(al, f.name) is not None}
+    return run_sharded(
+        _screen_alignment_shard, columns, kwargs, shard_rows=shard_rows, workers=workers
+    ).concat()
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import functools
+import importlib
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+# "module:qualname" of every screening entry point the profiler wraps: all public functions of the
+# computational modules (generators excepted, their calls only build the iterator) plus the hot
+# methods. Nothing here is imported or patched until Profiler.enable(), so the disabled state costs
+# nothing; tests/test_profiling.py checks the list against the package.
+SCREENING_FUNCTIONS: tuple[str, ...] = (
+    "classification:rmr_score", "classification:q_system",
+    "classification:rmr_scores", "classification:q_values",
+    "classification:rmr_scores_frame", "classification:q_values_frame",
+    "support:natm_support_from_rmr", "support:natm_support_classes", "support:natm_support_takeoff",
+    "lining:lining_thickness", "lining:lining_thicknesses", "lining:lining_load_cases",
+    "groundwater:inflow_per_length", "groundwater:inflows_per_length",
+    "settlement:settlement_trough", "settlement:settlement_at_x",
+    "settlement:settlement_troughs", "settlement:settlements_at_x",
+    "ventilation:construction_vent_airflow",
+    "fire_safety:egress_screen", "fire_safety:egress_screens",
+    "tbm:tbm_select", "tbm:tbm_recommendations", "cost:tunnel_cost", "cost:tunnel_costs",
+    "permits:permits_check", "alignment:screen_alignment",
+    "settlement_field:settlement_field", "settlement_field:ReceptorIndex.query_segment",
+    "face_advance:longitudinal_settlement", "face_advance:FaceAdvanceSettlement.advance",
+    "seepage:SeepageSolver.solve", "vent_network:solve_network", "vent_network:check_headings",
+    "evacuation:simulate_evacuation", "evacuation:exit_positions",
+    "groundwater_mc:inflow_monte_carlo",
+    "inflow_drive:DriveInflowSimulator.step", "inflow_drive:simulate_drive",
+    "tbm_schedule:tbm_runs", "tbm_schedule:simulate_tbm_schedule",
+    "cost_sweep:grid_size", "cost_sweep:pareto_mask",
+    "cost_sweep:top_k_costs", "cost_sweep:pareto_costs",
+    "sensitivity:sobol_points", "sensitivity:sobol_indices",
+    "sensitivity:settlement_sensitivity", "sensitivity:inflow_sensitivity",
+    "kriging:experimental_variogram", "kriging:fit_variogram",
+    "kriging:ordinary_kriging", "kriging:krige_rock_mass",
+    "backanalysis:fit_troughs",
+    "backanalysis:TroughCalibrator.update", "backanalysis:TroughCalibrator.refit",
+    "monitoring:predicted_settlement", "monitoring:predicted_inflow", "monitoring:trigger_levels",
+    "monitoring:InstrumentMonitor.ingest", "monitoring:InstrumentMonitor.ingest_many",
+    "linalg:pcg",
+)
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+@dataclass(frozen=True)
+class FunctionStats:
+    name: str
+    calls: int
+    total_s: float        # cumulative, including nested screening calls
+    self_s: float         # excluding time spent in nested screening calls
+    max_s: float
+    alloc_bytes: int      # sum over calls of the peak traced allocation above the call's start
+    peak_alloc_bytes: int
+
+    @property
+    def per_call_s(self) -> float:
+        return self.total_s / self.calls if self.calls else 0.0
+
+class _Frame:
+    __slots__ = ("start_ns", "child_ns", "mem0", "peak")
+
+    def __init__(self, start_ns: int, mem0: int) -> None:
+        self.start_ns, self.child_ns, self.mem0, self.peak = start_ns, 0, mem0, mem0
+
+class Profiler:
+    """
+    Wraps the SCREENING_FUNCTIONS while enabled and records calls, timing and traced allocations.
+
+    enable() replaces each function in its defining module, in every already-imported package
+    module that bound it with `from .x import f`, and on classes for methods; disable() restores
+    the originals. Allocation tracking uses tracemalloc and slows calls noticeably; pass
+    trace_memory=False for timing only. With trace_events=True, every call is also kept (up to
+    max_events) for write_chrome_trace.
+    """
+
+    def __init__(
+        self,
+        functions: Iterable[str] = SCREENING_FUNCTIONS,
+        trace_memory: bool = True,
+        trace_events: bool = False,
+        max_events: int = 1_000_000,
+    ) -> None:
+        self.functions = tuple(functions)
+        self.trace_memory = trace_memory
+        self.trace_events = trace_events
+        self.max_events = max_events
+        self._stats: dict[str, list[float]] = {}
+        self._events: list[dict[str, Any]] = []
+        self._patched: list[tuple[Any, str, Any, Any]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+        self._t0_ns = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._patched)
+
+    def enable(self) -> Profiler:
+        if self._patched:
+            return self
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        for spec in self.functions:
+            mod_name, _, qualname = spec.partition(":")
+            owner: Any = importlib.import_module(f"{_PACKAGE}.{mod_name}")
+            *path, attr = qualname.split(".")
+            for part in path:
+                owner = getattr(owner, part)
+            original = owner.__dict__[attr]
+            wrapper = self._wrap(original, f"{mod_name}.{qualname}")
+            self._patch(owner, attr, original, wrapper)
+            if not path:
+                for mod in list(sys.modules.values()):
+                    ours = getattr(mod, "__name__", "").startswith(_PACKAGE + ".")
+                    if ours and mod is not owner and mod.__dict__.get(attr) is original:
+                        self._patch(mod, attr, original, wrapper)
+        self._t0_ns = time.perf_counter_ns()
+        return self
+
+    def _patch(self, owner: Any, attr: str, original: Any, wrapper: Any) -> None:
+        setattr(owner, attr, wrapper)
+        self._patched.append((owner, attr, original, wrapper))
+
+    def disable(self) -> None:
+        for owner, attr, original, wrapper in reversed(self._patched):
+            if owner.__dict__.get(attr) is wrapper:
+                setattr(owner, attr, original)
+        # modules imported while enabled may have bound a wrapper with `from .x import f`
+        originals = {id(w): o for _, _, o, w in self._patched}
+        for mod in list(sys.modules.values()):
+            if getattr(mod, "__name__", "").startswith(_PACKAGE + "."):
+                for attr, value in list(mod.__dict__.items()):
+                    if id(value) in originals and callable(value):
+                        setattr(mod, attr, originals[id(value)])
+        self._patched.clear()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self) -> Profiler:
+        return self.enable()
+
+    def __exit__(self, *exc: object) -> None:
+        self.disable()
+
+    def _wrap(self, fn: Callable[..., Any], name: str) -> Callable[..., Any]:
+        memory = self.trace_memory
+
+        @functools.wraps(fn)
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            stack: list[_Frame] | None = getattr(self._local, "stack", None)
+            if stack is None:
+                stack = self._local.stack = []
+            if memory and tracemalloc.is_tracing():
+                cur, peak = tracemalloc.get_traced_memory()
+                if stack:
+                    stack[-1].peak = max(stack[-1].peak, peak)
+                tracemalloc.reset_peak()
+            else:
+                cur = 0
+            frame = _Frame(time.perf_counter_ns(), cur)
+            stack.append(frame)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                end = time.perf_counter_ns()
+                stack.pop()
+                if memory and tracemalloc.is_tracing():
+                    frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+                alloc = frame.peak - frame.mem0
+                elapsed = end - frame.start_ns
+                if stack:
+                    stack[-1].child_ns += elapsed
+                    stack[-1].peak = max(stack[-1].peak, frame.peak)
+                self._record(name, elapsed, elapsed - frame.child_ns, alloc, frame.start_ns)
+
+        return profiled
+
+    def _record(self, name: str, elapsed_ns: int, self_ns: int, alloc: int, start_ns: int) -> None:
+        with self._lock:
+            s = self._stats.get(name)
+            if s is None:
+                s = self._stats[name] = [0, 0, 0, 0, 0, 0]
+            s[0] += 1
+            s[1] += elapsed_ns
+            s[2] += self_ns
+            s[3] = max(s[3], elapsed_ns)
+            s[4] += alloc
+            s[5] = max(s[5], alloc)
+            if self.trace_events and len(self._events) < self.max_events:
+                self._events.append({
+                    "name": name, "cat": _PACKAGE, "ph": "X",
+                    "pid": os.getpid(), "tid": threading.get_ident(),
+                    "ts": (start_ns - self._t0_ns) / 1e3, "dur": elapsed_ns / 1e3,
+                    "args": {"alloc_bytes": alloc},
+                })
+
+    def stats(self) -> list[FunctionStats]:
+        """Per-function statistics, hottest (largest self time) first."""
+        with self._lock:
+            rows = [
+                FunctionStats(
+                    name=k, calls=int(v[0]), total_s=v[1] / 1e9, self_s=v[2] / 1e9,
+                    max_s=v[3] / 1e9, alloc_bytes=int(v[4]), peak_alloc_bytes=int(v[5]),
+                )
+                for k, v in self._stats.items()
+            ]
+        return sorted(rows, key=lambda r: r.self_s, reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._events.clear()
+
+    def summary(self, top: int = 20) -> str:
+        rows = self.stats()[:top]
+        if not rows:
+            return "No screening functions were called."
+        width = max(len(r.name) for r in rows)
+        lines = [
+            f"{'function':<{width}}  {'calls':>8}  {'total s':>9}  {'self s':>9}  "
+            f"{'per call':>10}  {'alloc MB':>9}"
+        ]
+        for r in rows:
+            lines.append(
+                f"{r.name:<{width}}  {r.calls:>8}  {r.total_s:>9.4f}  {r.self_s:>9.4f}  "
+                f"{r.per_call_s * 1e3:>8.3f}ms  {r.alloc_bytes / 1e6:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write recorded calls in the Chrome trace-event format (chrome://tracing, Perfetto)."""
+        with self._lock:
+            payload = {"traceEvents": list(self._events), "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(payload))
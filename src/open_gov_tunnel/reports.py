@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-import pandas as pd
 
 def write_templates(folder: Path) -> None:
+    import pandas as pd  # deferred: pandas dominates CLI start-up time
+
     folder.mkdir(parents=True, exist_ok=True)
     pd.DataFrame(columns=["rqd","spacing_rating","condition_rating","groundwater_rating","orientation_rating","strength_rating"]).to_csv(folder / "rmr_template.csv", index=False)
     pd.DataFrame(columns=["k_m_per_s","head_above_axis_m","radius_m","influence_radius_m","drainage_factor"]).to_csv(folder / "inflow_template.csv", index=False)
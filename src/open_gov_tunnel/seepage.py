@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+import time
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .linalg import pcg
+
+class SeepageMesh:
+    """
+    Square finite-difference mesh of the tunnel cross-section, centred on the axis
+    (y up, metres). Cells inside the excavation are drained (head 0). Cells at or beyond
+    `influence_radius_m`, and cells at or above `surface_elevation_m` (river or lake bed,
+    saturated ground surface), are held at the far-field head. Other mesh edges are
+    no-flow. Cells within `lining_thickness_m` outside the excavation form the lining
+    ring, whose permeability represents partial drainage.
+
+    The mesh stores geometry and connectivity only and is reused for every section.
+    """
+
+    def __init__(
+        self,
+        radius_m: float,
+        cell_m: float,
+        half_width_m: float,
+        influence_radius_m: float | None = None,
+        surface_elevation_m: float | None = None,
+        lining_thickness_m: float = 0.0,
+    ) -> None:
+        if radius_m <= 0 or cell_m <= 0 or half_width_m <= radius_m + lining_thickness_m:
+            raise ValueError("need radius_m > 0, cell_m > 0 and half_width_m beyond the lining")
+        if influence_radius_m is None and surface_elevation_m is None:
+            raise ValueError(
+                "need influence_radius_m or surface_elevation_m for a far-field head boundary"
+            )
+        self.radius_m, self.cell_m = radius_m, cell_m
+        n = 2 * int(math.ceil(half_width_m / cell_m))
+        self.shape = (n, n)
+        c = (np.arange(n) + 0.5) * cell_m - n * cell_m / 2.0
+        self.x, self.y = np.meshgrid(c, c[::-1])
+        r = np.hypot(self.x, self.y)
+        self.tunnel = r <= radius_m
+        self.lining = (r > radius_m) & (r <= radius_m + lining_thickness_m)
+        outer = np.zeros(self.shape, dtype=bool)
+        if influence_radius_m is not None:
+            outer |= r >= influence_radius_m
+        if surface_elevation_m is not None:
+            outer |= self.y >= surface_elevation_m
+        self.outer = outer
+        free = ~(self.tunnel | outer)
+        self.free_flat = np.flatnonzero(free)
+        numbering = np.full(n * n, -1, dtype=np.int64)
+        numbering[self.free_flat] = np.arange(self.free_flat.size)
+        idx = np.arange(n * n).reshape(self.shape)
+        a = np.concatenate([idx[:, :-1].ravel(), idx[:-1, :].ravel()])
+        b = np.concatenate([idx[:, 1:].ravel(), idx[1:, :].ravel()])
+        fa, fb = numbering[a], numbering[b]
+        keep = (fa >= 0) | (fb >= 0)
+        self._a, self._b, self._fa, self._fb = a[keep], b[keep], fa[keep], fb[keep]
+        self._tunnel_flat = self.tunnel.ravel()
+        self._outer_flat = outer.ravel()
+
+    @property
+    def n_unknowns(self) -> int:
+        return int(self.free_flat.size)
+
+    def k_field(
+        self,
+        k_m_per_s: float,
+        layers: Sequence[tuple[float, float]] = (),
+        k_lining_m_per_s: float | None = None,
+    ) -> NDArray[np.float64]:
+        """
+        Cell permeability: `k_m_per_s` everywhere, overridden by each (top_elevation_m, k)
+        layer for cells below that elevation (apply from top to bottom), then by the lining.
+        """
+        k = np.full(self.shape, float(k_m_per_s))
+        for top, k_layer in sorted(layers, key=lambda lk: -lk[0]):
+            k[self.y < top] = k_layer
+        if k_lining_m_per_s is not None:
+            k[self.lining] = k_lining_m_per_s
+        return k
+
+@dataclass(frozen=True, eq=False)
+class SeepageResult:
+    q_per_m3_s: float             # inflow per metre of tunnel
+    head_m: NDArray[np.float64]   # head on the mesh
+    iterations: int
+    seconds: float
+    converged: bool
+
+class SeepageSolver:
+    """
+    Steady 2D seepage solver on a fixed SeepageMesh. Consecutive sections are warm-started
+    from the previous head field, which cuts CG iterations when properties change gradually
+    along the alignment.
+    """
+
+    def __init__(self, mesh: SeepageMesh, tol: float = 1e-8) -> None:
+        self.mesh = mesh
+        self.tol = tol
+        self._last: NDArray[np.float64] | None = None
+        self._last_head = 0.0
+
+    def solve(
+        self, k: NDArray[np.float64], head_above_axis_m: float, warm_start: bool = True
+    ) -> SeepageResult:
+        m = self.mesh
+        if k.shape != m.shape or np.any(k <= 0):
+            raise ValueError("k must match the mesh shape and be > 0")
+        t0 = time.perf_counter()
+        kf = k.ravel()
+        ka, kb = kf[m._a], kf[m._b]
+        cond = 2.0 * ka * kb / (ka + kb)   # harmonic mean; unit face length over unit spacing
+        fixed = np.where(m._outer_flat, head_above_axis_m, 0.0)
+        a_free, b_free = m._fa >= 0, m._fb >= 0
+        both = a_free & b_free
+        ia, ib, c_ff = m._fa[both], m._fb[both], cond[both]
+        n = m.n_unknowns
+        diag = np.bincount(m._fa[a_free], cond[a_free], n).astype(np.float64)
+        diag += np.bincount(m._fb[b_free], cond[b_free], n)
+        a_only, b_only = a_free & ~b_free, b_free & ~a_free
+        rhs = np.bincount(m._fa[a_only], cond[a_only] * fixed[m._b[a_only]], n).astype(np.float64)
+        rhs += np.bincount(m._fb[b_only], cond[b_only] * fixed[m._a[b_only]], n)
+
+        def matvec(x: NDArray[np.float64]) -> NDArray[np.float64]:
+            off = np.bincount(ia, c_ff * x[ib], n) + np.bincount(ib, c_ff * x[ia], n)
+            return (diag * x - off).astype(np.float64, copy=False)
+
+        x0 = None
+        if warm_start and self._last is not None and self._last_head > 0:
+            # The field is linear in the boundary head, so rescale the previous solution.
+            x0 = self._last * (head_above_axis_m / self._last_head)
+        cg = pcg(matvec, rhs, x0=x0, diag=diag, tol=self.tol, maxiter=20 * n)
+        self._last, self._last_head = cg.x, float(head_above_axis_m)
+        head = fixed.copy()
+        head[m.free_flat] = cg.x
+        # Inflow: flux across every face between a free cell and a drained tunnel cell.
+        into_a = m._tunnel_flat[m._a] & (m._fb >= 0)
+        into_b = m._tunnel_flat[m._b] & (m._fa >= 0)
+        q_a = np.sum(cond[into_a] * head[m._b[into_a]])
+        q = float(q_a + np.sum(cond[into_b] * head[m._a[into_b]]))
+        return SeepageResult(
+            q_per_m3_s=q,
+            head_m=head.reshape(m.shape),
+            iterations=cg.iterations,
+            seconds=time.perf_counter() - t0,
+            converged=cg.converged,
+        )
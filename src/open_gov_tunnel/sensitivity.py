@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Callable, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .groundwater import inflows_per_length
+from .settlement import settlement_troughs
+
+# Joe & Kuo (2008) primitive polynomials and initial direction numbers (new-joe-kuo-6.21201),
+# dimensions 2..16 as (degree s, coefficients a, m_1..m_s). Dimension 1 is the van der Corput
+# sequence.
+_JOE_KUO: tuple[tuple[int, int, tuple[int, ...]], ...] = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+)
+SOBOL_MAX_DIM = len(_JOE_KUO) + 1
+_BITS = 32
+
+def _direction_numbers(dim: int) -> NDArray[np.uint64]:
+    v = np.zeros((dim, _BITS), dtype=np.uint64)
+    v[0] = [1 << (_BITS - 1 - b) for b in range(_BITS)]
+    for j, (s, a, m) in enumerate(_JOE_KUO[: dim - 1], start=1):
+        row = [mi << (_BITS - 1 - b) for b, mi in enumerate(m)]
+        for b in range(s, _BITS):
+            x = row[b - s] ^ (row[b - s] >> s)
+            for k in range(1, s):
+                if (a >> (s - 1 - k)) & 1:
+                    x ^= row[b - k]
+            row.append(x)
+        v[j] = row
+    return v
+
+def sobol_points(
+    start: int, stop: int, dim: int, shift: NDArray[np.uint64] | None = None
+) -> NDArray[np.float64]:
+    """
+    Points start..stop-1 of the Sobol sequence in [0, 1)^dim, computed directly from the Gray code
+    of each index, so any block can be generated without the preceding ones. `shift` applies a
+    random digital shift (XOR) per dimension.
+    """
+    if not 1 <= dim <= SOBOL_MAX_DIM:
+        raise ValueError(f"dim must be in 1..{SOBOL_MAX_DIM}")
+    if not 0 <= start <= stop < 2**_BITS:
+        raise ValueError(f"indices must lie in [0, 2**{_BITS})")
+    v = _direction_numbers(dim)
+    i = np.arange(start, stop, dtype=np.uint64)
+    gray = i ^ (i >> np.uint64(1))
+    x = np.zeros((i.size, dim), dtype=np.uint64)
+    for b in range(_BITS):
+        bit = ((gray >> np.uint64(b)) & np.uint64(1)).astype(bool)
+        x[bit] ^= v[:, b]
+    if shift is not None:
+        x ^= shift
+    return (x.astype(np.float64) + 0.5) * 2.0**-_BITS
+
+@dataclass(frozen=True)
+class SobolInput:
+    name: str
+    low: float
+    high: float
+    log: bool = False      # log-uniform between low and high (e.g. hydraulic conductivity)
+
+    def transform(self, u: NDArray[np.float64]) -> NDArray[np.float64]:
+        if self.log:
+            lo, hi = math.log(self.low), math.log(self.high)
+            return np.exp(lo + u * (hi - lo))
+        return self.low + u * (self.high - self.low)
+
+@dataclass(frozen=True, eq=False)
+class SobolResult:
+    names: tuple[str, ...]
+    S1: NDArray[np.float64]
+    S1_ci: NDArray[np.float64]       # (d, 2) bootstrap percentile interval
+    ST: NDArray[np.float64]
+    ST_ci: NDArray[np.float64]
+    variance: float
+    n_base: int
+    n_evaluations: int
+
+    def summary(self) -> str:
+        width = max(len(n) for n in self.names)
+        lines = [f"{'input':<{width}}  {'S1':>7}  {'S1 CI':>17}  {'ST':>7}  {'ST CI':>17}"]
+        for k, n in enumerate(self.names):
+            s1_lo, s1_hi = self.S1_ci[k]
+            st_lo, st_hi = self.ST_ci[k]
+            lines.append(
+                f"{n:<{width}}  {self.S1[k]:>7.3f}  [{s1_lo:>6.3f}, {s1_hi:>6.3f}]"
+                f"  {self.ST[k]:>7.3f}  [{st_lo:>6.3f}, {st_hi:>6.3f}]"
+            )
+        lines.append(f"{self.n_evaluations:,} model evaluations (N = {self.n_base:,})")
+        return "\n".join(lines)
+
+Model = Callable[[dict[str, NDArray[np.float64]]], NDArray[np.float64]]
+
+def _indices(
+    fA: NDArray[np.float64],
+    fB: NDArray[np.float64],
+    fAB: NDArray[np.float64],
+    w: NDArray[np.float64] | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    # Saltelli et al. (2010) first-order and Jansen (1999) total-effect estimators;
+    # w are bootstrap weights.
+    if w is None:
+        w = np.ones(fA.size)
+    n = w.sum()
+    mean = (w @ fA + w @ fB) / (2 * n)
+    var = (w @ (fA - mean) ** 2 + w @ (fB - mean) ** 2) / (2 * n)
+    s1 = (w @ (fB[:, None] * (fAB - fA[:, None]))) / n / var
+    st = 0.5 * (w @ (fA[:, None] - fAB) ** 2) / n / var
+    return s1, st
+
+def sobol_indices(
+    model: Model,
+    inputs: Sequence[SobolInput],
+    n: int = 2**14,
+    block_size: int = 2**16,
+    n_bootstrap: int = 200,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> SobolResult:
+    """
+    First-order and total Sobol indices of a vectorized model by the Saltelli scheme.
+
+    A and B are the two halves of a digitally shifted 2d-dimensional Sobol sequence; the model is
+    evaluated on A, B and the d matrices A with column i from B, N(d + 2) evaluations in total.
+    Sample matrices exist one block of rows at a time; only the model outputs are kept.
+    """
+    d = len(inputs)
+    if d == 0 or 2 * d > SOBOL_MAX_DIM:
+        raise ValueError(f"need 1..{SOBOL_MAX_DIM // 2} inputs")
+    if n < 2 or block_size <= 0:
+        raise ValueError("n must be >= 2 and block_size > 0")
+    rng = np.random.default_rng(seed)
+    shift = rng.integers(0, 2**_BITS, 2 * d, dtype=np.uint64)
+    names = tuple(p.name for p in inputs)
+    fA = np.empty(n)
+    fB = np.empty(n)
+    fAB = np.empty((n, d))
+
+    def run(u: NDArray[np.float64]) -> NDArray[np.float64]:
+        x = {p.name: p.transform(u[:, k]) for k, p in enumerate(inputs)}
+        y = np.asarray(model(x), dtype=np.float64)
+        if y.shape != (u.shape[0],) or not np.all(np.isfinite(y)):
+            raise ValueError(
+                "model must return one finite value per sample; check the input ranges"
+            )
+        return y
+
+    for lo in range(0, n, block_size):
+        hi = min(n, lo + block_size)
+        pts = sobol_points(lo + 1, hi + 1, 2 * d, shift)   # skip the all-zero first point
+        a, b = pts[:, :d], pts[:, d:]
+        fA[lo:hi] = run(a)
+        fB[lo:hi] = run(b)
+        for i in range(d):
+            ab = a.copy()
+            ab[:, i] = b[:, i]
+            fAB[lo:hi, i] = run(ab)
+    var = float(np.var(np.concatenate([fA, fB])))
+    if var <= 0:
+        raise ValueError("model output has zero variance over the input ranges")
+    s1, st = _indices(fA, fB, fAB)
+    boot_s1 = np.empty((n_bootstrap, d))
+    boot_st = np.empty((n_bootstrap, d))
+    for r in range(n_bootstrap):
+        w = np.bincount(rng.integers(0, n, n), minlength=n).astype(np.float64)
+        boot_s1[r], boot_st[r] = _indices(fA, fB, fAB, w)
+    q = [(1 - confidence) / 2, (1 + confidence) / 2]
+    if n_bootstrap:
+        s1_ci, st_ci = np.quantile(boot_s1, q, axis=0).T, np.quantile(boot_st, q, axis=0).T
+    else:
+        s1_ci, st_ci = np.full((d, 2), np.nan), np.full((d, 2), np.nan)
+    return SobolResult(
+        names=names, S1=s1, S1_ci=s1_ci, ST=st, ST_ci=st_ci,
+        variance=var, n_base=n, n_evaluations=n * (d + 2),
+    )
+
+def settlement_sensitivity(
+    volume_loss_frac: tuple[float, float] = (0.005, 0.02),
+    K: tuple[float, float] = (0.3, 0.7),
+    cover_to_axis_m: tuple[float, float] = (10.0, 40.0),
+    radius_m: tuple[float, float] = (2.0, 6.0),
+    **kwargs: float,
+) -> SobolResult:
+    """Sobol indices of settlement_trough Smax over uniform ranges; kwargs go to sobol_indices."""
+    inputs = [
+        SobolInput("volume_loss_frac", *volume_loss_frac),
+        SobolInput("K", *K),
+        SobolInput("cover_to_axis_m", *cover_to_axis_m),
+        SobolInput("radius_m", *radius_m),
+    ]
+
+    def smax(x: dict[str, NDArray[np.float64]]) -> NDArray[np.float64]:
+        vl, r, cover = x["volume_loss_frac"], x["radius_m"], x["cover_to_axis_m"]
+        return settlement_troughs(vl, r, cover, x["K"]).Smax_m
+
+    return sobol_indices(smax, inputs, **kwargs)  # type: ignore[arg-type]
+
+def inflow_sensitivity(
+    k_m_per_s: tuple[float, float] = (1e-8, 1e-5),
+    head_above_axis_m: tuple[float, float] = (5.0, 50.0),
+    influence_radius_m: tuple[float, float] = (50.0, 500.0),
+    radius_m: float = 3.0,
+    drainage_factor: float = 1.0,
+    **kwargs: float,
+) -> SobolResult:
+    """Sobol indices of inflow_per_length; k is log-uniform, head and influence radius uniform."""
+    inputs = [
+        SobolInput("k_m_per_s", *k_m_per_s, log=True),
+        SobolInput("head_above_axis_m", *head_above_axis_m),
+        SobolInput("influence_radius_m", *influence_radius_m),
+    ]
+
+    def inflow(x: dict[str, NDArray[np.float64]]) -> NDArray[np.float64]:
+        k, head, R = x["k_m_per_s"], x["head_above_axis_m"], x["influence_radius_m"]
+        return inflows_per_length(k, head, radius_m, R, drainage_factor).q_per_m3_s
+
+    return sobol_indices(inflow, inputs, **kwargs)  # type: ignore[arg-type]
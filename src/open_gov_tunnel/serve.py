@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, fields
+import json
+import math
+from pathlib import Path
+import sys
+import threading
+from typing import Any, Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .classification import (
+    Q_CATEGORY_LABELS,
+    RMR_CLASS_LABELS,
+    QInputs,
+    RMRInputs,
+    q_values,
+    rmr_scores,
+)
+from .cost import CostInputs, tunnel_costs
+from .groundwater import InflowInputs, inflows_per_length
+from .lining import LiningInputs, lining_thicknesses
+from .settlement import SettlementInputs, settlement_troughs
+
+# One evaluation per micro-batch: columns (one array per input field) -> one result dict, or an
+# error message where the scalar function would raise, per request. Result keys match the scalar
+# result dataclasses.
+Evaluator = Callable[[dict[str, NDArray[Any]]], list["dict[str, Any] | str"]]
+
+def _rows(
+    columns: dict[str, NDArray[Any]], valid: NDArray[np.bool_] | None = None
+) -> list[dict[str, Any] | str]:
+    keys = list(columns)
+    values = [c.tolist() for c in columns.values()]
+    ok = [True] * len(values[0]) if valid is None else valid.tolist()
+    rows = zip(zip(*values), ok)
+    return [dict(zip(keys, row)) if good else "Invalid inputs." for row, good in rows]
+
+def _rmr(c: dict[str, NDArray[Any]]) -> list[dict[str, Any] | str]:
+    res = rmr_scores(*(c[f.name] for f in fields(RMRInputs)))
+    return _rows({"rmr": res.rmr, "class_label": np.asarray(RMR_CLASS_LABELS)[res.class_code]})
+
+def _qsystem(c: dict[str, NDArray[Any]]) -> list[dict[str, Any] | str]:
+    res = q_values(*(c[f.name] for f in fields(QInputs)))
+    return _rows({"Q": res.Q, "category": np.asarray(Q_CATEGORY_LABELS)[res.category_code]})
+
+def _inflow(c: dict[str, NDArray[Any]]) -> list[dict[str, Any] | str]:
+    res = inflows_per_length(*(c[f.name] for f in fields(InflowInputs)))
+    return _rows({"q_per_m3_s": res.q_per_m3_s}, res.valid)
+
+def _settlement(c: dict[str, NDArray[Any]]) -> list[dict[str, Any] | str]:
+    res = settlement_troughs(*(c[f.name] for f in fields(SettlementInputs)))
+    return _rows({"Smax_m": res.Smax_m, "i_m": res.i_m})
+
+def _lining(c: dict[str, NDArray[Any]]) -> list[dict[str, Any] | str]:
+    res = lining_thicknesses(*(c[f.name] for f in fields(LiningInputs)))
+    return _rows({"t_req_m": res.t_req_m, "OK": res.OK}, res.valid)
+
+def _cost(c: dict[str, NDArray[Any]]) -> list[dict[str, Any] | str]:
+    res = tunnel_costs(*(c[f.name] for f in fields(CostInputs)))
+    cols = {"tunnel_usd": res.tunnel_usd, "shafts_usd": res.shafts_usd, "total_usd": res.total_usd}
+    return _rows(cols)
+
+SERVE_OPS: dict[str, tuple[type, Evaluator]] = {
+    "rmr": (RMRInputs, _rmr),
+    "qsystem": (QInputs, _qsystem),
+    "inflow": (InflowInputs, _inflow),
+    "settlement": (SettlementInputs, _settlement),
+    "lining": (LiningInputs, _lining),
+    "cost": (CostInputs, _cost),
+}
+
+@dataclass(frozen=True)
+class ServeStats:
+    requests: int
+    batches: int
+    errors: int
+
+    @property
+    def mean_batch(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+class MicroBatcher:
+    """
+    Groups concurrent requests of the same op into one vectorized evaluation.
+
+    The first request of an op opens a window of window_s seconds; everything of that op
+    submitted before the window closes (or until max_batch requests are pending) is
+    evaluated together. Must be used from a single event loop.
+    """
+
+    def __init__(self, window_s: float = 0.002, max_batch: int = 4096) -> None:
+        if window_s < 0 or max_batch <= 0:
+            raise ValueError("window_s must be >= 0 and max_batch > 0")
+        self.window_s = window_s
+        self.max_batch = max_batch
+        self._pending: dict[str, list[tuple[Any, asyncio.Future[Any]]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self.requests = self.batches = self.errors = 0
+
+    def stats(self) -> ServeStats:
+        return ServeStats(requests=self.requests, batches=self.batches, errors=self.errors)
+
+    async def submit(self, op: str, args: dict[str, Any]) -> dict[str, Any]:
+        if op not in SERVE_OPS:
+            raise ValueError(f"Unknown op '{op}'. Supported: {', '.join(SERVE_OPS)}")
+        model, _ = SERVE_OPS[op]
+        try:
+            inp = model(**args)
+        except TypeError as exc:
+            raise ValueError(str(exc)) from None
+        for f in fields(model):
+            value = getattr(inp, f.name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"'{f.name}' must be a number")
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[Any] = loop.create_future()
+        queue = self._pending.setdefault(op, [])
+        queue.append((inp, fut))
+        if len(queue) >= self.max_batch:
+            self._flush(op)
+        elif op not in self._timers:
+            self._timers[op] = loop.call_later(self.window_s, self._flush, op)
+        return await fut  # type: ignore[no-any-return]
+
+    def _flush(self, op: str) -> None:
+        timer = self._timers.pop(op, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(op, [])
+        if not batch:
+            return
+        model, evaluate = SERVE_OPS[op]
+        self.requests += len(batch)
+        self.batches += 1
+        try:
+            columns = {
+                f.name: np.asarray([getattr(inp, f.name) for inp, _ in batch], dtype=np.float64)
+                for f in fields(model)
+            }
+            results = evaluate(columns)
+        except Exception as exc:  # never leave a waiting request unanswered
+            results = [f"{type(exc).__name__}: {exc}"] * len(batch)
+        for (_, fut), res in zip(batch, results):
+            if fut.done():
+                continue
+            if isinstance(res, str):
+                fut.set_exception(ValueError(res))
+            else:
+                fut.set_result(res)
+
+def _finite_or_null(value: Any) -> Any:
+    # NaN/Infinity are not JSON; send null, as the batch CSV writer leaves such cells empty
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _finite_or_null(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_finite_or_null(v) for v in value]
+    return value
+
+async def handle_line(line: str, batcher: MicroBatcher) -> str:
+    """One NDJSON request {"id", "op", "args"} -> one response {"id", "ok", "result" | "error"}."""
+    req_id = None
+    try:
+        req = json.loads(line)
+        if not isinstance(req, dict):
+            raise ValueError("request must be a JSON object")
+        req_id = req.get("id")
+        result = await batcher.submit(str(req.get("op")), dict(req.get("args") or {}))
+        resp: dict[str, Any] = {"id": req_id, "ok": True, "result": _finite_or_null(result)}
+    except (ValueError, TypeError) as exc:
+        batcher.errors += 1
+        resp = {"id": req_id, "ok": False, "error": str(exc)}
+    return json.dumps(resp, allow_nan=False)
+
+async def _serve_lines(
+    lines: asyncio.Queue[str | None], write: Callable[[str], None], batcher: MicroBatcher
+) -> None:
+    tasks: set[asyncio.Task[None]] = set()
+
+    async def one(line: str) -> None:
+        write(await handle_line(line, batcher) + "\n")
+
+    while (line := await lines.get()) is not None:
+        if line.strip():
+            task = asyncio.create_task(one(line))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+
+async def serve_stdio(batcher: MicroBatcher) -> ServeStats:
+    """Serve requests from stdin until EOF, writing responses to stdout as they complete."""
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue[str | None] = asyncio.Queue()
+
+    def reader() -> None:  # blocking reads stay off the event loop
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+        loop.call_soon_threadsafe(lines.put_nowait, None)
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    def write(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    await _serve_lines(lines, write, batcher)
+    return batcher.stats()
+
+async def _serve_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, batcher: MicroBatcher
+) -> None:
+    lines: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def pump() -> None:
+        while raw := await reader.readline():
+            lines.put_nowait(raw.decode())
+        lines.put_nowait(None)
+
+    pumping = asyncio.create_task(pump())
+    await _serve_lines(lines, lambda text: writer.write(text.encode()), batcher)
+    await pumping
+    await writer.drain()
+    writer.close()
+
+async def serve_unix(path: Path, batcher: MicroBatcher, ready: asyncio.Event | None = None) -> None:
+    """
+    Serve NDJSON over a Unix socket; all connections share the batcher. Runs until cancelled.
+    A stale socket at path is replaced; any other existing file is refused, never deleted.
+    """
+    if path.exists() or path.is_symlink():
+        if not path.is_socket():
+            raise ValueError(f"{path} exists and is not a socket; refusing to replace it")
+        path.unlink()
+    server = await asyncio.start_unix_server(
+        lambda r, w: _serve_connection(r, w, batcher), path=str(path)
+    )
+    try:
+        async with server:
+            if ready is not None:
+                ready.set()
+            await server.serve_forever()
+    finally:
+        if path.is_socket():
+            path.unlink()
+
+def run_server(
+    socket_path: Path | None = None, window_ms: float = 2.0, max_batch: int = 4096
+) -> ServeStats:
+    batcher = MicroBatcher(window_s=window_ms / 1000.0, max_batch=max_batch)
+    if socket_path is None:
+        return asyncio.run(serve_stdio(batcher))
+    try:
+        asyncio.run(serve_unix(socket_path, batcher))
+    except KeyboardInterrupt:
+        pass
+    return batcher.stats()
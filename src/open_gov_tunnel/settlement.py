@@ -3,6 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .utils import floor_at
+
 @dataclass(frozen=True)
 class SettlementInputs:
     volume_loss_frac: float   # e.g., 0.01 for 1%
@@ -23,3 +28,29 @@ def settlement_trough(inp: SettlementInputs) -> SettlementTrough:
 
 def settlement_at_x(trough: SettlementTrough, x_m: float) -> float:
     return float(trough.Smax_m * math.exp(-(x_m ** 2) / (2.0 * (trough.i_m ** 2))))
+
+@dataclass(frozen=True, eq=False)
+class SettlementTroughBatch:
+    Smax_m: NDArray[np.float64]
+    i_m: NDArray[np.float64]
+
+def settlement_troughs(
+    volume_loss_frac: ArrayLike, radius_m: ArrayLike, cover_to_axis_m: ArrayLike, K: ArrayLike = 0.5
+) -> SettlementTroughBatch:
+    """
+    Vectorized settlement_trough over arrays of SettlementInputs fields.
+    """
+    vl, r, z0, k = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (volume_loss_frac, radius_m, cover_to_axis_m, K))
+    )
+    A = math.pi * (r ** 2)
+    i = floor_at(k * z0, 0.1)
+    Smax = (vl * A) / (math.sqrt(2.0 * math.pi) * i)
+    return SettlementTroughBatch(Smax_m=Smax, i_m=i)
+
+def settlements_at_x(Smax_m: ArrayLike, i_m: ArrayLike, x_m: ArrayLike) -> NDArray[np.float64]:
+    """
+    Vectorized settlement_at_x; arguments broadcast against each other.
+    """
+    Smax, i, x = (np.asarray(a, dtype=np.float64) for a in (Smax_m, i_m, x_m))
+    return Smax * np.exp(-(x ** 2) / (2.0 * (i ** 2)))
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .settlement import SettlementInputs, settlement_trough
+
+@dataclass(frozen=True)
+class TunnelAxis:
+    """Straight tunnel axis segment in plan with its own trough parameters."""
+    x0_m: float
+    y0_m: float
+    x1_m: float
+    y1_m: float
+    inputs: SettlementInputs
+
+@dataclass(frozen=True, eq=False)
+class SettlementField:
+    settlement_m: NDArray[np.float64]
+    slope: NDArray[np.float64]          # magnitude of the superposed ground slope (rad)
+    strain_max: NDArray[np.float64]     # principal horizontal strains, tension positive
+    strain_min: NDArray[np.float64]
+    pairs_evaluated: int = field(default=0)
+
+class ReceptorIndex:
+    """
+    Uniform grid index over receptor coordinates. Receptors are bucketed by cell
+    once; queries return candidates from the cells around an axis segment only.
+    """
+
+    def __init__(self, x_m: ArrayLike, y_m: ArrayLike, cell_size_m: float) -> None:
+        if cell_size_m <= 0:
+            raise ValueError("cell_size_m must be > 0")
+        self.x = np.asarray(x_m, dtype=np.float64)
+        self.y = np.asarray(y_m, dtype=np.float64)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("x_m and y_m must be 1-D arrays of equal length")
+        self.cell_size_m = float(cell_size_m)
+        self.x_min = float(self.x.min()) if self.x.size else 0.0
+        self.y_min = float(self.y.min()) if self.y.size else 0.0
+        ix, iy = self._cell(self.x, self.y)
+        self.ny = int(iy.max()) + 1 if iy.size else 1
+        keys = ix * self.ny + iy
+        self.order = np.argsort(keys, kind="stable")
+        self.cell_keys, self.cell_starts, self.cell_counts = np.unique(
+            keys[self.order], return_index=True, return_counts=True
+        )
+
+    def _cell(
+        self, x: NDArray[np.float64], y: NDArray[np.float64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        ix = np.floor((x - self.x_min) / self.cell_size_m).astype(np.int64)
+        iy = np.floor((y - self.y_min) / self.cell_size_m).astype(np.int64)
+        return ix, iy
+
+    def query_segment(
+        self, x0: float, y0: float, x1: float, y1: float, radius_m: float
+    ) -> NDArray[np.intp]:
+        """Indices of receptors in cells within radius_m of the segment (a superset)."""
+        length = math.hypot(x1 - x0, y1 - y0)
+        n_samples = int(math.ceil(length / self.cell_size_m)) + 1
+        t = np.linspace(0.0, 1.0, n_samples)
+        sx, sy = self._cell(x0 + t * (x1 - x0), y0 + t * (y1 - y0))
+        r = int(math.ceil(radius_m / self.cell_size_m)) + 1
+        off = np.arange(-r, r + 1)
+        cx, cy = np.broadcast_arrays(
+            sx[:, None, None] + off[None, :, None], sy[:, None, None] + off[None, None, :]
+        )
+        cx, cy = cx.ravel(), cy.ravel()
+        ok = (cx >= 0) & (cy >= 0) & (cy < self.ny)
+        wanted = np.unique(cx[ok] * self.ny + cy[ok])
+        pos = np.searchsorted(self.cell_keys, wanted)
+        hit = pos < self.cell_keys.size
+        hit[hit] = self.cell_keys[pos[hit]] == wanted[hit]
+        pos = pos[hit]
+        starts, counts = self.cell_starts[pos], self.cell_counts[pos]
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.intp)
+        run_offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return self.order[run_offsets + np.arange(total)]
+
+def _chains(axes: Sequence[TunnelAxis]) -> list[list[int]]:
+    # consecutive axes where one starts exactly where the previous one ends form one alignment
+    chains: list[list[int]] = []
+    for k, a in enumerate(axes):
+        if chains and (axes[k - 1].x1_m, axes[k - 1].y1_m) == (a.x0_m, a.y0_m):
+            chains[-1].append(k)
+        else:
+            chains.append([k])
+    return chains
+
+def settlement_field(
+    x_m: ArrayLike,
+    y_m: ArrayLike,
+    axes: Sequence[TunnelAxis],
+    cutoff_i: float = 4.0,
+    index: ReceptorIndex | None = None,
+) -> SettlementField:
+    """
+    Superposed greenfield settlement, slope and horizontal strain at plan receptors.
+
+    Each axis contributes the transverse Gaussian trough of settlement_trough at the
+    receptor's distance from the segment, within `cutoff_i` trough widths. Consecutive
+    axes where one ends where the next starts are one chained alignment: each receptor
+    takes the trough of its nearest segment only, measured to the closest point, so
+    the outside of a bend is covered around the vertex and the inside is not counted
+    twice. The free ends of a chain are cut off square. Separate alignments (twin
+    bores, crossings) superpose. Horizontal movements follow O'Reilly & New (radial
+    towards the axis, S_h = S * n / z0), so the transverse strain is
+    (S / z0) * (n^2 / i^2 - 1). Strains are summed as plan tensors and reported as
+    principal values. Pass a prebuilt ReceptorIndex to reuse it across calls; its
+    coordinates then take precedence over x_m and y_m.
+    """
+    if cutoff_i <= 0:
+        raise ValueError("cutoff_i must be > 0")
+    troughs = [settlement_trough(a.inputs) for a in axes]
+    if index is None:
+        i_max = max((t.i_m for t in troughs), default=1.0)
+        index = ReceptorIndex(x_m, y_m, cell_size_m=cutoff_i * i_max / 2.0)
+    x, y = index.x, index.y
+    n_rec = x.size
+    settle = np.zeros(n_rec)
+    gx = np.zeros(n_rec)
+    gy = np.zeros(n_rec)
+    exx = np.zeros(n_rec)
+    eyy = np.zeros(n_rec)
+    exy = np.zeros(n_rec)
+    pairs = 0
+    best = np.full(n_rec, np.inf)
+    owner = np.full(n_rec, -1, dtype=np.int64)
+    for chain in _chains(axes):
+        # pass 1: distance of every nearby receptor to each segment; the nearest segment owns it
+        cand: list[
+            tuple[int, NDArray[np.intp], NDArray[np.float64], NDArray[np.float64], float, float]
+        ] = []
+        for k in chain:
+            axis = axes[k]
+            dx, dy = axis.x1_m - axis.x0_m, axis.y1_m - axis.y0_m
+            length = math.hypot(dx, dy)
+            if length == 0.0:
+                continue
+            ux, uy = dx / length, dy / length
+            reach = cutoff_i * troughs[k].i_m
+            idx = index.query_segment(axis.x0_m, axis.y0_m, axis.x1_m, axis.y1_m, reach)
+            px, py = x[idx] - axis.x0_m, y[idx] - axis.y0_m
+            along = px * ux + py * uy
+            t = np.clip(along, 0.0, length)
+            vx, vy = px - t * ux, py - t * uy       # offset from the closest point on the segment
+            d = np.hypot(vx, vy)
+            d[((along < 0.0) & (k == chain[0])) | ((along > length) & (k == chain[-1]))] = np.inf
+            d[d > reach] = np.inf
+            closer = d < best[idx]
+            best[idx[closer]] = d[closer]
+            owner[idx[closer]] = k
+            cand.append((k, idx, vx, vy, ux, uy))
+        # pass 2: each receptor gets the trough of its owning segment
+        for k, idx, vx, vy, ux, uy in cand:
+            mine = (owner[idx] == k) & np.isfinite(best[idx])
+            idx, vx, vy = idx[mine], vx[mine], vy[mine]
+            pairs += idx.size
+            tr = troughs[k]
+            i2 = tr.i_m ** 2
+            n2 = vx ** 2 + vy ** 2
+            S = tr.Smax_m * np.exp(-n2 / (2.0 * i2))
+            eps = S / axes[k].inputs.cover_to_axis_m * (n2 / i2 - 1.0)
+            # unit direction away from the axis; the segment normal for receptors on the axis
+            n = np.sqrt(n2)
+            on_axis = n == 0.0
+            ex = np.where(on_axis, -uy, vx / np.where(on_axis, 1.0, n))
+            ey = np.where(on_axis, ux, vy / np.where(on_axis, 1.0, n))
+            settle[idx] += S
+            gx[idx] += -S / i2 * vx
+            gy[idx] += -S / i2 * vy
+            exx[idx] += eps * ex * ex
+            eyy[idx] += eps * ey * ey
+            exy[idx] += eps * ex * ey
+        for _, idx, *_ in cand:
+            best[idx] = np.inf
+    centre = 0.5 * (exx + eyy)
+    radius = np.sqrt((0.5 * (exx - eyy)) ** 2 + exy ** 2)
+    return SettlementField(
+        settlement_m=settle,
+        slope=np.hypot(gx, gy),
+        strain_max=centre + radius,
+        strain_min=centre - radius,
+        pairs_evaluated=pairs,
+    )
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import IO, Any, Iterable, Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+from . import __version__
+
+MANIFEST = "manifest.json"
+STORE_FORMAT = 1
+_STORABLE_KINDS = "biufcUMm"   # bool, integers, floats, complex, fixed-width unicode, datetimes
+
+def _column_file(name: str) -> str:
+    return f"{name}.bin"
+
+def _check_castable(name: str, have: np.dtype[Any], want: np.dtype[Any]) -> None:
+    # same_kind allows widening and narrowing within a kind, never float -> int or number <-> str
+    if not np.can_cast(have, want, casting="same_kind") or (have.kind == "U") != (want.kind == "U"):
+        raise ValueError(f"column '{name}' has dtype {have}, schema expects {want}")
+
+class ResultStoreWriter:
+    """
+    Append-only writer for a columnar result store: one raw little-endian binary file per
+    column plus a JSON manifest (dtype, trailing shape, row count, index column). The first
+    append fixes the schema; every chunk must have the same columns, with dtypes castable
+    within their kind (no float -> int or number <-> string casts). Pass `schema` (column
+    name to dtype) to check the first chunk against the expected columns and dtypes; either
+    way a bad chunk is rejected before anything is written. Unicode columns are stored at
+    fixed width, at least min_str_width characters. The manifest is rewritten
+    atomically after every append, so a reader always sees whole chunks.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        index: str | None = "chainage_m",
+        meta: Mapping[str, Any] | None = None,
+        min_str_width: int = 64,
+        schema: Mapping[str, DTypeLike] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        if (self.path / MANIFEST).exists():
+            raise ValueError(f"{self.path} already contains a result store")
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.index = index
+        self.meta = dict(meta or {})
+        self.min_str_width = min_str_width
+        self.expected = None if schema is None else {k: np.dtype(v) for k, v in schema.items()}
+        self.n_rows = 0
+        self._schema: dict[str, tuple[np.dtype[Any], tuple[int, ...]]] = {}
+        self._files: dict[str, IO[bytes]] = {}
+        self._sorted = True
+        self._last_index: Any = None
+
+    def append(self, columns: Mapping[str, ArrayLike]) -> None:
+        arrays = {k: np.asarray(v) for k, v in columns.items()}
+        n = {a.shape[0] if a.ndim else -1 for a in arrays.values()}
+        if len(n) != 1 or -1 in n:
+            raise ValueError("chunk columns must be arrays of equal length")
+        rows = n.pop()
+        if not self._schema:
+            self._open(arrays)
+        if arrays.keys() != self._schema.keys():
+            raise ValueError(
+                f"chunk columns {sorted(arrays)} do not match store columns {sorted(self._schema)}"
+            )
+        out: dict[str, NDArray[Any]] = {}
+        for name, arr in arrays.items():
+            dtype, tail = self._schema[name]
+            if arr.shape[1:] != tail:
+                raise ValueError(
+                    f"column '{name}' has trailing shape {arr.shape[1:]}, store has {tail}"
+                )
+            _check_castable(name, arr.dtype, dtype)
+            if arr.dtype.kind == "U" and arr.dtype.itemsize > dtype.itemsize:
+                raise ValueError(
+                    f"column '{name}' strings exceed the stored width {dtype.itemsize // 4}"
+                )
+            out[name] = np.ascontiguousarray(arr, dtype=dtype)
+        if self.index is not None and rows:
+            idx = out[self.index]
+            in_order = bool(np.all(idx[1:] >= idx[:-1]))
+            follows = self._last_index is None or idx[0] >= self._last_index
+            self._sorted = self._sorted and in_order and follows
+            self._last_index = idx[-1]
+        for name, arr in out.items():
+            self._files[name].write(arr.tobytes())
+            self._files[name].flush()
+        self.n_rows += rows
+        self._write_manifest()
+
+    def _open(self, arrays: Mapping[str, NDArray[Any]]) -> None:
+        # Validate the whole first chunk before creating any column file, so a bad chunk
+        # leaves the writer unopened and the directory without data.
+        if self.index is not None and self.index not in arrays:
+            raise ValueError(f"index column '{self.index}' missing")
+        if self.expected is not None and arrays.keys() != self.expected.keys():
+            missing = sorted(self.expected.keys() - arrays.keys())
+            extra = sorted(arrays.keys() - self.expected.keys())
+            raise ValueError(
+                f"chunk columns do not match the schema (missing {missing}, unexpected {extra})"
+            )
+        schema: dict[str, tuple[np.dtype[Any], tuple[int, ...]]] = {}
+        for name, arr in arrays.items():
+            want = arr.dtype if self.expected is None else self.expected[name]
+            if arr.dtype.kind == "O" or want.kind == "O":
+                raise ValueError(f"column '{name}' has object dtype; store typed arrays only")
+            if want.kind not in _STORABLE_KINDS:
+                raise ValueError(f"column '{name}' has unsupported dtype {want}")
+            _check_castable(name, arr.dtype, want)
+            if want.kind == "U":
+                width = max(self.min_str_width, want.itemsize // 4, arr.dtype.itemsize // 4)
+                dtype = np.dtype(f"<U{width}")
+            else:
+                dtype = want.newbyteorder("<")
+            schema[name] = (dtype, tuple(arr.shape[1:]))
+        self._schema = schema
+        self._files = {name: open(self.path / _column_file(name), "wb") for name in schema}
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "format": STORE_FORMAT,
+            "package_version": __version__,
+            "n_rows": self.n_rows,
+            "index": self.index,
+            "index_sorted": self._sorted,
+            "columns": {
+                k: {"dtype": dt.str, "shape": list(tail), "file": _column_file(k)}
+                for k, (dt, tail) in self._schema.items()
+            },
+            "meta": self.meta,
+        }
+        tmp = self.path / (MANIFEST + ".tmp")
+        tmp.write_text(json.dumps(manifest, indent=1, default=str))
+        os.replace(tmp, self.path / MANIFEST)
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        if not (self.path / MANIFEST).exists():
+            self._write_manifest()
+
+    def __enter__(self) -> ResultStoreWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+class ResultStore:
+    """Read side of a result store. Columns are read-only memory maps, loaded only when sliced."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        manifest = json.loads((self.path / MANIFEST).read_text())
+        if manifest.get("format") != STORE_FORMAT:
+            raise ValueError(f"unsupported result store format {manifest.get('format')!r}")
+        self.n_rows: int = manifest["n_rows"]
+        self.index: str | None = manifest["index"]
+        self.index_sorted: bool = manifest["index_sorted"]
+        self.meta: dict[str, Any] = manifest["meta"]
+        self._columns: dict[str, dict[str, Any]] = manifest["columns"]
+        self._maps: dict[str, NDArray[Any]] = {}
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def column(self, name: str) -> NDArray[Any]:
+        if name not in self._columns:
+            raise KeyError(name)
+        if name not in self._maps:
+            spec = self._columns[name]
+            shape = (self.n_rows, *spec["shape"])
+            dtype = np.dtype(spec["dtype"])
+            if self.n_rows == 0 or dtype.itemsize == 0:
+                self._maps[name] = np.empty(shape, dtype=dtype)
+            else:
+                self._maps[name] = np.memmap(
+                    self.path / spec["file"], dtype=dtype, mode="r", shape=shape
+                )
+        return self._maps[name]
+
+    def rows(
+        self, start: int, stop: int, columns: Iterable[str] | None = None
+    ) -> dict[str, NDArray[Any]]:
+        names = self.columns if columns is None else columns
+        return {c: self.column(c)[start:stop] for c in names}
+
+    def chainage_range(
+        self, lo_m: float, hi_m: float, columns: Iterable[str] | None = None
+    ) -> dict[str, NDArray[Any]]:
+        """Rows whose index value lies in [lo_m, hi_m), by bisecting the sorted index column."""
+        if self.index is None or not self.index_sorted:
+            raise ValueError("chainage_range needs a sorted index column")
+        idx = self.column(self.index)
+        start, stop = np.searchsorted(idx, [lo_m, hi_m], side="left")
+        return self.rows(int(start), int(stop), columns)
+
+def write_results(
+    path: Path,
+    columns: Mapping[str, ArrayLike],
+    index: str | None = "chainage_m",
+    meta: Mapping[str, Any] | None = None,
+    schema: Mapping[str, DTypeLike] | None = None,
+) -> ResultStore:
+    """Write one table of result columns (e.g. from screen_alignment) and open it for reading."""
+    with ResultStoreWriter(path, index=index, meta=meta, schema=schema) as w:
+        w.append(columns)
+    return ResultStore(path)
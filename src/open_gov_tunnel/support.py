@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .utils import threshold_codes
 
 @dataclass(frozen=True)
 class NATMSupport:
@@ -22,3 +28,72 @@ def natm_support_from_rmr(rmr: float, diameter_m: float) -> NATMSupport:
     if rmr >= 20:
         return NATMSupport(shotcrete_mm=150, bolt_length_m=4.0, bolt_spacing_m=1.2, lattice_girders=True)
     return NATMSupport(shotcrete_mm=200, bolt_length_m=5.0, bolt_spacing_m=1.0, lattice_girders=True)
+
+# Lookup table form of natm_support_from_rmr; the class code indexes NATM_SUPPORT_CLASSES.
+NATM_SUPPORT_CLASSES: tuple[NATMSupport, ...] = (
+    NATMSupport(shotcrete_mm=50, bolt_length_m=2.0, bolt_spacing_m=2.5, lattice_girders=False),
+    NATMSupport(shotcrete_mm=75, bolt_length_m=3.0, bolt_spacing_m=2.0, lattice_girders=False),
+    NATMSupport(shotcrete_mm=100, bolt_length_m=4.0, bolt_spacing_m=1.5, lattice_girders=True),
+    NATMSupport(shotcrete_mm=150, bolt_length_m=4.0, bolt_spacing_m=1.2, lattice_girders=True),
+    NATMSupport(shotcrete_mm=200, bolt_length_m=5.0, bolt_spacing_m=1.0, lattice_girders=True),
+)
+NATM_RMR_THRESHOLDS: tuple[float, ...] = (80.0, 60.0, 40.0, 20.0)
+
+_SHOTCRETE_M = np.array([c.shotcrete_mm / 1000.0 for c in NATM_SUPPORT_CLASSES])
+_BOLT_LENGTH_M = np.array([c.bolt_length_m for c in NATM_SUPPORT_CLASSES])
+_BOLT_SPACING_M = np.array([c.bolt_spacing_m for c in NATM_SUPPORT_CLASSES])
+_GIRDERS = np.array([c.lattice_girders for c in NATM_SUPPORT_CLASSES])
+
+def natm_support_classes(rmr: ArrayLike) -> NDArray[np.int8]:
+    """Support class codes (index into NATM_SUPPORT_CLASSES) for an array of RMR values."""
+    return threshold_codes(np.asarray(rmr, dtype=np.float64), NATM_RMR_THRESHOLDS)
+
+@dataclass(frozen=True, eq=False)
+class SupportTakeoff:
+    support_class: NDArray[np.int8]
+    shotcrete_m3: NDArray[np.float64]
+    bolt_count: NDArray[np.int64]
+    bolt_m: NDArray[np.float64]
+    girder_count: NDArray[np.int64]
+
+    def totals_by_class(self) -> dict[str, NDArray[np.float64]]:
+        """Quantity totals per support class; each array is indexed by class code."""
+        n = len(NATM_SUPPORT_CLASSES)
+        cls = self.support_class.astype(np.intp)
+        totals = {"segments": np.bincount(cls, minlength=n).astype(np.float64)}
+        for name in ("shotcrete_m3", "bolt_count", "bolt_m", "girder_count"):
+            summed = np.bincount(cls, weights=getattr(self, name), minlength=n)
+            totals[name] = summed.astype(np.float64, copy=False)
+        return totals
+
+def natm_support_takeoff(
+    rmr: ArrayLike,
+    diameter_m: ArrayLike,
+    length_m: ArrayLike,
+    round_length_m: ArrayLike = 1.0,
+    arc_fraction: float = 1.0,
+) -> SupportTakeoff:
+    """
+    Screening quantity takeoff per segment for the NATM support class of each RMR.
+
+    The supported arc is arc_fraction of the excavated circumference (pi * D). Bolts are
+    laid on a square pattern at the class spacing (rings along the segment times bolts
+    per ring); one lattice girder is set per excavation round where the class calls for them.
+    """
+    cls = natm_support_classes(rmr)
+    D, L, rl = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (diameter_m, length_m, round_length_m))
+    )
+    if np.any(rl <= 0):
+        raise ValueError("round_length_m must be > 0")
+    arc = math.pi * D * arc_fraction
+    spacing = _BOLT_SPACING_M[cls]
+    bolts = (np.ceil(L / spacing) * np.ceil(arc / spacing)).astype(np.int64)
+    girders = np.where(_GIRDERS[cls], np.ceil(L / rl), 0.0).astype(np.int64)
+    return SupportTakeoff(
+        support_class=cls,
+        shotcrete_m3=arc * L * _SHOTCRETE_M[cls],
+        bolt_count=bolts,
+        bolt_m=bolts * _BOLT_LENGTH_M[cls],
+        girder_count=girders,
+    )
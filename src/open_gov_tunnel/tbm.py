@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 @dataclass(frozen=True)
 class TBMInputs:
     ground: str           # 'rock','mixed','soft'
@@ -28,3 +31,32 @@ def tbm_select(inp: TBMInputs) -> TBMResult:
     if w == "high":
         return TBMResult("Single/Double Shield TBM", "Rock with water; pre-excavation grouting and robust sealing.")
     return TBMResult("Open TBM", "Competent rock, low water inflow.")
+
+def tbm_recommendations(
+    ground: ArrayLike, groundwater: ArrayLike, boulders: ArrayLike = False
+) -> NDArray[np.str_]:
+    """
+    tbm_select over arrays of ground/groundwater/boulders, calling the scalar
+    function once per distinct combination.
+    """
+    g, w, b = np.broadcast_arrays(
+        np.asarray(ground, dtype=str),
+        np.asarray(groundwater, dtype=str),
+        np.asarray(boulders, dtype=bool),
+    )
+    g_vals, g_idx = np.unique(g, return_inverse=True)
+    w_vals, w_idx = np.unique(w, return_inverse=True)
+    combo = (g_idx.reshape(g.shape) * len(w_vals) + w_idx.reshape(g.shape)) * 2 + b
+    keys, inverse = np.unique(combo, return_inverse=True)
+    picks = []
+    for key in keys:
+        gi, rest = divmod(int(key), 2 * len(w_vals))
+        wi, bi = divmod(rest, 2)
+        picks.append(
+            tbm_select(
+                TBMInputs(ground=str(g_vals[gi]), groundwater=str(w_vals[wi]), boulders=bool(bi))
+            ).recommended
+        )
+    if not picks:
+        return np.empty(g.shape, dtype=str)
+    return np.asarray(picks, dtype=str)[inverse.reshape(g.shape)]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .tbm import TBMInputs, tbm_select
+
+@dataclass(frozen=True)
+class TBMProduction:
+    boring_m_per_h: float        # median net boring rate while the cutterhead turns
+    ring_length_m: float
+    ring_build_h: float          # per ring (or per support round for open machines)
+    cutter_interval_m: float     # advance between cutter inspections/changes
+    cutter_change_h: float
+    stoppages_per_day: float     # Poisson rate of unplanned stoppages
+    stoppage_mean_h: float       # exponential duration of each stoppage
+
+# Indicative production by tbm_select recommendation; override per project in ScheduleParams.
+TBM_PRODUCTION: dict[str, TBMProduction] = {
+    "Open TBM": TBMProduction(3.0, 1.8, 0.3, 300.0, 6.0, 0.3, 3.0),
+    "Single/Double Shield TBM": TBMProduction(2.5, 1.5, 0.5, 250.0, 6.0, 0.4, 4.0),
+    "EPB TBM": TBMProduction(2.0, 1.5, 0.7, 800.0, 8.0, 0.5, 3.0),
+    "EPB": TBMProduction(1.8, 1.5, 0.7, 500.0, 8.0, 0.5, 3.5),
+    "Convertible EPB/Hard-Rock": TBMProduction(1.5, 1.5, 0.8, 200.0, 8.0, 0.6, 4.0),
+    "Slurry TBM": TBMProduction(1.8, 1.5, 0.8, 600.0, 10.0, 0.6, 4.0),
+}
+
+@dataclass(frozen=True)
+class ScheduleParams:
+    hours_per_day: float = 20.0          # shift hours available each calendar day
+    rate_sigma_ln: float = 0.25          # day-to-day lognormal scatter of the boring rate
+    max_days: int = 36_500
+    production: Mapping[str, TBMProduction] = field(default_factory=lambda: TBM_PRODUCTION)
+
+@dataclass(frozen=True, eq=False)
+class TBMRuns:
+    start_m: NDArray[np.float64]
+    end_m: NDArray[np.float64]
+    ground: NDArray[np.str_]
+    groundwater: NDArray[np.str_]
+    boulders: NDArray[np.bool_]
+    machine: NDArray[np.str_]
+
+    def __len__(self) -> int:
+        return int(self.start_m.size)
+
+def tbm_runs(
+    chainage_m: ArrayLike,
+    length_m: ArrayLike,
+    ground: ArrayLike,
+    groundwater: ArrayLike,
+    boulders: ArrayLike = False,
+) -> TBMRuns:
+    """
+    Run-length encode consecutive segments with identical ground/groundwater/boulders;
+    tbm_select once per run.
+    """
+    start = np.asarray(chainage_m, dtype=np.float64)
+    length = np.broadcast_to(np.asarray(length_m, dtype=np.float64), start.shape)
+    g = np.char.lower(np.broadcast_to(np.asarray(ground, dtype=str), start.shape))
+    w = np.char.lower(np.broadcast_to(np.asarray(groundwater, dtype=str), start.shape))
+    b = np.broadcast_to(np.asarray(boulders, dtype=bool), start.shape)
+    if start.ndim != 1 or start.size == 0 or np.any(length <= 0) or np.any(np.diff(start) < 0):
+        raise ValueError("segments must be non-empty, ordered along the drive, with length > 0")
+    change = np.ones(start.size, dtype=bool)
+    change[1:] = (g[1:] != g[:-1]) | (w[1:] != w[:-1]) | (b[1:] != b[:-1])
+    first = np.flatnonzero(change)
+    last = np.append(first[1:], start.size) - 1
+    picks = [TBMInputs(ground=str(g[i]), groundwater=str(w[i]), boulders=bool(b[i])) for i in first]
+    machine = [tbm_select(inp).recommended for inp in picks]
+    return TBMRuns(
+        start_m=start[first],
+        end_m=start[last] + length[last],
+        ground=g[first],
+        groundwater=w[first],
+        boulders=b[first].copy(),
+        machine=np.asarray(machine, dtype=str),
+    )
+
+@dataclass(frozen=True, eq=False)
+class TBMSchedule:
+    runs: TBMRuns
+    completion_days: NDArray[np.float64]    # per replicate, days from start; NaN past max_days
+    cutter_changes: NDArray[np.int64]       # per replicate
+    stoppage_h: NDArray[np.float64]         # per replicate, total unplanned downtime
+    start_date: date | None                 # calendar date of day 0, if given
+
+    def quantile(self, p: ArrayLike) -> NDArray[np.float64]:
+        q = np.quantile(self.completion_days, np.asarray(p, dtype=np.float64))
+        return np.asarray(q, dtype=np.float64)
+
+    def completion_dates(self, p: ArrayLike = (0.1, 0.5, 0.9)) -> list[date]:
+        if self.start_date is None:
+            raise ValueError("no start_date given; use quantile() for days from start")
+        days = np.atleast_1d(self.quantile(p))
+        return [self.start_date + timedelta(days=float(np.ceil(d))) for d in days]
+
+def simulate_tbm_schedule(
+    runs: TBMRuns,
+    replicates: int = 1000,
+    seed: int = 0,
+    params: ScheduleParams = ScheduleParams(),
+    start_date: date | None = None,
+) -> TBMSchedule:
+    """
+    Daily advance of every replicate through the runs. Each day loses Poisson stoppages of
+    exponential length; the remaining hours go to boring plus ring build, interrupted by cutter
+    changes every cutter_interval_m. Time overrunning a day (a long stoppage or cutter change) is
+    carried to the next.
+    Results are in days from start; pass start_date to also get calendar completion dates.
+    """
+    if replicates < 1:
+        raise ValueError("replicates must be >= 1")
+    try:
+        prod = [params.production[str(m)] for m in runs.machine]
+    except KeyError as exc:
+        raise ValueError(f"no production parameters for machine {exc.args[0]!r}") from None
+    h_per_m = np.array([1.0 / p.boring_m_per_h for p in prod])
+    build_per_m = np.array([p.ring_build_h / p.ring_length_m for p in prod])
+    interval = np.array([p.cutter_interval_m for p in prod])
+    cutter_h = np.array([p.cutter_change_h for p in prod])
+    stop_rate = np.array([p.stoppages_per_day for p in prod])
+    stop_mean = np.array([p.stoppage_mean_h for p in prod])
+    end = runs.end_m
+    n_runs = len(runs)
+    H = params.hours_per_day
+
+    rng = np.random.default_rng(seed)
+    pos = np.full(replicates, runs.start_m[0])
+    run = np.zeros(replicates, dtype=np.int64)
+    wear = np.zeros(replicates)
+    carry = np.zeros(replicates)           # hours owed from the previous day
+    completion = np.full(replicates, np.nan)
+    cutters = np.zeros(replicates, dtype=np.int64)
+    stopped = np.zeros(replicates)
+    active = np.arange(replicates)
+    for day in range(params.max_days):
+        if active.size == 0:
+            break
+        r = run[active]
+        n_stop = rng.poisson(stop_rate[r])
+        lost = np.where(n_stop > 0, rng.standard_gamma(np.maximum(n_stop, 1)) * stop_mean[r], 0.0)
+        stopped[active] += lost
+        hours = H - lost - carry[active]
+        carry[active] = 0.0
+        if params.rate_sigma_ln > 0:
+            rate_mult = np.exp(rng.normal(0.0, params.rate_sigma_ln, active.size))
+        else:
+            rate_mult = np.ones(active.size)
+        idx = active
+        while idx.size:
+            owed = hours < 0
+            carry[idx[owed]] = -hours[owed]
+            sel = hours > 1e-9
+            idx, hours = idx[sel], hours[sel]
+            rate_mult = rate_mult[sel]
+            if idx.size == 0:
+                break
+            r = run[idx]
+            hpm = h_per_m[r] / rate_mult + build_per_m[r]
+            to_cut = interval[r] - wear[idx]
+            d = np.minimum(np.minimum(end[r] - pos[idx], to_cut), hours / hpm)
+            pos[idx] += d
+            wear[idx] += d
+            hours = hours - d * hpm
+            cut = wear[idx] >= interval[r] - 1e-9
+            if cut.any():
+                hours = hours - np.where(cut, cutter_h[r], 0.0)
+                wear[idx[cut]] = 0.0
+                cutters[idx[cut]] += 1
+            at_end = pos[idx] >= end[r] - 1e-9
+            if at_end.any():
+                run[idx[at_end]] += 1
+                fin = at_end & (run[idx] >= n_runs)
+                if fin.any():
+                    completion[idx[fin]] = day + 1.0 - np.maximum(hours[fin], 0.0) / H
+                    hours = np.where(fin, 0.0, hours)
+                    run[idx[fin]] = n_runs - 1
+        active = active[np.isnan(completion[active])]
+    return TBMSchedule(
+        runs=runs, completion_days=completion, cutter_changes=cutters, stoppage_h=stopped,
+        start_date=start_date,
+    )
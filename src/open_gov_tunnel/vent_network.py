@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .linalg import pcg
+from .ventilation import VentInputs, construction_vent_airflow
+
+@dataclass(frozen=True, eq=False)
+class VentNetwork:
+    """
+    Ventilation network of nodes joined by branches (ducts, drives, shafts).
+
+    Branch pressure loss follows Atkinson's square law dp = R * Q * |Q| with R in Ns^2/m^8.
+    A fan in a branch adds p_fan = a0 + a1 * Q + a2 * Q^2 (Pa) in the branch direction.
+    Nodes listed in `fixed_nodes` (portals, shaft tops) are held at `fixed_pressure_Pa`;
+    `injection_m3_s` is external air entering each free node (default none).
+    """
+    n_nodes: int
+    from_node: NDArray[np.int64]
+    to_node: NDArray[np.int64]
+    resistance: NDArray[np.float64]
+    fixed_nodes: NDArray[np.int64]
+    fixed_pressure_Pa: NDArray[np.float64]
+    fan_a0: NDArray[np.float64]
+    fan_a1: NDArray[np.float64]
+    fan_a2: NDArray[np.float64]
+    injection_m3_s: NDArray[np.float64]
+
+    @classmethod
+    def build(
+        cls,
+        n_nodes: int,
+        from_node: ArrayLike,
+        to_node: ArrayLike,
+        resistance: ArrayLike,
+        fixed_nodes: ArrayLike,
+        fixed_pressure_Pa: ArrayLike = 0.0,
+        fans: Mapping[int, tuple[float, float, float]] | None = None,
+        injection_m3_s: ArrayLike = 0.0,
+    ) -> VentNetwork:
+        f = np.asarray(from_node, dtype=np.int64)
+        t = np.asarray(to_node, dtype=np.int64)
+        R = np.asarray(resistance, dtype=np.float64)
+        if not (f.shape == t.shape == R.shape) or f.ndim != 1:
+            raise ValueError("from_node, to_node and resistance must be 1-D arrays of equal length")
+        if f.size and (min(f.min(), t.min()) < 0 or max(f.max(), t.max()) >= n_nodes):
+            raise ValueError("branch node index out of range")
+        if np.any(R <= 0):
+            raise ValueError("branch resistances must be > 0")
+        fixed = np.atleast_1d(np.asarray(fixed_nodes, dtype=np.int64))
+        if fixed.size == 0:
+            raise ValueError("at least one node must have a fixed pressure")
+        a = np.zeros((3, f.size))
+        for branch, coeffs in (fans or {}).items():
+            a[:, branch] = coeffs
+        return cls(
+            n_nodes=n_nodes,
+            from_node=f,
+            to_node=t,
+            resistance=R,
+            fixed_nodes=fixed,
+            fixed_pressure_Pa=np.broadcast_to(
+                np.asarray(fixed_pressure_Pa, dtype=np.float64), fixed.shape
+            ).copy(),
+            fan_a0=a[0],
+            fan_a1=a[1],
+            fan_a2=a[2],
+            injection_m3_s=np.broadcast_to(
+                np.asarray(injection_m3_s, dtype=np.float64), (n_nodes,)
+            ).copy(),
+        )
+
+    def with_fans(self, fans: Mapping[int, tuple[float, float, float]]) -> VentNetwork:
+        """Copy with fan curves replaced on the given branches (e.g. after an equipment change)."""
+        a = np.vstack([self.fan_a0, self.fan_a1, self.fan_a2])
+        for branch, coeffs in fans.items():
+            a[:, branch] = coeffs
+        return replace(self, fan_a0=a[0], fan_a1=a[1], fan_a2=a[2])
+
+@dataclass(frozen=True, eq=False)
+class VentSolution:
+    flow_m3_s: NDArray[np.float64]      # per branch, positive from from_node to to_node
+    pressure_Pa: NDArray[np.float64]    # per node
+    iterations: int
+    converged: bool
+
+def solve_network(
+    net: VentNetwork,
+    initial: VentSolution | None = None,
+    tol: float = 1e-6,
+    maxiter: int = 100,
+) -> VentSolution:
+    """
+    Solve branch flows and node pressures with the global gradient (Newton) method.
+
+    Each iteration linearizes every branch at once and solves the node-pressure system
+    A G^-1 A^T dp = r, a weighted graph Laplacian, matrix-free with preconditioned CG.
+    Pass the previous solution as `initial` to warm-start after equipment changes. If the
+    inner CG solve fails to converge, iteration stops and the result has converged=False.
+    """
+    n_b = net.from_node.size
+    free = np.ones(net.n_nodes, dtype=bool)
+    free[net.fixed_nodes] = False
+    free_idx = np.flatnonzero(free)
+    f, t = net.from_node, net.to_node
+    R, a0, a1, a2 = net.resistance, net.fan_a0, net.fan_a1, net.fan_a2
+    Q = np.ones(n_b) if initial is None else initial.flow_m3_s.astype(np.float64).copy()
+    P = np.zeros(net.n_nodes) if initial is None else initial.pressure_Pa.astype(np.float64).copy()
+    P[net.fixed_nodes] = net.fixed_pressure_Pa
+    s = net.injection_m3_s[free_idx]
+
+    def node_sum(w: NDArray[np.float64]) -> NDArray[np.float64]:
+        net_out = np.bincount(f, w, net.n_nodes) - np.bincount(t, w, net.n_nodes)
+        return net_out[free_idx].astype(np.float64, copy=False)
+
+    converged = False
+    it = 0
+    for it in range(1, maxiter + 1):
+        h = R * Q * np.abs(Q) - (a0 + a1 * Q + a2 * Q * Q)
+        G = np.maximum(2.0 * R * np.abs(Q) - a1 - 2.0 * a2 * Q, 1e-9 * (1.0 + R))
+        F = h - (P[f] - P[t])
+        inv_g = 1.0 / G
+
+        def matvec(
+            x: NDArray[np.float64], inv_g: NDArray[np.float64] = inv_g
+        ) -> NDArray[np.float64]:
+            full = np.zeros(net.n_nodes)
+            full[free_idx] = x
+            return node_sum(inv_g * (full[f] - full[t]))
+
+        rhs = s - node_sum(Q) + node_sum(inv_g * F)
+        touching = np.bincount(f, inv_g, net.n_nodes) + np.bincount(t, inv_g, net.n_nodes)
+        diag = touching[free_idx].astype(np.float64, copy=False)
+        cg = pcg(matvec, rhs, diag=diag, tol=1e-10, maxiter=max(100, 4 * free_idx.size))
+        if not cg.converged:
+            break  # an inexact pressure solve is not a valid Newton step; report converged=False
+        dp = cg.x
+        full = np.zeros(net.n_nodes)
+        full[free_idx] = dp
+        dQ = inv_g * ((full[f] - full[t]) - F)
+        Q += dQ
+        P += full
+        if np.max(np.abs(dQ), initial=0.0) <= tol * (1.0 + np.max(np.abs(Q), initial=0.0)):
+            converged = True
+            break
+    return VentSolution(flow_m3_s=Q, pressure_Pa=P, iterations=it, converged=converged)
+
+@dataclass(frozen=True, eq=False)
+class HeadingCheck:
+    branch: NDArray[np.int64]
+    required_m3_s: NDArray[np.float64]
+    delivered_m3_s: NDArray[np.float64]
+
+    @property
+    def ok(self) -> NDArray[np.bool_]:
+        return self.delivered_m3_s >= self.required_m3_s
+
+def check_headings(sol: VentSolution, headings: Mapping[int, VentInputs]) -> HeadingCheck:
+    """Compare delivered branch airflow with construction_vent_airflow demand per heading branch."""
+    branch = np.fromiter(headings.keys(), dtype=np.int64, count=len(headings))
+    required = np.array([construction_vent_airflow(v).airflow_m3_s for v in headings.values()])
+    return HeadingCheck(
+        branch=branch, required_m3_s=required, delivered_m3_s=np.abs(sol.flow_m3_s[branch])
+    )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from open_gov_tunnel.alignment import Alignment, screen_alignment
+from open_gov_tunnel.classification import RMRInputs, rmr_score, RMR_CLASS_LABELS
+from open_gov_tunnel.cost import CostInputs, tunnel_cost
+from open_gov_tunnel.groundwater import InflowInputs, inflow_per_length
+from open_gov_tunnel.lining import LiningInputs, lining_thickness
+from open_gov_tunnel.settlement import SettlementInputs, settlement_trough
+from open_gov_tunnel.tbm import TBMInputs, tbm_select
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "chainage_m": [0.0, 100.0, 250.0],
+        "length_m": [100.0, 150.0, 50.0],
+        "cover_to_axis_m": [15.0, 20.0, 30.0],
+        "diameter_m": [6.0, 6.0, 4.0],
+        "rqd": [20.0, 13.0, 3.0],
+        "spacing_rating": [20.0, 10.0, 5.0],
+        "condition_rating": [20.0, 12.0, 3.0],
+        "groundwater_rating": [10.0, 7.0, 0.0],
+        "orientation_rating": [5.0, -5.0, -12.0],
+        "strength_rating": [10.0, 5.0, 1.0],
+        "k_m_per_s": [1e-6, 1e-5, 1e-7],
+        "head_above_axis_m": [10.0, 20.0, 5.0],
+        "influence_radius_m": [100.0, 100.0, 1.0],
+        "volume_loss_frac": [0.01, 0.015, 0.005],
+        "ground_pressure_kPa": [300.0, 500.0, 800.0],
+        "ground": ["soft", "mixed", "rock"],
+        "groundwater": ["high", "wet", "dry"],
+        "boulders": [False, True, False],
+        "notes": ["a", "b", "c"],
+    })
+
+
+def test_screen_alignment_matches_scalar_modules() -> None:
+    """One pass over the alignment reproduces each scalar screen per segment"""
+    df = _frame()
+    res = screen_alignment(Alignment.from_frame(df))
+    assert len({len(v) for v in res.values()}) == 1
+    for j, row in df.iterrows():
+        r = rmr_score(
+            RMRInputs(
+                row.rqd,
+                row.spacing_rating,
+                row.condition_rating,
+                row.groundwater_rating,
+                row.orientation_rating,
+                row.strength_rating,
+            )
+        )
+        assert RMR_CLASS_LABELS[res["rmr_class_code"][j]] == r.class_label
+        tr = settlement_trough(
+            SettlementInputs(row.volume_loss_frac, row.diameter_m / 2, row.cover_to_axis_m)
+        )
+        assert res["Smax_m"][j] == pytest.approx(tr.Smax_m)
+        t = lining_thickness(
+            LiningInputs(row.ground_pressure_kPa, row.diameter_m / 2, 0.7, 15_000.0)
+        )
+        assert res["t_req_m"][j] == pytest.approx(t.t_req_m)
+        assert (
+            res["tbm_recommended"][j]
+            == tbm_select(TBMInputs(row.ground, row.groundwater, row.boulders)).recommended
+        )
+        assert (
+            res["tunnel_usd"][j]
+            == tunnel_cost(CostInputs(row.length_m, row.diameter_m, shaft_count=0)).total_usd
+        )
+    q = inflow_per_length(InflowInputs(1e-6, 10.0, 3.0, 100.0)).q_per_m3_s
+    assert res["inflow_m3_s"][0] == pytest.approx(q * 100.0)
+    assert list(res["inflow_valid"]) == [True, True, False]
+
+
+def test_optional_screens_are_skipped() -> None:
+    """Only the cost screen runs when just the geometry columns are given"""
+    al = Alignment(
+        chainage_m=np.arange(4.0),
+        length_m=np.ones(4),
+        cover_to_axis_m=np.full(4, 10.0),
+        diameter_m=np.full(4, 6.0),
+    )
+    assert set(screen_alignment(al)) == {"chainage_m", "length_m", "tunnel_usd"}
+    assert len(al) == 4
+
+
+def test_alignment_validation() -> None:
+    with pytest.raises(ValueError, match="shape"):
+        Alignment(
+            chainage_m=np.arange(3.0),
+            length_m=np.ones(2),
+            cover_to_axis_m=np.ones(3),
+            diameter_m=np.ones(3),
+        )
+    with pytest.raises(ValueError, match="RMR"):
+        Alignment(
+            chainage_m=np.arange(3.0),
+            length_m=np.ones(3),
+            cover_to_axis_m=np.ones(3),
+            diameter_m=np.ones(3),
+            rqd=np.ones(3),
+        )
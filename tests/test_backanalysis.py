@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel import backanalysis as ba
+from open_gov_tunnel.backanalysis import TroughCalibrator, fit_troughs
+from open_gov_tunnel.settlement import (
+    SettlementInputs,
+    settlement_at_x,
+    settlement_trough,
+    settlement_troughs,
+    settlements_at_x,
+)
+
+
+def _synthetic(n_sec: int = 300, per: int = 12, seed: int = 0) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(seed)
+    r = rng.uniform(2.5, 4.0, n_sec)
+    z = rng.uniform(10, 30, n_sec)
+    vl = rng.uniform(0.003, 0.02, n_sec)
+    K = rng.uniform(0.3, 0.7, n_sec)
+    sec = np.repeat(np.arange(n_sec), per)
+    x = rng.uniform(-1, 1, sec.size) * 2 * z[sec]
+    tr = settlement_troughs(vl, r, z, K)
+    return r, z, vl, K, sec, x, settlements_at_x(tr.Smax_m[sec], tr.i_m[sec], x)
+
+
+def test_exact_data_recovers_parameters() -> None:
+    r, z, vl, K, sec, x, s = _synthetic()
+    fit = fit_troughs(sec, x, s, r, z)
+    assert fit.converged.all()
+    np.testing.assert_allclose(fit.volume_loss_frac, vl, rtol=1e-6)
+    np.testing.assert_allclose(fit.K, K, rtol=1e-6)
+    assert np.all(fit.n_readings == 12) and np.all(fit.rmse_m < 1e-9)
+    # model agrees with the scalar screen
+    t = settlement_trough(SettlementInputs(fit.volume_loss_frac[0], r[0], z[0], fit.K[0]))
+    assert settlement_at_x(t, x[0]) == pytest.approx(s[0], rel=1e-6)
+
+
+def test_sections_without_data_keep_start_values() -> None:
+    r, z, _, _, sec, x, s = _synthetic(n_sec=3)
+    keep = sec != 1
+    # section 1 has no readings, section 2 gains one unusable (NaN) reading
+    sec, x, s = np.append(sec[keep], 2), np.append(x[keep], np.nan), np.append(s[keep], 0.0)
+    fit = fit_troughs(sec, x, s, r, z, volume_loss_frac0=0.01, K0=0.5)
+    assert list(fit.converged) == [True, False, True]
+    assert fit.volume_loss_frac[1] == 0.01 and fit.K[1] == 0.5 and fit.n_readings[1] == 0
+    assert np.isnan(fit.rmse_m[1])
+    with pytest.raises(ValueError):
+        fit_troughs([5], [0.0], [0.01], r, z)
+
+
+def test_stalled_sections_are_not_converged(monkeypatch: pytest.MonkeyPatch) -> None:
+    r, z, _, _, sec, x, s = _synthetic(n_sec=4)
+    true_trough = ba._trough
+
+    def uphill(*args: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        S, dv, dk = true_trough(*args)
+        return S, -dv, -dk   # every proposed step increases the cost, so damping runs to the cap
+
+    monkeypatch.setattr(ba, "_trough", uphill)
+    fit = fit_troughs(sec, x, s, r, z)
+    assert not fit.converged.any()
+    assert np.all(fit.iterations < 100)
+    assert fit.volume_loss_frac == pytest.approx(0.01) and fit.K == pytest.approx(0.5)
+
+
+def test_calibrator_refits_only_changed_sections() -> None:
+    r, z, vl, K, sec, x, s = _synthetic(n_sec=50)
+    cal = TroughCalibrator(r, z, sec, x)
+    noisy = s + np.random.default_rng(1).normal(0, 1e-5, s.size)
+    assert cal.refit().size == 0
+    cal.update(np.arange(sec.size), noisy)
+    assert cal.refit().size == 50
+    np.testing.assert_allclose(cal.fit.K, K, rtol=0.05)
+    first = cal.fit.iterations.copy()
+    # a new, deeper trough at section 7 only
+    markers = np.flatnonzero(sec == 7)
+    cal.update(markers, s[markers] * 1.5)
+    assert list(cal.refit()) == [7]
+    assert cal.fit.volume_loss_frac[7] == pytest.approx(1.5 * vl[7], rel=0.05)
+    np.testing.assert_array_equal(cal.fit.iterations[:7], first[:7])
+    assert cal.fit.iterations[7] <= first[7]
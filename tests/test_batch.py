@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from open_gov_tunnel.batch import run_batch
+from open_gov_tunnel.cli import app
+from open_gov_tunnel.cost import CostInputs, tunnel_cost
+from open_gov_tunnel.groundwater import InflowInputs, inflow_per_length
+from open_gov_tunnel.reports import write_templates
+from open_gov_tunnel.settlement import SettlementInputs, settlement_trough
+
+runner = CliRunner()
+
+
+def test_batch_rmr_chunks_and_labels(tmp_path: Path) -> None:
+    """Rows are streamed in chunks and every row is written once, in order"""
+    src = tmp_path / "rmr.csv"
+    rows = [[20, 20, 20, 10, 5, 10], [3, 5, 3, 0, -12, 1]] * 5
+    pd.DataFrame(
+        rows,
+        columns=[
+            "rqd",
+            "spacing_rating",
+            "condition_rating",
+            "groundwater_rating",
+            "orientation_rating",
+            "strength_rating",
+        ],
+    ).to_csv(src, index=False)
+    report = run_batch("rmr", src, tmp_path / "out.csv", chunk_rows=3)
+    assert report.rows == 10
+    assert [c.rows for c in report.chunks] == [3, 3, 3, 1]
+    out = pd.read_csv(tmp_path / "out.csv")
+    assert list(out["class_label"][:2]) == ["I (Very Good)", "V (Very Poor)"]
+    assert "rows/s" in report.summary()
+
+
+def test_batch_inflow_defaults_and_rejects(tmp_path: Path) -> None:
+    """Blank drainage factors take the InflowInputs default and invalid rows are counted"""
+    src = tmp_path / "inflow.csv"
+    src.write_text(
+        "k_m_per_s,head_above_axis_m,radius_m,influence_radius_m,drainage_factor\n"
+        "1e-6,10,3,100,\n1e-6,10,3,2,0.5\n"
+    )
+    report = run_batch("inflow", src, tmp_path / "out.csv")
+    out = pd.read_csv(tmp_path / "out.csv")
+    expected = inflow_per_length(
+        InflowInputs(k_m_per_s=1e-6, head_above_axis_m=10.0, radius_m=3.0, influence_radius_m=100.0)
+    ).q_per_m3_s
+    assert out["q_per_m3_s"][0] == pytest.approx(expected)
+    assert report.rejected == 1
+    assert not out["valid"][1]
+
+
+def test_batch_settlement_and_cost_match_scalar(tmp_path: Path) -> None:
+    """Settlement and cost batches reproduce the scalar functions"""
+    (tmp_path / "s.csv").write_text("volume_loss_frac,radius_m,cover_to_axis_m,K\n0.015,3,15,\n")
+    run_batch("settlement", tmp_path / "s.csv", tmp_path / "s_out.csv")
+    s = pd.read_csv(tmp_path / "s_out.csv")
+    tr = settlement_trough(
+        SettlementInputs(volume_loss_frac=0.015, radius_m=3.0, cover_to_axis_m=15.0)
+    )
+    assert s["Smax_m"][0] == pytest.approx(tr.Smax_m)
+    (tmp_path / "c.csv").write_text(
+        "length_m,diameter_m,complexity,shaft_count,shaft_cost_usd\n1000,4,0.3,1,1000000\n1000,6,,,\n"
+    )
+    run_batch("cost", tmp_path / "c.csv", tmp_path / "c_out.csv")
+    c = pd.read_csv(tmp_path / "c_out.csv")
+    big = CostInputs(length_m=1000, diameter_m=4, complexity=0.3, shaft_count=1, shaft_cost_usd=1e6)
+    assert c["total_usd"][0] == tunnel_cost(big).total_usd
+    assert c["total_usd"][1] == tunnel_cost(CostInputs(length_m=1000, diameter_m=6)).total_usd
+
+
+def test_batch_errors(tmp_path: Path) -> None:
+    """Unknown kinds and missing required columns raise ValueError"""
+    write_templates(tmp_path)
+    with pytest.raises(ValueError):
+        run_batch("vent", tmp_path / "rmr_template.csv", tmp_path / "out.csv")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Missing required columns"):
+        run_batch("cost", tmp_path / "rmr_template.csv", tmp_path / "out.csv")
+
+
+def test_cli_batch(tmp_path: Path) -> None:
+    """The batch subcommand reports row counts and fails cleanly on bad input"""
+    write_templates(tmp_path)
+    r = runner.invoke(
+        app,
+        [
+            "batch",
+            "settlement",
+            "--input",
+            str(tmp_path / "settlement_template.csv"),
+            "--out",
+            str(tmp_path / "out.csv"),
+        ],
+    )
+    assert r.exit_code == 0
+    assert "Rows: 0" in r.stdout
+    r = runner.invoke(
+        app,
+        [
+            "batch",
+            "cost",
+            "--input",
+            str(tmp_path / "rmr_template.csv"),
+            "--out",
+            str(tmp_path / "out.csv"),
+        ],
+    )
+    assert r.exit_code == 1
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from open_gov_tunnel.bench import SUITE_CASES, app, compare_to_baseline, results_to_json, run_suite
+
+runner = CliRunner()
+
+
+def test_suite_covers_all_screens_in_both_modes() -> None:
+    """Every case runs scalar and batch forms and records memory"""
+    results = run_suite(sizes=(1, 50), repeat=1)
+    assert {(r.name, r.mode, r.size) for r in results} == {
+        (n, m, s) for n in SUITE_CASES for m in ("scalar", "batch") for s in (1, 50)
+    }
+    assert all(r.seconds > 0 and r.rows_per_s > 0 and r.peak_bytes >= 0 for r in results)
+    scalar_cap = run_suite(["rmr_score"], sizes=(10, 100), scalar_max_size=10, repeat=1)
+    assert [(r.mode, r.size) for r in scalar_cap] == [("batch", 10), ("scalar", 10), ("batch", 100)]
+
+
+def test_compare_to_baseline_flags_slowdowns() -> None:
+    """A baseline with much higher throughput produces a regression; small sizes are ignored"""
+    results = run_suite(["tunnel_cost"], sizes=(10, 2_000), scalar_max_size=0, repeat=1)
+    baseline = results_to_json(results)
+    assert compare_to_baseline(results, baseline) == []
+    for r in baseline["results"]:
+        r["rows_per_s"] *= 10.0
+    regressions = compare_to_baseline(results, baseline)
+    assert [(g.name, g.size) for g in regressions] == [("tunnel_cost", 2_000)]
+    assert regressions[0].ratio < 0.2
+
+
+def test_suite_cli_writes_json_and_fails_on_regression(tmp_path: Path) -> None:
+    out = tmp_path / "bench.json"
+    args = ["suite", "-n", "q_system", "--max-size", "1000", "--repeat", "1"]
+    r = runner.invoke(app, [*args, "--json", str(out)])
+    assert r.exit_code == 0
+    data = json.loads(out.read_text())
+    assert data["results"][0]["name"] == "q_system"
+    for row in data["results"]:
+        row["rows_per_s"] *= 100.0
+    (tmp_path / "base.json").write_text(json.dumps(data))
+    r = runner.invoke(app, [*args, "--baseline", str(tmp_path / "base.json")])
+    assert r.exit_code == 1
+    assert "REGRESSION" in r.stdout
+
+
+def test_committed_baseline_covers_the_suite() -> None:
+    baseline = json.loads((Path(__file__).parents[1] / "benchmarks" / "baseline.json").read_text())
+    assert {r["name"] for r in baseline["results"]} == set(SUITE_CASES)
+    assert compare_to_baseline([], baseline) == []
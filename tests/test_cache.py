@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from open_gov_tunnel.cache import ResultCache, memoize, stable_key
+from open_gov_tunnel.classification import RMRInputs, RMRResult, rmr_score
+from open_gov_tunnel.cost import CostInputs, tunnel_cost
+from open_gov_tunnel.lining import LiningInputs, lining_thickness
+
+RMR = RMRInputs(
+    rqd=60,
+    spacing_rating=10,
+    condition_rating=10,
+    groundwater_rating=8,
+    orientation_rating=4,
+    strength_rating=10,
+)
+
+
+def test_lru_hits_and_bound() -> None:
+    """Repeated inputs are served from memory and the LRU stays within maxsize"""
+    cache = ResultCache(maxsize=2)
+    assert cache.call(rmr_score, RMR) == rmr_score(RMR)
+    cache.call(rmr_score, RMR)
+    for length in (100.0, 200.0, 300.0):
+        cache.call(tunnel_cost, CostInputs(length_m=length, diameter_m=6.0))
+    s = cache.stats()
+    assert (s.hits, s.misses, s.size) == (1, 4, 2)
+
+
+def test_disk_tier_survives_restart(tmp_path: Path) -> None:
+    """A new cache over the same SQLite file answers from disk without recomputing"""
+    db = tmp_path / "cache.sqlite"
+    with ResultCache(path=db) as first:
+        first.call(rmr_score, RMR)
+    calls: list[RMRInputs] = []
+
+    def counting(inp: RMRInputs) -> RMRResult:
+        calls.append(inp)
+        return rmr_score(inp)
+
+    counting.__qualname__ = rmr_score.__qualname__
+    counting.__module__ = rmr_score.__module__
+    with ResultCache(path=db) as second:
+        assert second.call(counting, RMR) == rmr_score(RMR)
+        assert second.stats().disk_hits == 1
+        second.clear(disk=True)
+        second.call(counting, RMR)
+    assert len(calls) == 1
+
+
+def test_errors_are_not_cached_and_keys_are_stable() -> None:
+    cache = ResultCache()
+    bad = LiningInputs(ground_pressure_kPa=300, radius_m=0, phi_resistance=0.7, fc_allow_kPa=15000)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cache.call(lining_thickness, bad)
+    assert cache.stats().misses == 0
+    assert stable_key(rmr_score, RMR) == stable_key(rmr_score, RMRInputs(60, 10, 10, 8, 4, 10))
+    assert stable_key(rmr_score, RMR) != stable_key(tunnel_cost, RMR)
+    assert stable_key(rmr_score, RMR) == stable_key(
+        rmr_score, RMRInputs(60.0, 10.0, 10.0, 8.0, 4.0, 10.0)
+    )
+    assert stable_key(rmr_score, RMR) != stable_key(rmr_score, RMRInputs(60.5, 10, 10, 8, 4, 10))
+    with pytest.raises(TypeError):
+        stable_key(rmr_score, 1.0)
+    cached_rmr = memoize(cache)(rmr_score)
+    assert cached_rmr(RMR).rmr == rmr_score(RMR).rmr
+    assert cached_rmr.__name__ == "rmr_score"
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from open_gov_tunnel.classification import (
+    Q_CATEGORY_LABELS,
+    RMR_CLASS_LABELS,
+    QInputs,
+    RMRInputs,
+    q_system,
+    q_values,
+    q_values_frame,
+    rmr_score,
+    rmr_scores,
+    rmr_scores_frame,
+)
+
+
+def test_rmr_scores_match_scalar() -> None:
+    """Batch RMR scores and labels agree with rmr_score row by row, including clamping and NaN"""
+    rng = np.random.default_rng(1)
+    cols = rng.uniform(-30.0, 40.0, size=(6, 500))
+    cols[0, 0] = np.nan
+    cols[:, 1] = [20, 20, 20, 10, 5, 5]  # exactly 80
+    res = rmr_scores(*cols)
+    assert res.class_code.dtype == np.int8
+    labels = res.class_labels()
+    for j in range(cols.shape[1]):
+        s = rmr_score(RMRInputs(*(float(c) for c in cols[:, j])))
+        assert res.rmr[j] == s.rmr
+        assert labels[j] == s.class_label
+
+
+def test_q_values_match_scalar() -> None:
+    """Batch Q values and categories agree with q_system, including the 1e-6 floors"""
+    rng = np.random.default_rng(2)
+    cols = 10.0 ** rng.uniform(-3.0, 2.0, size=(6, 500))
+    cols[1, 0] = 0.0
+    cols[0, 1] = -5.0
+    cols[:, 2] = [40, 4, 1, 1, 1, 1]  # exactly 10
+    res = q_values(*cols)
+    labels = res.category_labels()
+    for j in range(cols.shape[1]):
+        s = q_system(QInputs(*(float(c) for c in cols[:, j])))
+        assert res.Q[j] == s.Q
+        assert labels[j] == s.category
+
+
+def test_frame_entry_points() -> None:
+    """DataFrame entry points use the template column names"""
+    df = pd.DataFrame(
+        {
+            "rqd": [20.0, 3.0],
+            "spacing_rating": [20.0, 5.0],
+            "condition_rating": [20.0, 3.0],
+            "groundwater_rating": [10.0, 0.0],
+            "orientation_rating": [5.0, -12.0],
+            "strength_rating": [10.0, 1.0],
+        }
+    )
+    res = rmr_scores_frame(df)
+    assert [RMR_CLASS_LABELS[c] for c in res.class_code] == ["I (Very Good)", "V (Very Poor)"]
+    q = q_values_frame(
+        {"rqd": [95.0], "Jn": [2.0], "Jr": [3.0], "Ja": [1.0], "Jw": [1.0], "SRF": [1.0]}
+    )
+    assert Q_CATEGORY_LABELS[q.category_code[0]] == "Excellent/Very Good"
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from open_gov_tunnel.bench import startup_benchmark
+
+
+def test_cli_import_is_lazy() -> None:
+    """Importing the CLI does not pull in pandas, rich or the calculator modules"""
+    code = (
+        "import sys; import open_gov_tunnel.cli; "
+        "print(sorted(m for m in ('pandas', 'rich.console', 'open_gov_tunnel.classification')"
+        " if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_scalar_classification_does_not_load_numpy() -> None:
+    code = (
+        "import sys; from open_gov_tunnel.classification import RMRInputs, rmr_score; "
+        "rmr_score(RMRInputs(50, 10, 10, 10, 0, 10)); print('numpy' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_console_attribute_is_lazy_and_compatible() -> None:
+    from rich.console import Console
+
+    import open_gov_tunnel.cli as cli
+
+    assert isinstance(cli.console, Console) and cli.console is cli.console
+    with pytest.raises(AttributeError):
+        cli.no_such_attribute
+
+
+def test_startup_benchmark_reports_per_subcommand() -> None:
+    """Scalar subcommands run without loading pandas"""
+    rows = startup_benchmark(["list-states"], repeat=1)
+    assert rows[0].subcommand == "list-states"
+    assert rows[0].wall_s >= rows[0].in_process_s > 0
+    assert not rows[0].loads_pandas
+    with pytest.raises(ValueError):
+        startup_benchmark(["nope"])
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.cost import CostInputs, tunnel_cost
+from open_gov_tunnel.cost_sweep import (
+    grid_size,
+    iter_cost_grid,
+    pareto_costs,
+    pareto_mask,
+    top_k_costs,
+)
+
+GRID = {
+    "length_m": [500.0, 1000.0, 2500.0],
+    "diameter_m": [4.0, 4.99, 5.0, 8.0],
+    "complexity": [0.2, 0.5, 1.3],
+    "shaft_count": [0, 2],
+}
+
+
+def test_chunks_match_scalar_cost() -> None:
+    """Every scenario of the lazy product matches tunnel_cost, across chunk boundaries"""
+    chunks = list(iter_cost_grid(GRID, chunk_size=7))
+    assert sum(len(c["total_usd"]) for c in chunks) == grid_size(GRID) == 72
+    totals = np.concatenate([c["total_usd"] for c in chunks])
+    for j, (L, D, cx, n) in enumerate(itertools.product(*GRID.values())):
+        inp = CostInputs(length_m=L, diameter_m=D, complexity=cx, shaft_count=int(n))
+        assert totals[j] == tunnel_cost(inp).total_usd
+
+
+def test_top_k_and_pareto_against_brute_force() -> None:
+    """Bounded-memory selections equal the ones computed on the full grid"""
+    full = next(iter_cost_grid(GRID, chunk_size=1000))
+    top = top_k_costs(GRID, k=5, chunk_size=10)
+    assert list(top["total_usd"]) == sorted(full["total_usd"])[:5]
+    front = pareto_costs(GRID, chunk_size=10)
+    obj = np.column_stack([full["total_usd"], -full["diameter_m"]])
+    expected = full["scenario"][pareto_mask(obj)]
+    assert sorted(front["scenario"]) == sorted(expected)
+    for j in range(len(front["total_usd"])):
+        cost, dia = front["total_usd"][j], front["diameter_m"][j]
+        dominated = (
+            (full["total_usd"] <= cost)
+            & (full["diameter_m"] >= dia)
+            & ((full["total_usd"] < cost) | (full["diameter_m"] > dia))
+        )
+        assert not dominated.any()
+
+
+def test_pareto_mask_duplicates_and_validation() -> None:
+    pts = np.array([[1.0, 1.0], [1.0, 1.0], [0.0, 2.0], [2.0, 2.0]])
+    assert list(pareto_mask(pts)) == [True, False, True, False]
+    for bad in (np.nan, np.inf):
+        with pytest.raises(ValueError, match="finite"):
+            pareto_mask(np.array([[1.0, 1.0], [bad, 0.0], [0.0, 2.0]]))
+    with pytest.raises(ValueError, match="needs values"):
+        list(iter_cost_grid({"length_m": [1.0]}))
+    with pytest.raises(ValueError, match="Unknown"):
+        list(iter_cost_grid({"length_m": [1.0], "diameter_m": [5.0], "depth": [1.0]}))
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.evacuation import EvacuationInputs, exit_positions, simulate_evacuation
+from open_gov_tunnel.fire_safety import EgressInputs, egress_screen
+
+
+def test_exit_layout_follows_egress_screen() -> None:
+    inp = EgressInputs(tunnel_length_m=1000.0)
+    pos, portal = exit_positions(inp)
+    assert pos.size == egress_screen(inp).required_passages + 2
+    assert portal.sum() == 2 and pos[0] == 0.0 and pos[-1] == 1000.0
+
+
+def test_explicit_exit_chainages() -> None:
+    egress = EgressInputs(tunnel_length_m=1000.0, walkway_speed_mps=1.0)
+    pos, portal = exit_positions(egress, [1000.0, 250.0, 0.0])
+    assert list(pos) == [0.0, 250.0, 1000.0] and list(portal) == [True, False, True]
+    # a single exit at one portal: the far end walks the full length
+    inp = EvacuationInputs(
+        egress, occupants=500, speed_sd_mps=0.0, pre_movement_max_s=0.0, door_flow_pps=float("inf")
+    )
+    res = simulate_evacuation(inp, replicates=2, exit_chainages_m=[0.0])
+    assert list(res.exits_m) == [0.0]
+    assert res.clear_times_s.max() == pytest.approx(1000.0, rel=0.02)
+    with pytest.raises(ValueError, match="within the tunnel"):
+        exit_positions(egress, [-5.0, 500.0])
+    with pytest.raises(ValueError, match="non-empty"):
+        exit_positions(egress, [])
+
+
+def test_unconstrained_doors_bounded_by_static_estimate() -> None:
+    """With free-flowing doors and fixed speed nobody walks further than half the exit spacing"""
+    egress = EgressInputs(tunnel_length_m=1520.0, max_spacing_m=152.0, walkway_speed_mps=1.0)
+    inp = EvacuationInputs(
+        egress, occupants=2000, speed_sd_mps=0.0, pre_movement_max_s=0.0, door_flow_pps=float("inf")
+    )
+    res = simulate_evacuation(inp, replicates=3)
+    spacing = 1520.0 / (egress_screen(egress).required_passages + 1)
+    assert np.all(res.clear_times_s <= spacing / 2.0 + 1e-9)
+    assert res.clear_times_s.max() == pytest.approx(spacing / 2.0, rel=0.02)
+    assert res.egress_times_s.size == 6000
+
+
+def test_door_capacity_creates_queues() -> None:
+    """Limited door flow delays clearance by roughly occupants per door / flow"""
+    egress = EgressInputs(tunnel_length_m=600.0, max_spacing_m=200.0)
+    inf = float("inf")
+    free_inp = EvacuationInputs(egress, occupants=3000, door_flow_pps=inf, portal_flow_pps=inf)
+    slow_inp = EvacuationInputs(egress, occupants=3000, door_flow_pps=1.0, portal_flow_pps=1.0)
+    free = simulate_evacuation(free_inp, replicates=2, seed=1)
+    slow = simulate_evacuation(slow_inp, replicates=2, seed=1)
+    assert slow.clear_time_quantile(0.5) > free.clear_time_quantile(0.5) + 300.0
+    assert slow.max_queue.min() > 100
+    assert np.all(free.max_queue == 0)
+
+
+def test_reproducible_and_validated() -> None:
+    inp = EvacuationInputs(EgressInputs(tunnel_length_m=500.0), occupants=100)
+    first, again = simulate_evacuation(inp, seed=5), simulate_evacuation(inp, seed=5)
+    assert np.array_equal(first.clear_times_s, again.clear_times_s)
+    with pytest.raises(ValueError):
+        simulate_evacuation(EvacuationInputs(EgressInputs(tunnel_length_m=500.0), occupants=0))
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.face_advance import FaceAdvanceSettlement, longitudinal_settlement
+from open_gov_tunnel.settlement import SettlementInputs, settlement_at_x, settlement_trough
+
+INP = SettlementInputs(volume_loss_frac=0.015, radius_m=3.0, cover_to_axis_m=15.0, K=0.5)
+
+
+def test_longitudinal_profile_limits() -> None:
+    """Half of the transverse trough above the face, full trough far behind, nothing far ahead"""
+    tr = settlement_trough(INP)
+    s = longitudinal_settlement(
+        INP, [500.0, 1000.0, 2000.0], [5.0, 5.0, 5.0], face_m=1000.0, start_m=0.0
+    )
+    full = settlement_at_x(tr, 5.0)
+    assert s[0] == pytest.approx(full)
+    assert s[1] == pytest.approx(0.5 * full)
+    assert s[2] == pytest.approx(0.0, abs=1e-15)
+
+
+def test_incremental_field_stays_within_tolerance() -> None:
+    """Daily advances touch only a window of receptors and stay within tol of a full recompute"""
+    rng = np.random.default_rng(4)
+    y = rng.uniform(0.0, 10_000.0, 50_000)
+    x = rng.uniform(-40.0, 40.0, 50_000)
+    model = FaceAdvanceSettlement(INP, y, x, start_m=0.0, tol_m=1e-4)
+    evaluated = 0
+    for upd in model.run(np.arange(20.0, 10_001.0, 20.0)):
+        evaluated += upd.evaluated
+    exact = longitudinal_settlement(INP, y, x, face_m=model.face_m, start_m=0.0)
+    assert np.max(np.abs(model.settlement_m - exact)) <= 1e-4
+    assert evaluated < 0.1 * 500 * y.size
+
+
+def test_face_cannot_retreat() -> None:
+    model = FaceAdvanceSettlement(INP, [0.0, 10.0], [0.0, 0.0])
+    model.advance(5.0)
+    with pytest.raises(ValueError):
+        model.advance(4.0)
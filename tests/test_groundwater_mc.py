@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.groundwater import InflowInputs, inflow_per_length, inflows_per_length
+from open_gov_tunnel.groundwater_mc import InflowUncertainty, LogHistogram, inflow_monte_carlo
+
+BASE = InflowInputs(
+    k_m_per_s=1e-6,
+    head_above_axis_m=10.0,
+    radius_m=3.0,
+    influence_radius_m=100.0,
+    drainage_factor=0.8,
+)
+
+
+def test_inflows_per_length_mask_matches_scalar_validation() -> None:
+    """Rows rejected by the scalar ValueError are masked and counted"""
+    res = inflows_per_length(
+        [1e-6, 0.0, 1e-6, 1e-6], [10.0, 10.0, -1.0, 10.0], 3.0, [100.0, 100.0, 100.0, 2.0], 0.8
+    )
+    assert list(res.valid) == [True, False, False, False]
+    assert res.rejected == 3
+    assert res.q_per_m3_s[0] == inflow_per_length(BASE).q_per_m3_s
+
+
+def test_deterministic_case_collapses_to_scalar() -> None:
+    """With zero spread all quantiles fall in the bin of the deterministic inflow"""
+    res = inflow_monte_carlo(
+        InflowUncertainty(BASE, k_sigma_ln=0.0), n_samples=1000, block_size=300
+    )
+    q = inflow_per_length(BASE).q_per_m3_s
+    assert res.mean_q_per_m3_s == pytest.approx(q)
+    assert res.p50 == pytest.approx(q, rel=0.012)
+    assert res.rejected == 0
+
+
+def test_lognormal_quantiles_and_rejections() -> None:
+    """P90 of a lognormal k matches the analytic value; negative heads are rejected"""
+    res = inflow_monte_carlo(
+        InflowUncertainty(BASE, k_sigma_ln=1.0), n_samples=400_000, seed=7, block_size=100_000
+    )
+    q = inflow_per_length(BASE).q_per_m3_s
+    assert res.p50 == pytest.approx(q, rel=0.03)
+    assert res.p90 == pytest.approx(q * np.exp(1.2815516), rel=0.03)
+    assert res.p50 < res.p90 < res.p99
+    noisy = inflow_monte_carlo(InflowUncertainty(BASE, head_sd_m=10.0), n_samples=10_000)
+    assert 1000 < noisy.rejected < 2200
+
+
+def test_parallel_matches_serial() -> None:
+    """Per-block seed streams make results independent of the worker count"""
+    unc = InflowUncertainty(BASE, k_sigma_ln=0.5, head_sd_m=2.0, influence_radius_sigma_ln=0.3)
+    a = inflow_monte_carlo(unc, n_samples=20_000, seed=3, block_size=5_000)
+    b = inflow_monte_carlo(unc, n_samples=20_000, seed=3, block_size=5_000, workers=2)
+    assert np.array_equal(a.histogram.counts, b.histogram.counts)
+    assert a.mean_q_per_m3_s == b.mean_q_per_m3_s
+
+
+def test_histogram_edges_and_range_counts() -> None:
+    h = LogHistogram(lo=1e-3, hi=1e3, bins_per_decade=10)
+    h.add(np.array([1e-6, 0.5, 2.0, 5e4, 7e4]))
+    assert (h.underflow, h.overflow, h.zeros) == (1, 2, 0)
+    assert h.quantile(0.0) > 0.0          # no zero samples: the minimum is not 0
+    inside = LogHistogram(lo=1e-3, hi=1e3, bins_per_decade=10)
+    inside.add(np.array([2.0, 3.0]))
+    assert 10 ** -0.1 * 2.0 <= inside.quantile(0.0) <= 2.0
+    other = LogHistogram(lo=1e-3, hi=1e3, bins_per_decade=10)
+    other.add(np.array([0.0, 1e4]))
+    h.merge(other)
+    assert (h.underflow, h.overflow, h.zeros) == (1, 3, 1) and h.quantile(0.0) == 0.0
+    res = inflow_monte_carlo(InflowUncertainty(BASE), n_samples=10)
+    assert res.out_of_range == 0
+
+
+def test_histogram_validation() -> None:
+    with pytest.raises(ValueError):
+        LogHistogram(lo=1.0, hi=0.5)
+    with pytest.raises(ValueError):
+        LogHistogram().merge(LogHistogram(bins_per_decade=10))
+    with pytest.raises(ValueError):
+        inflow_monte_carlo(InflowUncertainty(BASE), n_samples=0)
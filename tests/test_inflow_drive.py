@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.groundwater import inflows_per_length
+from open_gov_tunnel.inflow_drive import DriveInflowParams, DriveInflowSimulator, simulate_drive
+
+
+def _brute(
+    ch: np.ndarray, length: float, k: np.ndarray, head: np.ndarray, r: float, R: float,
+    df: np.ndarray, params: DriveInflowParams, faces: np.ndarray, dt: float = 1.0,
+) -> np.ndarray:
+    q = inflows_per_length(k, head, r, R, 1.0).q_per_m3_s * length
+    end = ch + length
+    t_exp = np.full(ch.size, np.inf)
+    out = []
+    for j, f in enumerate(faces):
+        day = (j + 1) * dt
+        t_exp = np.where((end <= f) & np.isinf(t_exp), day, t_exp)
+        exposed = np.isfinite(t_exp)
+        age = np.where(exposed, day - t_exp, 0.0)
+        factor = 1 + (params.peak_factor - 1) * np.exp(-age / params.decay_days)
+        grout = np.where(age >= params.grout_delay_days, df, 1.0)
+        out.append(np.sum(np.where(exposed, q * factor * grout, 0.0)))
+    return np.array(out)
+
+
+def test_matches_full_reevaluation_within_tolerance() -> None:
+    rng = np.random.default_rng(3)
+    n = 400
+    ch = np.arange(n) * 5.0
+    k = 10 ** rng.uniform(-8, -5, n)
+    head = rng.uniform(5, 40, n)
+    df = rng.uniform(0.1, 1.0, n)
+    params = DriveInflowParams(rel_tol=1e-4)
+    faces = np.minimum(np.arange(1, 801) * 4.0, 2000.0)
+    res = simulate_drive(DriveInflowSimulator(ch, 5.0, k, head, 3.0, 100.0, df, params), faces)
+    ref = _brute(ch, 5.0, k, head, 3.0, 100.0, df, params, faces)
+    np.testing.assert_allclose(res.inflow_m3_s, ref, rtol=2e-4)
+    assert res.active_segments.max() < n
+    assert res.active_segments[-1] == 0
+    np.testing.assert_allclose(res.volume_m3[-1], np.sum(res.inflow_m3_s) * 86_400.0)
+
+
+def test_grouting_reduces_long_term_inflow() -> None:
+    ch = np.arange(10) * 10.0
+    face = np.full(400, 100.0)
+    plain = simulate_drive(DriveInflowSimulator(ch, 10.0, 1e-6, 20.0, 3.0, 100.0, 1.0), face)
+    grouted = simulate_drive(DriveInflowSimulator(ch, 10.0, 1e-6, 20.0, 3.0, 100.0, 0.25), face)
+    assert plain.inflow_m3_s[0] == pytest.approx(grouted.inflow_m3_s[0])
+    assert grouted.inflow_m3_s[-1] == pytest.approx(0.25 * plain.inflow_m3_s[-1])
+    steady = inflows_per_length(1e-6, 20.0, 3.0, 100.0).q_per_m3_s * 100.0
+    assert plain.inflow_m3_s[-1] == pytest.approx(steady)
+    assert plain.inflow_m3_s[0] == pytest.approx(3.0 * steady)
+
+
+def test_invalid_segments_are_reported_and_face_cannot_retreat() -> None:
+    sim = DriveInflowSimulator([0.0, 10.0], 10.0, 1e-6, 20.0, 3.0, [100.0, 2.0])
+    assert sim.rejected == 1
+    sim.step(1.0, 20.0)
+    with pytest.raises(ValueError):
+        sim.step(2.0, 5.0)
+    with pytest.raises(ValueError, match="day"):
+        sim.step(0.5, 20.0)
+    with pytest.raises(ValueError):
+        DriveInflowSimulator([10.0, 0.0], 10.0, 1e-6, 20.0, 3.0, 100.0)
+    with pytest.raises(ValueError, match="ends"):
+        DriveInflowSimulator([0.0, 5.0], [50.0, 10.0], 1e-6, 20.0, 3.0, 100.0)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.classification import RMRInputs, rmr_score
+from open_gov_tunnel.kriging import Variogram, fit_variogram, krige_rock_mass, ordinary_kriging
+
+
+def _global_kriging(
+    x: np.ndarray, v: np.ndarray, q: np.ndarray, vg: Variogram
+) -> tuple[np.ndarray, np.ndarray]:
+    n = x.size
+    A = np.ones((n + 1, n + 1))
+    A[:n, :n] = vg(x[:, None] - x[None, :])
+    A[n, n] = 0.0
+    est, var = [], []
+    for qq in q:
+        b = np.append(vg(x - qq), 1.0)
+        s = np.linalg.solve(A, b)
+        est.append(s[:n] @ v)
+        var.append(s[:n] @ b[:n] + s[n])
+    return np.array(est), np.array(var)
+
+
+@pytest.mark.parametrize("model", ["spherical", "exponential", "gaussian"])
+def test_full_neighbourhood_matches_global_system(model: str) -> None:
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 1000, 30)
+    v = np.sin(x / 80) + rng.normal(0, 0.1, 30)
+    vg = Variogram(model, 0.01, 0.5, 300.0)
+    q = np.linspace(-50, 1050, 57)
+    est, var = _global_kriging(x, v, q, vg)
+    res = ordinary_kriging(x, v, q, vg, n_neighbours=30, chunk_size=10)
+    np.testing.assert_allclose(res.estimate, est, atol=1e-8)
+    np.testing.assert_allclose(res.variance, var, atol=1e-8)
+
+
+def test_local_neighbourhood_and_search_radius() -> None:
+    rng = np.random.default_rng(1)
+    x = np.sort(rng.uniform(0, 5000, 400))
+    v = rng.normal(60, 10, 400)
+    vg = Variogram("spherical", 0.0, 100.0, 200.0)
+    at_samples = ordinary_kriging(x, v, x, vg, n_neighbours=8)
+    np.testing.assert_allclose(at_samples.estimate, v, rtol=1e-5)
+    np.testing.assert_allclose(at_samples.variance, 0.0, atol=1e-3)
+    q = np.array([2500.0, 9000.0])
+    near = ordinary_kriging(x, v, q, vg, n_neighbours=12, max_distance_m=60.0)
+    inside = np.abs(x - 2500.0) <= 60.0
+    ref = ordinary_kriging(x[inside], v[inside], [2500.0], vg, n_neighbours=int(inside.sum()))
+    assert near.n_neighbours[0] == inside.sum() and near.n_neighbours[1] == 0
+    assert near.estimate[0] == pytest.approx(ref.estimate[0])
+    assert np.isnan(near.estimate[1]) and np.isnan(near.variance[1])
+
+
+def test_fit_variogram_recovers_range() -> None:
+    rng = np.random.default_rng(2)
+    m = 20_000
+    x = np.arange(m) * 5.0
+    phi = np.exp(-3 * 5.0 / 100.0)
+    z = np.zeros(m)
+    e = rng.normal(0, 1, m)
+    for i in range(1, m):
+        z[i] = phi * z[i - 1] + np.sqrt(1 - phi ** 2) * e[i]
+    vg = fit_variogram(x, z, "exponential")
+    assert vg.range_m == pytest.approx(100.0, rel=0.3)
+    assert vg.nugget + vg.sill == pytest.approx(1.0, rel=0.1)
+    with pytest.raises(ValueError):
+        Variogram("linear")
+
+
+def test_krige_rock_mass_between_boreholes() -> None:
+    ch = np.array([0.0, 500.0, 1000.0, 1500.0, 2000.0])
+    ratings = [RMRInputs(r, 10, 15, 10, -5, 7) for r in (10, 20, 40, 30, 15)]
+    rmr = np.array([rmr_score(r).rmr for r in ratings])
+    Q = np.array([0.5, 2.0, 12.0, 5.0, 1.0])
+    rv, qv = Variogram("spherical", 0.0, 100.0, 800.0), Variogram("spherical", 0.0, 0.5, 800.0)
+    est = krige_rock_mass(ch, rmr, Q, [0.0, 750.0, 1000.0], rmr_variogram=rv, q_variogram=qv)
+    assert est.rmr[0] == pytest.approx(rmr[0]) and est.Q[2] == pytest.approx(12.0)
+    assert rmr[1] < est.rmr[1] < rmr[2]
+    assert est.rmr_variance[1] > est.rmr_variance[0]
+    assert est.rmr_class_code.dtype == np.int8 and est.Q_category_code[2] == 0
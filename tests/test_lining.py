@@ -1,7 +1,32 @@
 from __future__ import annotations
 
-from open_gov_tunnel.lining import LiningInputs, lining_thickness
+import numpy as np
+
+from open_gov_tunnel.lining import LiningInputs, lining_load_cases, lining_thickness
 
 def test_lining_thickness() -> None:
     res = lining_thickness(LiningInputs(ground_pressure_kPa=300, radius_m=3.0, phi_resistance=0.7, fc_allow_kPa=15000.0, t_min_m=0.25))
     assert res.t_req_m >= 0.25
+
+def test_lining_load_cases_match_scalar_envelope() -> None:
+    rng = np.random.default_rng(0)
+    pressure = rng.uniform(50, 900, (40, 30))
+    radius = rng.uniform(2, 6, 40)
+    env = lining_load_cases(pressure, radius, 0.7, 15000.0, 0.25, chunk_pairs=64)
+    for i in range(40):
+        ts = [
+            lining_thickness(LiningInputs(pressure[i, j], radius[i], 0.7, 15000.0, 0.25)).t_req_m
+            for j in range(30)
+        ]
+        assert env.t_req_m[i] == max(ts)
+        assert env.governing_case[i] == int(np.argmax(pressure[i]))
+    assert env.OK.all()
+
+def test_lining_load_cases_shared_cases_and_validity() -> None:
+    env = lining_load_cases([100.0, np.nan, 900.0], [3.0, 4.0, 0.0], 0.7, 15000.0)
+    assert list(env.governing_case) == [2, 2, -1]
+    assert list(env.valid) == [True, True, False]
+    assert np.isnan(env.t_req_m[2])
+    assert env.t_req_m[1] == lining_thickness(LiningInputs(900.0, 4.0, 0.7, 15000.0)).t_req_m
+    none = lining_load_cases([[np.nan, np.nan]], [3.0], 0.7, 15000.0)
+    assert not none.valid[0] and none.governing_case[0] == -1
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.groundwater import InflowInputs, inflow_per_length
+from open_gov_tunnel.monitoring import (
+    ALARM,
+    ALERT,
+    RATE,
+    InstrumentMonitor,
+    predicted_inflow,
+    predicted_settlement,
+    trigger_levels,
+)
+from open_gov_tunnel.settlement import SettlementInputs, settlement_at_x, settlement_trough
+
+
+def test_predictions_match_scalar_screens() -> None:
+    tr = settlement_trough(SettlementInputs(0.01, 3.0, 20.0))
+    expected = [settlement_at_x(tr, 0.0), settlement_at_x(tr, 5.0)]
+    np.testing.assert_allclose(predicted_settlement(tr.Smax_m, tr.i_m, [0.0, 5.0]), expected)
+    q = predicted_inflow(1e-6, 20.0, 3.0, 100.0, 50.0)
+    q_per_m = inflow_per_length(InflowInputs(1e-6, 20.0, 3.0, 100.0)).q_per_m3_s
+    assert q == pytest.approx(50.0 * q_per_m)
+
+
+def test_trigger_and_rate_flags() -> None:
+    alert, alarm = trigger_levels([0.02, 0.01])
+    mon = InstrumentMonitor(alert, alarm, rate_limit_per_day=[0.005, math.inf], window=4)
+    assert mon.ingest(0, 0.0, 0.010) == 0
+    assert mon.ingest(0, 1.0, 0.017) == (ALERT | RATE)
+    assert mon.ingest(0, 2.0, 0.021) == (ALERT | ALARM)
+    assert mon.ingest(1, 0.0, 0.5) == (ALERT | ALARM)   # no rate limit on instrument 1
+    for day in range(3, 10):
+        mon.ingest(0, float(day), 0.021)
+    t, v = mon.history(0)
+    np.testing.assert_array_equal(t, [6.0, 7.0, 8.0, 9.0])
+    assert list(mon.status) == [ALERT | ALARM, ALERT | ALARM]
+    ev = mon.events()
+    assert list(ev["instrument"]) == [0, 0, 1]
+    assert list(ev["flags"]) == [ALERT | RATE, ALERT | ALARM, ALERT | ALARM]
+
+
+def test_batch_ingest_matches_sequential() -> None:
+    rng = np.random.default_rng(0)
+    n, m = 200, 20_000
+    alert, alarm = trigger_levels(rng.uniform(0.01, 0.03, n))
+    ids = rng.integers(0, n, m)
+    t = np.sort(rng.uniform(0, 30, m))
+    v = alarm[ids] * rng.uniform(0, 1.2, m)
+    seq = InstrumentMonitor(alert, alarm, 0.01, window=8, rate_lag=2)
+    bat = InstrumentMonitor(alert, alarm, 0.01, window=8, rate_lag=2)
+    flags_seq = [seq.ingest(int(i), float(a), float(b)) for i, a, b in zip(ids, t, v)]
+    chunks = [slice(k, k + 3000) for k in range(0, m, 3000)]
+    flags_bat = np.concatenate([bat.ingest_many(ids[c], t[c], v[c]) for c in chunks])
+    np.testing.assert_array_equal(flags_bat, flags_seq)
+    np.testing.assert_array_equal(bat.values, seq.values)
+    np.testing.assert_array_equal(bat.count, seq.count)
+    np.testing.assert_array_equal(bat.status, seq.status)
+    for name, column in seq.events().items():
+        np.testing.assert_array_equal(bat.events()[name], column)
+    two = InstrumentMonitor([1.0, 1.0], [2.0, 2.0])
+    two.ingest_many([1, 0], [0.0, 0.0], [1.5, 3.0])
+    assert two.events()["instrument"].tolist() == [1, 0]
+
+
+def test_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        InstrumentMonitor([1.0], [2.0], window=2, rate_lag=2)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.alignment import Alignment, screen_alignment
+from open_gov_tunnel.groundwater import InflowBatchResult, inflows_per_length
+from open_gov_tunnel.parallel import run_sharded, screen_alignment_parallel, shard_bounds
+
+
+def _inflow_shard(cols: dict[str, np.ndarray], R: float) -> InflowBatchResult:
+    return inflows_per_length(cols["k"], cols["head"], cols["r"], R)
+
+
+def _fail_on_negative(cols: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    if np.any(cols["x"] < 0):
+        raise ValueError("negative input")
+    return {"y": cols["x"] * 2}
+
+
+def test_shard_bounds_cover_rows() -> None:
+    assert shard_bounds(10, 4) == [(0, 4), (4, 8), (8, 10)]
+    with pytest.raises(ValueError):
+        shard_bounds(10, 0)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_results_preserve_order_and_match_serial(workers: int) -> None:
+    rng = np.random.default_rng(0)
+    k, head = 10 ** rng.uniform(-8, -5, 1000), rng.uniform(1, 40, 1000)
+    cols = {"k": k, "head": head, "r": np.full(1000, 3.0)}
+    res = run_sharded(_inflow_shard, cols, {"R": 100.0}, shard_rows=128, workers=workers)
+    assert res.ok and len(res.results) == 8
+    out = res.concat()
+    ref = inflows_per_length(cols["k"], cols["head"], cols["r"], 100.0)
+    np.testing.assert_array_equal(out.q_per_m3_s, ref.q_per_m3_s)
+    np.testing.assert_array_equal(out.valid, ref.valid)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failures_are_reported_per_shard(workers: int) -> None:
+    x = np.arange(10.0)
+    x[[5, 9]] = -1
+    res = run_sharded(_fail_on_negative, {"x": x}, shard_rows=3, workers=workers)
+    assert [e.shard for e in res.errors] == [1, 3]
+    assert res.errors[0].start == 3 and res.errors[0].stop == 6
+    assert "negative input" in res.errors[0].error and "ValueError" in res.errors[0].traceback
+    assert res.results[1] is None
+    np.testing.assert_array_equal(res.results[2]["y"], [12.0, 14.0, 16.0])
+    with pytest.raises(RuntimeError):
+        res.concat()
+
+
+def test_screen_alignment_parallel_matches_serial() -> None:
+    n = 500
+    rng = np.random.default_rng(1)
+    al = Alignment(
+        chainage_m=np.arange(n) * 10.0,
+        length_m=np.full(n, 10.0),
+        cover_to_axis_m=rng.uniform(10, 40, n),
+        diameter_m=np.full(n, 6.0),
+        volume_loss_frac=np.full(n, 0.01),
+        K=np.full(n, 0.5),
+        ground=np.where(rng.random(n) < 0.5, "rock", "soft"),
+        groundwater=np.full(n, "wet"),
+    )
+    par = screen_alignment_parallel(al, shard_rows=64, workers=2)
+    ser = screen_alignment(al)
+    assert par.keys() == ser.keys()
+    for k in ser:
+        np.testing.assert_array_equal(par[k], ser[k])
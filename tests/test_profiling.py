@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import importlib
+import inspect
+import json
+from pathlib import Path
+import pkgutil
+
+import numpy as np
+from typer.testing import CliRunner
+
+import open_gov_tunnel
+from open_gov_tunnel import alignment, groundwater, settlement
+from open_gov_tunnel.alignment import Alignment
+from open_gov_tunnel.cli import app
+from open_gov_tunnel.profiling import SCREENING_FUNCTIONS, Profiler
+
+
+def _alignment(n: int = 50) -> Alignment:
+    return Alignment(
+        chainage_m=np.arange(n) * 10.0, length_m=np.full(n, 10.0), cover_to_axis_m=np.full(n, 20.0),
+        diameter_m=np.full(n, 6.0), k_m_per_s=np.full(n, 1e-6), head_above_axis_m=np.full(n, 15.0),
+        influence_radius_m=np.full(n, 100.0), volume_loss_frac=np.full(n, 0.01), K=np.full(n, 0.5),
+    )
+
+
+def test_profiler_patches_and_restores() -> None:
+    original = groundwater.inflows_per_length
+    bound = alignment.inflows_per_length
+    with Profiler() as prof:
+        assert groundwater.inflows_per_length is not original
+        assert alignment.inflows_per_length is not bound
+        for _ in range(3):
+            alignment.screen_alignment(_alignment())
+        inp = settlement.SettlementInputs(volume_loss_frac=0.01, radius_m=3.0, cover_to_axis_m=20.0)
+        settlement.settlement_trough(inp)
+    assert groundwater.inflows_per_length is original
+    assert alignment.inflows_per_length is bound
+    stats = {s.name: s for s in prof.stats()}
+    top = stats["alignment.screen_alignment"]
+    assert top.calls == 3 and stats["groundwater.inflows_per_length"].calls == 3
+    assert stats["settlement.settlement_trough"].calls == 1
+    assert top.total_s >= top.self_s >= 0
+    assert top.total_s >= stats["groundwater.inflows_per_length"].total_s
+    assert top.peak_alloc_bytes > 0
+    assert "alignment.screen_alignment" in prof.summary()
+
+
+def test_chrome_trace(tmp_path: Path) -> None:
+    with Profiler(trace_memory=False, trace_events=True) as prof:
+        alignment.screen_alignment(_alignment())
+    prof.write_chrome_trace(tmp_path / "t.json")
+    events = json.loads((tmp_path / "t.json").read_text())["traceEvents"]
+    names = {e["name"] for e in events}
+    assert {"alignment.screen_alignment", "groundwater.inflows_per_length"} <= names
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+
+
+def test_cli_profile_flag(tmp_path: Path) -> None:
+    trace = tmp_path / "cli.json"
+    inflow = ["inflow", "--k", "1e-6", "--head", "20", "--r", "3", "--R", "100"]
+    res = CliRunner().invoke(app, ["--profile-trace", str(trace), *inflow])
+    assert res.exit_code == 0, res.output
+    assert "groundwater.inflow_per_length" in res.output
+    assert json.loads(trace.read_text())["traceEvents"]
+    plain = CliRunner().invoke(app, inflow)
+    assert "calls" not in plain.output
+
+
+# Modules with no screening computations of their own (front ends, drivers, storage, helpers).
+_NOT_SCREENING = {
+    "batch", "bench", "cache", "cli", "parallel", "profiling",
+    "reports", "serve", "states", "store", "utils",
+}
+
+
+def test_screening_functions_cover_the_package() -> None:
+    listed = set(SCREENING_FUNCTIONS)
+    modules = {m.name for m in pkgutil.iter_modules(open_gov_tunnel.__path__)}
+    for name in sorted(modules - _NOT_SCREENING):
+        mod = importlib.import_module(f"open_gov_tunnel.{name}")
+        public = {
+            f"{name}:{attr}" for attr, obj in vars(mod).items()
+            if not attr.startswith("_") and inspect.isfunction(obj)
+            and obj.__module__ == mod.__name__ and not inspect.isgeneratorfunction(obj)
+        }
+        assert public <= listed, f"not profiled: {sorted(public - listed)}"
+    assert {spec.partition(":")[0] for spec in listed} == modules - _NOT_SCREENING
+    with Profiler(trace_memory=False) as prof:
+        assert len(prof._patched) >= len(SCREENING_FUNCTIONS)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.groundwater import InflowInputs, inflow_per_length
+from open_gov_tunnel.seepage import SeepageMesh, SeepageSolver
+
+
+@pytest.fixture(scope="module")
+def mesh() -> SeepageMesh:
+    return SeepageMesh(
+        radius_m=3.0, cell_m=0.3, half_width_m=31.0, influence_radius_m=30.0, lining_thickness_m=0.6
+    )
+
+
+def test_homogeneous_case_matches_closed_form(mesh: SeepageMesh) -> None:
+    """With uniform k the finite-difference inflow agrees with inflow_per_length"""
+    res = SeepageSolver(mesh).solve(mesh.k_field(1e-6), head_above_axis_m=10.0)
+    inp = InflowInputs(k_m_per_s=1e-6, head_above_axis_m=10.0, radius_m=3.0, influence_radius_m=30)
+    expected = inflow_per_length(inp).q_per_m3_s
+    assert res.converged
+    assert res.q_per_m3_s == pytest.approx(expected, rel=0.03)
+    assert res.seconds > 0.0
+    assert res.head_m[mesh.tunnel].max() == 0.0
+
+
+def test_warm_start_reuses_previous_section(mesh: SeepageMesh) -> None:
+    """A head change alone is solved from the rescaled previous field without iterating"""
+    solver = SeepageSolver(mesh)
+    first = solver.solve(mesh.k_field(1e-6), 10.0)
+    same_k = solver.solve(mesh.k_field(1e-6), 12.0)
+    assert same_k.iterations < first.iterations // 10
+    assert same_k.q_per_m3_s == pytest.approx(first.q_per_m3_s * 1.2, rel=1e-6)
+    layered = solver.solve(mesh.k_field(1e-6, layers=[(-2.0, 1e-7)]), 12.0)
+    cold = SeepageSolver(mesh).solve(mesh.k_field(1e-6, layers=[(-2.0, 1e-7)]), 12.0)
+    assert layered.q_per_m3_s == pytest.approx(cold.q_per_m3_s, rel=1e-6)
+    assert layered.q_per_m3_s < same_k.q_per_m3_s
+
+
+def test_lining_permeability_acts_as_partial_drainage(mesh: SeepageMesh) -> None:
+    solver = SeepageSolver(mesh)
+    fields = [mesh.k_field(1e-6, k_lining_m_per_s=kl) for kl in (1e-6, 1e-7, 1e-8)]
+    q = [solver.solve(k, 10.0).q_per_m3_s for k in fields]
+    assert q[0] > q[1] > q[2] > 0.0
+
+
+def test_mesh_and_input_validation(mesh: SeepageMesh) -> None:
+    with pytest.raises(ValueError):
+        SeepageMesh(radius_m=3.0, cell_m=0.5, half_width_m=20.0)
+    with pytest.raises(ValueError):
+        SeepageMesh(radius_m=3.0, cell_m=0.5, half_width_m=2.0, influence_radius_m=10.0)
+    with pytest.raises(ValueError):
+        SeepageSolver(mesh).solve(np.zeros(mesh.shape), 10.0)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.sensitivity import (
+    SOBOL_MAX_DIM,
+    SobolInput,
+    inflow_sensitivity,
+    settlement_sensitivity,
+    sobol_indices,
+    sobol_points,
+)
+
+
+def test_sobol_points_are_stratified_and_blockwise() -> None:
+    n = 2**10
+    pts = sobol_points(0, n, SOBOL_MAX_DIM)
+    for j in range(SOBOL_MAX_DIM):
+        assert np.array_equal(np.sort(np.floor(pts[:, j] * n)), np.arange(n))
+    np.testing.assert_array_equal(sobol_points(300, 700, 5), pts[300:700, :5])
+    with pytest.raises(ValueError):
+        sobol_points(0, 10, SOBOL_MAX_DIM + 1)
+
+
+def test_ishigami_indices() -> None:
+    def ishigami(x: dict[str, np.ndarray]) -> np.ndarray:
+        return np.sin(x["a"]) + 7 * np.sin(x["b"]) ** 2 + 0.1 * x["c"] ** 4 * np.sin(x["a"])
+
+    inputs = [SobolInput(n, -np.pi, np.pi) for n in "abc"]
+    res = sobol_indices(ishigami, inputs, n=2**14, block_size=3000, n_bootstrap=100)
+    np.testing.assert_allclose(res.S1, [0.3139, 0.4424, 0.0], atol=0.03)
+    np.testing.assert_allclose(res.ST, [0.5576, 0.4424, 0.2437], atol=0.03)
+    assert np.all(res.S1_ci[:, 0] <= res.S1_ci[:, 1]) and np.all(res.ST_ci[:, 0] <= res.ST_ci[:, 1])
+    assert res.n_evaluations == 2**14 * 5
+    blocked = sobol_indices(ishigami, inputs, n=2**14, block_size=2**14, n_bootstrap=0)
+    np.testing.assert_allclose(blocked.S1, res.S1)
+
+
+def test_screening_models() -> None:
+    st = settlement_sensitivity(n=2**12, n_bootstrap=50)
+    assert st.names == ("volume_loss_frac", "K", "cover_to_axis_m", "radius_m")
+    assert np.argmax(st.ST) == 3          # Smax grows with r**2
+    q = inflow_sensitivity(n=2**12, n_bootstrap=50)
+    assert q.names[int(np.argmax(q.S1))] == "k_m_per_s"
+    assert "model evaluations" in q.summary()
+
+
+def test_invalid_ranges_are_reported() -> None:
+    with pytest.raises(ValueError):
+        inflow_sensitivity(influence_radius_m=(1.0, 10.0), n=256, n_bootstrap=0)
+    with pytest.raises(ValueError):
+        sobol_indices(lambda x: x["a"], [SobolInput(str(i), 0, 1) for i in range(SOBOL_MAX_DIM)])
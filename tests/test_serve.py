@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+import tempfile
+
+import pytest
+from typer.testing import CliRunner
+
+from open_gov_tunnel.classification import RMRInputs, rmr_score
+from open_gov_tunnel.cli import app
+from open_gov_tunnel.groundwater import InflowInputs, inflow_per_length
+from open_gov_tunnel.serve import MicroBatcher, handle_line, serve_unix
+
+
+_INFLOW_ARGS = {
+    "k_m_per_s": 1e-6, "head_above_axis_m": 20, "radius_m": 3, "influence_radius_m": 100,
+}
+
+
+def _rmr_args(i: int) -> dict[str, float]:
+    return {
+        "rqd": 10 + i % 80,
+        "spacing_rating": 8,
+        "condition_rating": 12,
+        "groundwater_rating": 10,
+        "orientation_rating": -5,
+        "strength_rating": 7,
+    }
+
+
+def test_concurrent_requests_share_one_batch() -> None:
+    async def main() -> tuple[list[str], MicroBatcher]:
+        batcher = MicroBatcher(window_s=0.01)
+        lines = [json.dumps({"id": i, "op": "rmr", "args": _rmr_args(i)}) for i in range(200)]
+        lines.append(json.dumps({"id": "q", "op": "inflow", "args": _INFLOW_ARGS}))
+        return await asyncio.gather(*(handle_line(line, batcher) for line in lines)), batcher
+
+    out, batcher = asyncio.run(main())
+    resp = [json.loads(o) for o in out]
+    assert batcher.stats().batches == 2 and batcher.stats().requests == 201
+    for i, r in enumerate(resp[:200]):
+        expected = rmr_score(RMRInputs(**_rmr_args(i)))
+        assert r["id"] == i and r["ok"]
+        assert r["result"] == {"rmr": expected.rmr, "class_label": expected.class_label}
+    q = inflow_per_length(InflowInputs(1e-6, 20, 3, 100)).q_per_m3_s
+    assert resp[200]["result"]["q_per_m3_s"] == pytest.approx(q)
+
+
+def test_errors_are_per_request() -> None:
+    async def main() -> list[str]:
+        batcher = MicroBatcher(window_s=0.005, max_batch=2)
+        good = _INFLOW_ARGS
+        lines = [
+            json.dumps({"id": 1, "op": "inflow", "args": good}),
+            json.dumps({"id": 2, "op": "inflow", "args": {**good, "influence_radius_m": 2}}),
+            json.dumps({"id": 3, "op": "inflow", "args": {**good, "radius_m": "three"}}),
+            json.dumps({"id": 4, "op": "nope", "args": {}}),
+            json.dumps({"id": 5, "op": "rmr", "args": {"rqd": 1}}),
+            "not json",
+        ]
+        return await asyncio.gather(*(handle_line(line, batcher) for line in lines))
+
+    resp = [json.loads(o) for o in asyncio.run(main())]
+    assert [r["ok"] for r in resp] == [True, False, False, False, False, False]
+    assert resp[1]["error"] == "Invalid inputs."
+    assert "radius_m" in resp[2]["error"] and "Unknown op" in resp[3]["error"]
+
+
+@pytest.mark.filterwarnings("ignore:overflow:RuntimeWarning")
+def test_non_finite_results_are_null() -> None:
+    args = {"rqd": 1e308, "Jn": 0.0, "Jr": 1, "Ja": 1, "Jw": 1, "SRF": 1}
+    line = json.dumps({"id": 1, "op": "qsystem", "args": args})
+    out = asyncio.run(handle_line(line, MicroBatcher()))
+    assert "Infinity" not in out and "NaN" not in out
+    assert json.loads(out)["result"]["Q"] is None
+
+
+def test_socket_path_must_not_be_a_regular_file(tmp_path: Path) -> None:
+    target = tmp_path / "results.csv"
+    target.write_text("keep me")
+    with pytest.raises(ValueError, match="not a socket"):
+        asyncio.run(serve_unix(target, MicroBatcher()))
+    assert target.read_text() == "keep me"
+
+
+def test_unix_socket_server() -> None:
+    async def main(path: Path) -> list[dict]:
+        batcher = MicroBatcher()
+        ready = asyncio.Event()
+        server = asyncio.create_task(serve_unix(path, batcher, ready))
+        await ready.wait()
+        reader, writer = await asyncio.open_unix_connection(str(path))
+        for i in range(50):
+            args = {"volume_loss_frac": 0.01, "radius_m": 3, "cover_to_axis_m": 10 + i}
+            writer.write((json.dumps({"id": i, "op": "settlement", "args": args}) + "\n").encode())
+        await writer.drain()
+        writer.write_eof()
+        resp = [json.loads(line) for line in (await reader.read()).decode().splitlines()]
+        writer.close()
+        server.cancel()
+        return resp
+
+    with tempfile.TemporaryDirectory() as d:
+        resp = asyncio.run(main(Path(d) / "s.sock"))
+    assert sorted(r["id"] for r in resp) == list(range(50))
+    assert all(r["ok"] and r["result"]["Smax_m"] > 0 for r in resp)
+
+
+def test_cli_serve_stdio() -> None:
+    args = [{"length_m": 1000 * (i + 1), "diameter_m": 6} for i in range(5)]
+    lines = "\n".join(json.dumps({"id": i, "op": "cost", "args": a}) for i, a in enumerate(args))
+    res = CliRunner().invoke(app, ["serve"], input=lines + "\n")
+    assert res.exit_code == 0, res.output
+    resp = [json.loads(line) for line in res.stdout.splitlines() if line.startswith("{")]
+    assert sorted(r["id"] for r in resp) == list(range(5))
+    assert {r["id"]: r["result"]["tunnel_usd"] for r in resp}[2] == 40_000.0 * 3000
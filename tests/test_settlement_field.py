@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.settlement import SettlementInputs, settlement_at_x, settlement_trough
+from open_gov_tunnel.settlement_field import ReceptorIndex, TunnelAxis, settlement_field
+
+
+def test_twin_bores_match_superposed_troughs() -> None:
+    """Parallel twin bores reproduce the sum of settlement_at_x with zero slope on the centreline"""
+    inp = SettlementInputs(volume_loss_frac=0.01, radius_m=3.0, cover_to_axis_m=20.0, K=0.5)
+    axes = [TunnelAxis(-5.0, -500.0, -5.0, 500.0, inp), TunnelAxis(5.0, -500.0, 5.0, 500.0, inp)]
+    x = np.linspace(-30.0, 30.0, 61)
+    y = np.zeros_like(x)
+    res = settlement_field(x, y, axes, cutoff_i=10.0)
+    tr = settlement_trough(inp)
+    expected = [settlement_at_x(tr, xi + 5.0) + settlement_at_x(tr, xi - 5.0) for xi in x]
+    assert res.settlement_m == pytest.approx(expected, rel=1e-12)
+    assert res.slope[30] == pytest.approx(0.0, abs=1e-15)
+    assert res.strain_min[30] < 0.0
+
+
+def test_index_limits_pairs_to_corridor() -> None:
+    """Only receptors near each axis are evaluated; far receptors stay at zero"""
+    rng = np.random.default_rng(3)
+    x = rng.uniform(0.0, 5000.0, 20_000)
+    y = rng.uniform(0.0, 5000.0, 20_000)
+    inp = SettlementInputs(volume_loss_frac=0.01, radius_m=3.0, cover_to_axis_m=20.0)
+    axes = [
+        TunnelAxis(0.0, 2500.0, 5000.0, 2500.0, inp),
+        TunnelAxis(2500.0, 0.0, 2500.0, 5000.0, inp),
+    ]
+    res = settlement_field(x, y, axes)
+    reach = 4.0 * settlement_trough(inp).i_m
+    near = (np.abs(y - 2500.0) <= reach) | (np.abs(x - 2500.0) <= reach)
+    assert res.pairs_evaluated == int(
+        np.count_nonzero(np.abs(y - 2500.0) <= reach)
+        + np.count_nonzero(np.abs(x - 2500.0) <= reach)
+    )
+    assert res.pairs_evaluated < x.size // 10
+    assert np.all(res.settlement_m[~near] == 0.0)
+    assert np.all(res.settlement_m[near] > 0.0)
+
+
+def test_bend_uses_nearest_segment() -> None:
+    """Around a 90 degree bend each receptor gets one trough, at its distance to the polyline"""
+    inp = SettlementInputs(volume_loss_frac=0.01, radius_m=3.0, cover_to_axis_m=20.0, K=0.5)
+    axes = [TunnelAxis(0.0, 0.0, 200.0, 0.0, inp), TunnelAxis(200.0, 0.0, 200.0, 200.0, inp)]
+    gx, gy = np.meshgrid(np.linspace(100.0, 260.0, 81), np.linspace(-60.0, 100.0, 81))
+    x, y = gx.ravel(), gy.ravel()
+    res = settlement_field(x, y, axes)
+    tr = settlement_trough(inp)
+    d = np.minimum(
+        np.hypot(x - np.clip(x, 0.0, 200.0), y), np.hypot(x - 200.0, y - np.clip(y, 0.0, 200.0))
+    )
+    expected = np.where(d <= 4.0 * tr.i_m, tr.Smax_m * np.exp(-(d ** 2) / (2.0 * tr.i_m ** 2)), 0.0)
+    assert res.settlement_m == pytest.approx(expected, rel=1e-12, abs=1e-15)
+    outside = (x > 200.0) & (y < 0.0) & (d < tr.i_m)
+    assert outside.any() and np.all(res.settlement_m[outside] > 0.0)  # previously left at zero
+    assert res.settlement_m.max() <= tr.Smax_m * (1.0 + 1e-12)  # inside of the bend not doubled
+
+
+def test_receptor_index_validation() -> None:
+    with pytest.raises(ValueError):
+        ReceptorIndex([0.0], [0.0], cell_size_m=0.0)
+    with pytest.raises(ValueError):
+        ReceptorIndex([0.0, 1.0], [0.0], cell_size_m=1.0)
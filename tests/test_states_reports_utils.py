@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import math
+
+import numpy as np
 from pathlib import Path
 from open_gov_tunnel.states import list_states, get_state
 from open_gov_tunnel.reports import write_templates
-from open_gov_tunnel.utils import g, gamma_w_kN_m3
+from open_gov_tunnel.utils import erfc, g, gamma_w_kN_m3, norm_cdf
 
 
 def test_list_states_returns_three() -> None:
@@ -97,3 +100,13 @@ def test_utils_constants() -> None:
     assert gamma_w_kN_m3 > 0
     assert abs(g - 9.80665) < 0.001
     assert abs(gamma_w_kN_m3 - 9.81) < 0.01
+
+
+def test_norm_cdf_matches_math_erf() -> None:
+    """Test that the vectorised CDF is float64 and matches math.erf to round-off"""
+    z = np.linspace(-8.0, 8.0, 2001).reshape(23, 87)
+    cdf = norm_cdf(z)
+    ref = np.array([0.5 * math.erfc(-v / math.sqrt(2.0)) for v in z.ravel()]).reshape(z.shape)
+    assert cdf.dtype == np.float64 and cdf.shape == z.shape
+    assert np.allclose(cdf, ref, rtol=1e-12, atol=0.0)
+    assert np.isnan(erfc(np.array([np.nan])))[0]
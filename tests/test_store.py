@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.alignment import Alignment, screen_alignment
+from open_gov_tunnel.store import ResultStore, ResultStoreWriter, write_results
+
+
+def _chunk(lo: int, n: int) -> dict[str, np.ndarray]:
+    ch = (np.arange(n) + lo) * 10.0
+    return {
+        "chainage_m": ch,
+        "support_class": (np.arange(n) % 5 + 1).astype(np.int8),
+        "machine": np.where(np.arange(n) % 2 == 0, "Open TBM", "EPB TBM"),
+        "settlement_grid_m": np.outer(ch, np.ones(7)),
+        "valid": np.arange(n) % 3 != 0,
+    }
+
+
+def test_chunked_write_and_memmap_read(tmp_path: Path) -> None:
+    with ResultStoreWriter(tmp_path / "run", meta={"study": "corridor A"}) as w:
+        for lo in range(0, 1000, 300):
+            w.append(_chunk(lo, min(300, 1000 - lo)))
+    store = ResultStore(tmp_path / "run")
+    assert len(store) == 1000 and store.meta == {"study": "corridor A"}
+    sup = store.column("support_class")
+    assert isinstance(sup, np.memmap) and sup.dtype == np.int8 and not sup.flags.writeable
+    full = _chunk(0, 1000)
+    for name in full:
+        np.testing.assert_array_equal(store.column(name), full[name])
+    part = store.chainage_range(2500.0, 2600.0, columns=["chainage_m", "settlement_grid_m"])
+    np.testing.assert_array_equal(part["chainage_m"], np.arange(250, 260) * 10.0)
+    assert part["settlement_grid_m"].shape == (10, 7)
+    assert store.rows(0, 2, ["machine"])["machine"].tolist() == ["Open TBM", "EPB TBM"]
+
+
+def test_schema_is_enforced(tmp_path: Path) -> None:
+    with ResultStoreWriter(tmp_path / "s") as w:
+        w.append(_chunk(0, 5))
+        with pytest.raises(ValueError):
+            w.append({"chainage_m": np.arange(3.0)})
+        bad = _chunk(5, 5)
+        bad["settlement_grid_m"] = np.zeros((5, 3))
+        with pytest.raises(ValueError):
+            w.append(bad)
+    with pytest.raises(ValueError):
+        ResultStoreWriter(tmp_path / "s")
+    with pytest.raises(ValueError):
+        ResultStoreWriter(tmp_path / "o").append({"chainage_m": np.array([None, 1.0])})
+
+
+def test_bad_first_chunk_does_not_fix_the_schema(tmp_path: Path) -> None:
+    schema = {
+        "chainage_m": np.float64,
+        "support_class": np.int8,
+        "machine": "U16",
+        "settlement_grid_m": np.float64,
+        "valid": bool,
+    }
+    w = ResultStoreWriter(tmp_path / "v", schema=schema)
+    wrong_dtype = _chunk(0, 5) | {"support_class": np.full(5, "III")}
+    missing = {k: v for k, v in _chunk(0, 5).items() if k != "valid"}
+    late_object = _chunk(0, 5) | {"valid": np.array([None] * 5)}
+    for bad in (wrong_dtype, missing, late_object):
+        with pytest.raises(ValueError):
+            w.append(bad)
+        assert not list((tmp_path / "v").iterdir())
+    w.append(_chunk(0, 5) | {"support_class": np.arange(5, dtype=np.int8)})
+    w.close()
+    store = ResultStore(tmp_path / "v")
+    assert store.column("support_class").dtype == np.int8
+    assert store.column("machine").dtype == np.dtype("<U64")
+    ints = ResultStoreWriter(tmp_path / "f", schema={"chainage_m": np.int32})
+    with pytest.raises(ValueError, match="schema expects"):
+        ints.append({"chainage_m": np.arange(3.0)})
+
+
+def test_bad_later_chunk_is_rejected(tmp_path: Path) -> None:
+    with ResultStoreWriter(tmp_path / "l") as w:
+        w.append(_chunk(0, 5))
+        bad = (
+            ("support_class", np.full(5, 3.7)),
+            ("support_class", np.full(5, "III")),
+            ("machine", np.arange(5)),
+        )
+        for column, values in bad:
+            with pytest.raises(ValueError, match="schema expects"):
+                w.append(_chunk(5, 5) | {column: values})
+        w.append(_chunk(5, 5) | {"support_class": np.arange(5, dtype=np.int64)})
+    store = ResultStore(tmp_path / "l")
+    assert len(store) == 10 and list(store.column("support_class")[5:]) == [0, 1, 2, 3, 4]
+
+
+def test_unsorted_index_disables_range_reads(tmp_path: Path) -> None:
+    cols = {"chainage_m": np.array([0.0, 20.0, 10.0]), "x": np.arange(3)}
+    store = write_results(tmp_path / "u", cols)
+    assert not store.index_sorted
+    with pytest.raises(ValueError):
+        store.chainage_range(0.0, 10.0)
+
+
+def test_screen_alignment_round_trip(tmp_path: Path) -> None:
+    n = 200
+    al = Alignment(
+        chainage_m=np.arange(n) * 5.0, length_m=np.full(n, 5.0), cover_to_axis_m=np.full(n, 20.0),
+        diameter_m=np.full(n, 6.0), k_m_per_s=np.full(n, 1e-6), head_above_axis_m=np.full(n, 15.0),
+        influence_radius_m=np.full(n, 100.0),
+    )
+    out = screen_alignment(al)
+    store = write_results(tmp_path / "al", out)
+    assert set(store.columns) == set(out)
+    for k, v in out.items():
+        np.testing.assert_array_equal(store.column(k), v)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.support import (
+    NATM_SUPPORT_CLASSES,
+    natm_support_classes,
+    natm_support_from_rmr,
+    natm_support_takeoff,
+)
+
+
+def test_support_classes_match_scalar() -> None:
+    """The lookup table reproduces the scalar if-chain, boundaries included"""
+    rmr = np.array([100.0, 80.0, 79.9, 60.0, 45.0, 40.0, 20.0, 19.9, 0.0])
+    for code, value in zip(natm_support_classes(rmr), rmr):
+        assert NATM_SUPPORT_CLASSES[code] == natm_support_from_rmr(float(value), 6.0)
+
+
+def test_takeoff_quantities() -> None:
+    """Quantities follow diameter, length and round spacing"""
+    t = natm_support_takeoff(
+        [85.0, 30.0], diameter_m=[6.0, 10.0], length_m=[100.0, 12.0], round_length_m=1.5
+    )
+    assert t.shotcrete_m3[0] == pytest.approx(math.pi * 6.0 * 100.0 * 0.05)
+    assert t.bolt_count[0] == math.ceil(100.0 / 2.5) * math.ceil(math.pi * 6.0 / 2.5)
+    assert t.bolt_m[1] == pytest.approx(t.bolt_count[1] * 4.0)
+    assert list(t.girder_count) == [0, 8]
+    totals = t.totals_by_class()
+    assert totals["segments"][0] == 1 and totals["segments"][3] == 1
+    assert totals["shotcrete_m3"].sum() == pytest.approx(t.shotcrete_m3.sum())
+
+
+def test_takeoff_rejects_bad_round_length() -> None:
+    with pytest.raises(ValueError):
+        natm_support_takeoff([50.0], 6.0, 10.0, round_length_m=0.0)
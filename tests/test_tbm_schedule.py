@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel.tbm_schedule import (
+    ScheduleParams,
+    TBMProduction,
+    simulate_tbm_schedule,
+    tbm_runs,
+)
+
+
+def test_runs_encode_consecutive_classes() -> None:
+    runs = tbm_runs(
+        np.arange(6) * 10.0, 10.0,
+        ["rock", "Rock", "soft", "soft", "soft", "rock"],
+        ["dry", "dry", "high", "high", "wet", "dry"],
+    )
+    assert len(runs) == 4
+    np.testing.assert_allclose(runs.start_m, [0, 20, 40, 50])
+    np.testing.assert_allclose(runs.end_m, [20, 40, 50, 60])
+    assert list(runs.machine) == ["Open TBM", "Slurry TBM", "EPB TBM", "Open TBM"]
+
+
+def test_deterministic_schedule_matches_hand_calculation() -> None:
+    runs = tbm_runs(np.arange(2000) * 5.0, 5.0, "rock", "dry")
+    prod = {"Open TBM": TBMProduction(3.0, 1.8, 0.3, 300.0, 6.0, 0.0, 3.0)}
+    params = ScheduleParams(rate_sigma_ln=0.0, production=prod)
+    s = simulate_tbm_schedule(runs, replicates=4, params=params, start_date=date(2027, 1, 1))
+    expected = (10_000 / 3.0 + 10_000 * 0.3 / 1.8 + 33 * 6.0) / 20.0
+    np.testing.assert_allclose(s.completion_days, expected)
+    assert np.all(s.cutter_changes == 33)
+    assert s.completion_dates([0.5]) == [date(2027, 9, 18)]
+
+
+def test_stoppages_delay_completion_and_are_reproducible() -> None:
+    ground, boulders = np.repeat(["rock", "mixed"], 200), np.repeat([False, True], 200)
+    runs = tbm_runs(np.arange(400) * 5.0, 5.0, ground, "wet", boulders)
+    a = simulate_tbm_schedule(runs, replicates=300, seed=4)
+    b = simulate_tbm_schedule(runs, replicates=300, seed=4)
+    with pytest.raises(ValueError, match="start_date"):
+        a.completion_dates()
+    no_stops = {
+        m: replace(p, stoppages_per_day=0.0, stoppage_mean_h=1.0)
+        for m, p in ScheduleParams().production.items()
+    }
+    calm = simulate_tbm_schedule(
+        runs, replicates=300, seed=4, params=ScheduleParams(production=no_stops)
+    )
+    np.testing.assert_array_equal(a.completion_days, b.completion_days)
+    assert np.all(np.isfinite(a.completion_days))
+    assert a.quantile(0.5) > calm.quantile(0.5)
+    assert a.quantile(0.9) > a.quantile(0.1)
+    assert np.all(a.stoppage_h > 0)
+
+
+def test_unknown_machine_is_rejected() -> None:
+    runs = tbm_runs([0.0], 10.0, "rock", "dry")
+    with pytest.raises(ValueError):
+        simulate_tbm_schedule(runs, params=ScheduleParams(production={}))
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from open_gov_tunnel import vent_network as vn
+from open_gov_tunnel.linalg import CGResult, pcg
+from open_gov_tunnel.ventilation import VentInputs, construction_vent_airflow
+from open_gov_tunnel.vent_network import VentNetwork, check_headings, solve_network
+
+
+def _two_headings() -> VentNetwork:
+    # 0 = portal; fan duct 0->1 splits to headings 1->2 and 1->3,
+    # air returns along the drives 2->0, 3->0.
+    return VentNetwork.build(
+        4,
+        [0, 1, 1, 2, 3],
+        [1, 2, 3, 0, 0],
+        [0.5, 2.0, 4.0, 0.1, 0.1],
+        fixed_nodes=[0],
+        fans={0: (2000.0, 0.0, -5.0)},
+    )
+
+
+def test_solution_satisfies_continuity_and_square_law() -> None:
+    net = _two_headings()
+    sol = solve_network(net)
+    assert sol.converged
+    Q, P = sol.flow_m3_s, sol.pressure_Pa
+    balance = np.bincount(net.from_node, Q, 4) - np.bincount(net.to_node, Q, 4)
+    assert np.abs(balance[1:]).max() < 1e-9
+    fan = net.fan_a0 + net.fan_a1 * Q + net.fan_a2 * Q ** 2
+    loss = net.resistance * Q * np.abs(Q)
+    assert P[net.from_node] - P[net.to_node] == pytest.approx(loss - fan, abs=1e-6)
+    assert Q[1] > Q[2] > 0.0
+
+
+def test_warm_start_after_fan_change() -> None:
+    """Restarting from the previous solution converges in fewer iterations to the same answer"""
+    net = _two_headings()
+    base = solve_network(net)
+    upgraded = net.with_fans({0: (2500.0, 0.0, -5.0)})
+    warm = solve_network(upgraded, initial=base)
+    cold = solve_network(upgraded)
+    assert warm.iterations < cold.iterations
+    assert warm.flow_m3_s == pytest.approx(cold.flow_m3_s, rel=1e-6)
+    assert warm.flow_m3_s[0] > base.flow_m3_s[0]
+
+
+def test_heading_checks_use_construction_demand() -> None:
+    sol = solve_network(_two_headings())
+    demand = {
+        1: VentInputs(diesel_kW=100.0, persons=10),
+        2: VentInputs(diesel_kW=200.0, persons=10),
+    }
+    chk = check_headings(sol, demand)
+    assert chk.required_m3_s[1] == construction_vent_airflow(demand[2]).airflow_m3_s
+    assert list(chk.ok) == [True, False]
+
+
+def test_pcg_and_validation() -> None:
+    A = np.array([[4.0, 1.0], [1.0, 3.0]])
+    res = pcg(lambda x: A @ x, np.array([1.0, 2.0]), diag=np.diag(A))
+    assert res.converged and res.x == pytest.approx(np.linalg.solve(A, [1.0, 2.0]))
+    with pytest.raises(ValueError):
+        VentNetwork.build(2, [0], [1], [0.0], fixed_nodes=[0])
+    with pytest.raises(ValueError):
+        VentNetwork.build(2, [0], [2], [1.0], fixed_nodes=[0])
+    with pytest.raises(ValueError):
+        VentNetwork.build(2, [0], [1], [1.0], fixed_nodes=[])
+
+
+def test_unconverged_pressure_solve_is_reported(monkeypatch: pytest.MonkeyPatch) -> None:
+    def stalled(matvec: object, b: np.ndarray, **kwargs: object) -> CGResult:
+        return CGResult(x=np.zeros_like(b), iterations=0, residual=1.0, converged=False)
+
+    monkeypatch.setattr(vn, "pcg", stalled)
+    sol = solve_network(_two_headings())
+    assert not sol.converged and sol.iterations == 1